@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+import pathlib
+
+BENCHMARKS_ROOT = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_ROOT.parent
+SRC_ASSETS: pathlib.Path = PROJECT_ROOT / "src/jira_assistant/assets"
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how the allowed values of a Jira field are parsed from a createmeta
+payload and how fast the cell values are validated against them.
+
+Usage: python -m benchmarks.bench_allowed_values --allowed-values 5000 --cells 10000
+"""
+import random
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+
+from jira_assistant.jira_client import JiraClient, JiraField
+
+from .utils import measure
+
+
+def generate_field_type(allowed_value_count: int) -> Dict[str, Any]:
+    """A createmeta field like the components which has many allowed values."""
+    return {
+        "required": True,
+        "schema": {"type": "array", "items": "component", "system": "components"},
+        "name": "Component/s",
+        "fieldId": "components",
+        "hasDefaultValue": False,
+        "operations": ["add", "set", "remove"],
+        "allowedValues": [
+            {
+                "self": f"https://your_jira.com/rest/api/2/component/{index}",
+                "id": str(index),
+                "name": f"Component {index}",
+                "description": f"Description {index}",
+            }
+            for index in range(allowed_value_count)
+        ],
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the allowed values of JiraField")
+    parser.add_argument("--allowed-values", type=int, default=5000)
+    parser.add_argument("--cells", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    field_type = generate_field_type(args.allowed_values)
+    convert = (
+        JiraClient._JiraClient__convert_field_type_to_jira_field  # type: ignore[attr-defined] # pylint: disable=protected-access,no-member
+    )
+    elapsed, jira_field = measure(lambda: convert(field_type), args.repeat)
+    print(
+        f"allowed values: {args.allowed_values:>8} | "
+        f"parse createmeta: {elapsed * 1000:10.3f}ms"
+    )
+
+    rand = random.Random(0)
+    # A quarter of the cells have values which are not allowed.
+    cells: List[str] = [
+        f"Component {rand.randint(0, args.allowed_values * 4 // 3)}"
+        for _ in range(args.cells)
+    ]
+
+    def validate(field: JiraField) -> int:
+        return sum(
+            1 for cell in cells if field.is_value_allowed(cell, "component.name")
+        )
+
+    elapsed, allowed_count = measure(lambda: validate(jira_field), args.repeat)
+    print(
+        f"cells: {args.cells:>8} | allowed: {allowed_count:>8} | "
+        f"validate: {elapsed * 1000:10.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Run ``run_steps_and_sort_excel_file`` end to end on synthetic backlogs which
+are generated from the default excel definition. The Jira requests are served
+by the mock Jira server with the injected latency and failures.
+
+Every backlog is processed in a new process, so the peak RSS belongs to that
+run only. The wall time of each phase and the count of the Jira requests come
+from the profiler.
+
+Usage: python -m benchmarks.bench_end_to_end --rows 1000 10000 100000
+       python -m benchmarks.bench_end_to_end --latency 0.1 --failure-rate 0.05
+       python -m benchmarks.bench_end_to_end --rows 100000 --streaming
+"""
+import random
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Optional
+from unittest.mock import patch
+
+from requests import Session
+
+from jira_assistant.assistant import run_steps_and_sort_excel_file
+from jira_assistant.profiler import Profiler
+from tests.mock_server import mock_jira_stories
+
+from .utils import (
+    DEFAULT_EXCEL_DEFINITION_FILE,
+    DEFAULT_SPRINT_SCHEDULE_FILE,
+    generate_excel_file,
+    load_excel_definition,
+    mock_jira_requests_with_latency,
+)
+
+_PHASES = ["ReadExcelFile", "PreProcessSteps", "SortStrategies", "WriteExcelFile"]
+_STATUSES = ["PENDING", "IN PROGRESS", "CLOSED", "SPRINT COMPLETE"]
+_DOMAINS = ["A", "B", "C", "D"]
+
+
+def _mock_synthetic_stories(row_count: int, seed: int = 0):
+    # The story ids of the synthetic backlog are A-1, A-2 and so on.
+    rand = random.Random(seed)
+    for row_index in range(row_count):
+        mock_jira_stories[f"a-{row_index + 1}"] = {
+            "status": rand.choice(_STATUSES),
+            "domain": rand.choice(_DOMAINS),
+        }
+
+
+def _get_peak_rss() -> Optional[float]:
+    """The peak resident set size of the current process in MiB."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from resource import RUSAGE_SELF, getrusage
+    except ImportError:
+        # Not available on Windows.
+        return None
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, otherwise KiB.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_backlog(
+    input_file: Path,
+    row_count: int,
+    latency: float,
+    failure_rate: float,
+    max_workers: int,
+    streaming: bool = False,
+) -> Dict[str, Any]:
+    """Process the backlog once. It is executed in a new process."""
+    folder = input_file.parent
+    env_file = folder / f"{input_file.stem}.env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "JIRA_URL=http://localhost",
+                "JIRA_ACCESS_TOKEN=123",
+                f"JIRA_MAX_WORKERS={max_workers}",
+                f"JIRA_CACHE_FOLDER={folder / 'cache'}",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    _mock_synthetic_stories(row_count)
+    adapter = mock_jira_requests_with_latency(latency, failure_rate=failure_rate)
+
+    profiler = Profiler()
+    # The Mocker sends all requests under a global lock, so the adapter is
+    # returned for every session directly to let the requests overlap.
+    with patch.object(
+        Session, "get_adapter", lambda _, url: adapter
+    ), redirect_stdout(StringIO()):
+        run_steps_and_sort_excel_file(
+            input_file,
+            folder / f"{input_file.stem}_sorted.xlsx",
+            excel_definition_file=DEFAULT_EXCEL_DEFINITION_FILE,
+            sprint_schedule_file=DEFAULT_SPRINT_SCHEDULE_FILE,
+            env_file=env_file,
+            profiler=profiler,
+            streaming=streaming,
+        )
+
+    requests = profiler.requests
+    return {
+        "phases": {
+            section["name"]: section["duration"]
+            for section in profiler.sections
+            if section["category"] == "phase"
+        },
+        "peak_rss": _get_peak_rss(),
+        "requests": len(requests),
+        "failed": sum(1 for request in requests if request["outcome"] != "200"),
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark run_steps_and_sort_excel_file")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--streaming", action="store_true")
+    args = parser.parse_args()
+
+    excel_definition = load_excel_definition()
+
+    with TemporaryDirectory() as folder:
+        for row_count in args.rows:
+            input_file = Path(folder) / f"backlog_{row_count}.xlsx"
+            generate_excel_file(input_file, row_count, excel_definition)
+
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+                result = executor.submit(
+                    run_backlog,
+                    input_file,
+                    row_count,
+                    args.latency,
+                    args.failure_rate,
+                    args.workers,
+                    args.streaming,
+                ).result()
+
+            phases = " | ".join(
+                f"{phase}: {result['phases'].get(phase, 0.0):8.3f}s"
+                for phase in _PHASES
+            )
+            peak_rss = (
+                "n/a" if result["peak_rss"] is None else f"{result['peak_rss']:.1f}"
+            )
+            print(
+                f"rows: {row_count:>7} | {phases} | "
+                f"total: {sum(result['phases'].values()):8.3f}s | "
+                f"peak RSS: {peak_rss:>8}MiB | requests: {result['requests']:>6} | "
+                f"failed: {result['failed']:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the lookups of the ``ExcelDefinition``, which copy the columns, the
+steps and the strategies on every call, with the lookups of the compiled
+definition, which are served from the indexes built by ``validate``.
+
+Usage: python -m benchmarks.bench_excel_definition --lookups 10000
+"""
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict
+
+from jira_assistant.excel_definition import ExcelDefinition
+
+from .utils import load_excel_definition, measure
+
+
+def _lookups(definition: Any, lookup_count: int) -> int:
+    found = 0
+    names = definition.get_columns_name(standardized=False)
+    for index in range(lookup_count):
+        found += len(definition.get_column_by_jira_field_mapping_name("status"))
+        found += len(definition.get_pre_process_steps())
+        found += len(definition.get_sort_strategies())
+        found += definition.get_pre_process_step_by_name(
+            "RetrieveJiraInformation"
+        ) is not None
+        found += names[index % len(names)] in definition.get_columns_name()
+    return found
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the excel definition lookups")
+    parser.add_argument("--lookups", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    excel_definition: ExcelDefinition = load_excel_definition()
+    candidates: Dict[str, Callable[[], int]] = {
+        "definition": lambda: _lookups(excel_definition, args.lookups),
+        "compiled": lambda: _lookups(excel_definition.compiled, args.lookups),
+    }
+    for name, func in candidates.items():
+        elapsed, found = measure(func, args.repeat)
+        print(
+            f"{name:<10} | lookups: {args.lookups:>8} | found: {found:>8} | "
+            f"time: {elapsed * 1000:10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
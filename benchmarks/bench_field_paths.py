@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how fast the property paths of the Jira fields are resolved, like
+``JiraClient.get_all_fields`` does for every field of a Jira website which
+has many custom fields.
+
+Usage: python -m benchmarks.bench_field_paths --fields 4000
+"""
+import random
+from argparse import ArgumentParser
+from json import loads
+
+from jira_assistant.jira_client import (
+    DEFAULT_JIRA_FIELD_TYPE_FILE,
+    get_field_paths_of_jira_field,
+)
+
+from .utils import measure
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark get_field_paths_of_jira_field")
+    parser.add_argument("--fields", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    field_types = [
+        field_type["type"]
+        for field_type in loads(DEFAULT_JIRA_FIELD_TYPE_FILE.read_text("utf-8"))
+    ]
+    rand = random.Random(0)
+    fields = [
+        (rand.choice(field_types), f"customfield_{10000 + index}")
+        for index in range(args.fields)
+    ]
+
+    elapsed, path_count = measure(
+        lambda: sum(
+            len(get_field_paths_of_jira_field(field_type, property_name) or [])
+            for field_type, property_name in fields
+        ),
+        args.repeat,
+    )
+    print(
+        f"fields: {args.fields:>8} | paths: {path_count:>8} | "
+        f"time: {elapsed * 1000:10.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Measure ``JiraClient.get_stories_detail`` against the mock Jira server with
+injected latency for different numbers of workers.
+
+Usage: python -m benchmarks.bench_get_stories_detail --stories 10000 --latency 0.2
+       python -m benchmarks.bench_get_stories_detail --search-page-size-limit 50
+"""
+from argparse import ArgumentParser
+from functools import partial
+from itertools import cycle, islice
+
+from requests_mock import Mocker
+
+from jira_assistant.jira_client import JiraClient
+from tests.mock_server import mock_jira_requests, mock_jira_stories
+
+from .utils import measure, mock_jira_requests_with_latency
+
+_JIRA_FIELDS = [
+    {
+        "name": "domain",
+        "jira_name": "customfield_15601",
+        "jira_path": "customfield_15601.value",
+    },
+    {
+        "name": "status",
+        "jira_name": "status",
+        "jira_path": "status.name",
+    },
+]
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark get_stories_detail")
+    parser.add_argument("--stories", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--requests-per-second", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--search-page-size-limit", type=int, default=None)
+    args = parser.parse_args()
+
+    # The mock server only knows a few stories, so the ids are repeated.
+    story_ids = list(islice(cycle(mock_jira_stories.keys()), args.stories))
+
+    expected = None
+    for max_workers in args.workers:
+        with Mocker(
+            real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+        ):
+            client = JiraClient(
+                "http://localhost",
+                "123",
+                max_workers=max_workers,
+                requests_per_second=args.requests_per_second,
+            )
+        # The Mocker sends all requests under a global lock, so the adapter is
+        # mounted to the session directly to let the requests overlap.
+        client.jira._session.mount(  # pylint: disable=protected-access
+            "http://localhost",
+            mock_jira_requests_with_latency(
+                args.latency, args.search_page_size_limit
+            ),
+        )
+
+        elapsed, result = measure(
+            partial(client.get_stories_detail, story_ids, _JIRA_FIELDS),
+            args.repeat,
+        )
+        if expected is None:
+            expected = result
+        assert result == expected
+        print(
+            f"stories: {args.stories:>8} | latency: {args.latency:.3f}s | "
+            f"workers: {max_workers:>3} | time: {elapsed:8.3f}s | "
+            f"retrieved: {len(result):>5}"
+        )
+
+if __name__ == "__main__":
+    main()
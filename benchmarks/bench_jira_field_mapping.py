@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how long ``generate_jira_field_mapping_file`` takes and how much
+memory it allocates at peak for a Jira website which has many custom fields.
+
+Usage: python -m benchmarks.bench_jira_field_mapping --fields 4000
+"""
+import gc
+import random
+import tracemalloc
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from functools import partial
+from io import StringIO
+from json import loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from requests import Session
+from requests_mock import Adapter
+
+from jira_assistant.assistant import generate_jira_field_mapping_file
+from jira_assistant.jira_client import DEFAULT_JIRA_FIELD_TYPE_FILE
+from tests.mock_server import mock_jira_requests
+
+from .utils import measure
+
+
+def build_fields(field_count: int) -> List[Dict[str, Any]]:
+    field_types = [
+        field_type["type"]
+        for field_type in loads(DEFAULT_JIRA_FIELD_TYPE_FILE.read_text("utf-8"))
+    ]
+    rand = random.Random(0)
+    fields: List[Dict[str, Any]] = []
+    for index in range(field_count):
+        field_type = rand.choice(field_types)
+        schema: Dict[str, Any] = {"type": field_type, "customId": 10000 + index}
+        if rand.random() < 0.2:
+            schema = {"type": "array", "items": field_type}
+        fields.append(
+            {
+                "id": f"customfield_{10000 + index}",
+                "name": f"Custom Field {index}",
+                "custom": True,
+                "schema": schema,
+            }
+        )
+    return fields
+
+
+def _generate(adapter: Adapter, output_file: Path, env_file: Path, compact: bool):
+    # The Jira client is created inside, so the adapter is returned for every
+    # session.
+    with patch.object(
+        Session, "get_adapter", lambda _, url: adapter
+    ), redirect_stdout(StringIO()):
+        assert generate_jira_field_mapping_file(
+            output_file, env_file=env_file, compact=compact
+        )
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark generate_jira_field_mapping_file")
+    parser.add_argument("--fields", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    adapter = mock_jira_requests()
+    adapter.register_uri("GET", "/rest/api/2/field", json=build_fields(args.fields))
+
+    with TemporaryDirectory() as folder:
+        env_file = Path(folder) / ".env"
+        env_file.write_text(
+            f"JIRA_URL=http://localhost\nJIRA_ACCESS_TOKEN=123\n"
+            f"JIRA_CACHE_FOLDER={Path(folder) / 'cache'}",
+            encoding="utf-8",
+        )
+        for compact in (False, True):
+            output_file = Path(folder) / f"jira_field_mapping_{compact}.json"
+
+            generate = partial(_generate, adapter, output_file, env_file, compact)
+            elapsed, _ = measure(generate, args.repeat)
+
+            # Tracing the memory slows down the run, so it is measured alone.
+            gc.collect()
+            tracemalloc.start()
+            generate()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"fields: {args.fields:>6} | compact: {str(compact):>5} | "
+                f"time: {elapsed * 1000:9.2f}ms | peak memory: {peak / 2**20:7.2f}MiB"
+                f" | file: {output_file.stat().st_size / 2**20:6.2f}MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Compare the wall time and the peak Python memory of ``output_to_excel_file``
+between the default worksheet and the streaming (write-only) worksheet.
+
+Usage: python -m benchmarks.bench_output_to_excel_file --rows 1000 10000
+"""
+import tracemalloc
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from jira_assistant.excel_operation import output_to_excel_file, read_excel_file
+from jira_assistant.sprint_schedule import SprintScheduleStore
+
+from .utils import (
+    DEFAULT_SPRINT_SCHEDULE_FILE,
+    generate_excel_file,
+    load_excel_definition,
+)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark output_to_excel_file")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    args = parser.parse_args()
+
+    excel_definition = load_excel_definition()
+    sprint_schedule = SprintScheduleStore()
+    sprint_schedule.load_file(DEFAULT_SPRINT_SCHEDULE_FILE)
+
+    with TemporaryDirectory() as folder:
+        for row_count in args.rows:
+            input_file = Path(folder) / f"backlog_{row_count}.xlsx"
+            generate_excel_file(input_file, row_count, excel_definition)
+            columns, stories = read_excel_file(
+                input_file, excel_definition, sprint_schedule
+            )
+
+            for streaming in (False, True):
+                output_file = Path(folder) / f"output_{row_count}_{streaming}.xlsx"
+
+                tracemalloc.start()
+                start = perf_counter()
+                output_to_excel_file(
+                    output_file, stories, columns, streaming=streaming
+                )
+                elapsed = perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                print(
+                    f"rows: {row_count:>8} | streaming: {str(streaming):>5} | "
+                    f"time: {elapsed:8.3f}s | peak memory: {peak / 2**20:10.1f}MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how many rows per second ``read_excel_file`` can decode.
+
+Usage: python -m benchmarks.bench_read_excel_file --rows 1000 10000
+"""
+from argparse import ArgumentParser
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from jira_assistant.excel_operation import read_excel_file
+from jira_assistant.sprint_schedule import SprintScheduleStore
+
+from .utils import (
+    DEFAULT_SPRINT_SCHEDULE_FILE,
+    generate_excel_file,
+    load_excel_definition,
+    measure,
+)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark read_excel_file")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    excel_definition = load_excel_definition()
+    sprint_schedule = SprintScheduleStore()
+    sprint_schedule.load_file(DEFAULT_SPRINT_SCHEDULE_FILE)
+
+    with TemporaryDirectory() as folder:
+        for row_count in args.rows:
+            file = Path(folder) / f"backlog_{row_count}.xlsx"
+            generate_excel_file(file, row_count, excel_definition)
+
+            elapsed, (_, stories) = measure(
+                partial(read_excel_file, file, excel_definition, sprint_schedule),
+                args.repeat,
+            )
+            assert len(stories) == row_count
+            print(
+                f"rows: {row_count:>8} | time: {elapsed:8.3f}s | "
+                f"rows/second: {row_count / elapsed:12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
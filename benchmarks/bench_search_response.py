@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how long ``JiraClient.get_stories_detail`` takes to handle the search
+responses and how much memory it allocates at peak. Every issue of the
+response contains many custom fields.
+
+Usage: python -m benchmarks.bench_search_response --issues 200 --custom-fields 300
+"""
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from functools import partial
+from json import dumps
+from typing import Any, Dict, List
+
+from requests_mock import Mocker
+
+from jira_assistant.jira_client import JiraClient
+from tests.mock_server import mock_jira_requests
+
+from .utils import measure
+
+
+def build_search_response(issue_count: int, custom_field_count: int) -> str:
+    issues: List[Dict[str, Any]] = []
+    for issue_index in range(issue_count):
+        fields: Dict[str, Any] = {
+            "status": {"id": "1", "name": "Open", "description": "Open" * 20},
+            "summary": f"Story {issue_index} " * 10,
+        }
+        for field_index in range(custom_field_count):
+            fields[f"customfield_{10000 + field_index}"] = {
+                "self": f"http://localhost/rest/api/2/customFieldOption/{field_index}",
+                "id": str(field_index),
+                "value": f"Value {issue_index}-{field_index}",
+                "child": {"id": str(field_index), "value": "Child"},
+            }
+        issues.append(
+            {"id": str(issue_index), "key": f"A-{issue_index}", "fields": fields}
+        )
+    return dumps(
+        {
+            "expand": "names,schema",
+            "startAt": 0,
+            "maxResults": issue_count,
+            "total": issue_count,
+            "issues": issues,
+        }
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark handling the search responses")
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--custom-fields", type=int, default=300)
+    parser.add_argument("--queried-fields", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response_text = build_search_response(args.issues, args.custom_fields)
+    jira_fields = [
+        {"name": "status", "jira_name": "status", "jira_path": "status.name"}
+    ]
+    jira_fields.extend(
+        {
+            "name": f"field{field_index}",
+            "jira_name": f"customfield_{10000 + field_index}",
+            "jira_path": f"customfield_{10000 + field_index}.child.value",
+        }
+        for field_index in range(args.queried_fields - 1)
+    )
+    story_ids = [f"A-{issue_index}" for issue_index in range(args.issues)]
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        client = JiraClient("http://localhost", "123", max_workers=1)
+    # The other requests, for example, the fields, are still served by the
+    # mock server.
+    search_adapter = mock_jira_requests()
+    search_adapter.register_uri("GET", "/rest/api/2/search", text=response_text)
+    client.jira._session.mount(  # pylint: disable=protected-access
+        "http://localhost", search_adapter
+    )
+
+    elapsed, result = measure(
+        partial(client.get_stories_detail, story_ids, jira_fields), args.repeat
+    )
+    assert len(result) == args.issues
+
+    gc.collect()
+    tracemalloc.start()
+    client.get_stories_detail(story_ids, jira_fields)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"issues: {args.issues:>5} | custom fields: {args.custom_fields:>5} | "
+        f"response: {len(response_text) / 1024 / 1024:6.2f}MB | "
+        f"time: {elapsed * 1000:8.2f}ms | peak memory: {peak / 1024 / 1024:7.2f}MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Measure the sort strategies over a synthetic backlog.
+
+Usage: python -m benchmarks.bench_sort_stories --rows 10000 100000
+"""
+from argparse import ArgumentParser
+from functools import partial
+from typing import List
+
+from jira_assistant.excel_definition import ExcelDefinitionColumn, SortStrategy
+from jira_assistant.sprint_schedule import SprintScheduleStore
+from jira_assistant.story import (
+    Story,
+    StoryFactory,
+    sort_stories_by_inline_weights,
+    sort_stories_by_property_and_order,
+    sort_stories_by_raise_ranking,
+)
+
+from .utils import (
+    DEFAULT_SPRINT_SCHEDULE_FILE,
+    generate_rows,
+    load_excel_definition,
+    measure,
+)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the story sorting")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    excel_definition = load_excel_definition()
+    columns = excel_definition.get_columns()
+    sprint_schedule = SprintScheduleStore()
+    sprint_schedule.load_file(DEFAULT_SPRINT_SCHEDULE_FILE)
+
+    for row_count in args.rows:
+        story_factory = StoryFactory(columns)
+        stories: List[Story] = []
+        for row in generate_rows(row_count, excel_definition):
+            story = story_factory.create_story()
+            for column, value in zip(columns, row):
+                story.set_value(column["type"], column["name"], value)
+            story.calc_sprint_schedule(sprint_schedule)
+            stories.append(story)
+
+        # Every strategy sorts the result of the previous one like the
+        # assistant does, so the parent columns are grouped.
+        for sort_strategy in excel_definition.get_sort_strategies():
+            elapsed, stories = measure(
+                partial(__sort, stories, columns, sort_strategy), args.repeat
+            )
+            print(
+                f"rows: {row_count:>8} | {sort_strategy.name:>14} | "
+                f"time: {elapsed:8.3f}s"
+            )
+
+
+def __sort(
+    stories: List[Story],
+    columns: List[ExcelDefinitionColumn],
+    sort_strategy: SortStrategy,
+) -> List[Story]:
+    # Sort a copy so that every run starts from the same order.
+    stories = list(stories)
+    name = sort_strategy.name.lower()
+    if name == "inlineweights":
+        return sort_stories_by_inline_weights(stories)
+    if name == "sortorder":
+        sort_stories_by_property_and_order(stories, columns, sort_strategy)
+        return stories
+    if name == "raiseranking":
+        return sort_stories_by_raise_ranking(stories, columns, sort_strategy)
+    return stories
+
+
+if __name__ == "__main__":
+    main()
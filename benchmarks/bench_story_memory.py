@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Measure how much memory the ``Story`` objects take after the values have
+been assigned.
+
+Usage: python -m benchmarks.bench_story_memory --rows 10000 100000
+"""
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from typing import List
+
+from jira_assistant.sprint_schedule import SprintScheduleStore
+from jira_assistant.story import Story, StoryFactory
+
+from .utils import DEFAULT_SPRINT_SCHEDULE_FILE, generate_rows, load_excel_definition
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the memory of the stories")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    excel_definition = load_excel_definition()
+    columns = excel_definition.get_columns()
+    sprint_schedule = SprintScheduleStore()
+    sprint_schedule.load_file(DEFAULT_SPRINT_SCHEDULE_FILE)
+
+    for row_count in args.rows:
+        rows = list(generate_rows(row_count, excel_definition))
+        story_factory = StoryFactory(columns)
+
+        gc.collect()
+        tracemalloc.start()
+        stories: List[Story] = []
+        for row in rows:
+            story = story_factory.create_story()
+            for column, value in zip(columns, row):
+                story.set_value(column["type"], column["name"], value)
+            story.calc_sprint_schedule(sprint_schedule)
+            stories.append(story)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"rows: {row_count:>8} | memory: {current / 2**20:10.1f}MiB | "
+            f"bytes/story: {current / row_count:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers shared by the benchmark scripts.
+"""
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+import openpyxl
+from requests import Response
+from requests_mock import Adapter
+from requests_mock.request import _RequestObjectProxy
+from requests_mock.response import create_response
+
+from jira_assistant.excel_definition import ExcelDefinition
+from jira_assistant.milestone import Milestone
+from jira_assistant.priority import Priority
+
+from tests.mock_server import custom_matcher, mock_search_response
+
+from . import SRC_ASSETS
+
+DEFAULT_EXCEL_DEFINITION_FILE = SRC_ASSETS / "excel_definition.json"
+DEFAULT_SPRINT_SCHEDULE_FILE = SRC_ASSETS / "sprint_schedule.json"
+
+_PRIORITY_VALUES = ["N/A", "Low", "Medium", "High", "Critical"]
+_BOOL_VALUES = ["Yes", "No"]
+_SPRINT_VALUES = ["R139", "R140", "R141", "R142", "M123", "M124", "M125", "M126"]
+
+
+def load_excel_definition(
+    excel_definition_file: Union[str, Path] = DEFAULT_EXCEL_DEFINITION_FILE,
+) -> ExcelDefinition:
+    excel_definition = ExcelDefinition().load_file(excel_definition_file)
+    validation_result = excel_definition.validate()
+    if validation_result:
+        raise ValueError("\n".join(validation_result))
+    return excel_definition
+
+
+def generate_rows(
+    row_count: int, excel_definition: ExcelDefinition, seed: int = 0
+) -> Iterator[List[Any]]:
+    """
+    Generate the raw cell values of a synthetic backlog.
+
+    parm row_count:
+        How many rows will be generated
+
+    parm excel_definition:
+        The definition which describes the columns
+
+    return
+        An iterator over the rows. The values follow the column order.
+    """
+    rand = random.Random(seed)
+    columns = excel_definition.get_columns()
+
+    start_date = datetime(2022, 1, 1)
+    for row_index in range(row_count):
+        row: List[Any] = []
+        for column in columns:
+            column_type = column["type"]
+            if column["name"].lower().replace(" ", "") == "storyid":
+                row.append(f"A-{row_index + 1}")
+            elif column_type is Priority:
+                row.append(rand.choice(_PRIORITY_VALUES))
+            elif column_type is bool:
+                row.append(rand.choice(_BOOL_VALUES))
+            elif column_type is Milestone:
+                row.append(rand.choice(_SPRINT_VALUES))
+            elif column_type is datetime:
+                row.append(start_date + timedelta(days=rand.randint(0, 365)))
+            elif column_type is float:
+                row.append(rand.random() * 100)
+            else:
+                row.append(f"{column['name']} {row_index}")
+        yield row
+
+
+def generate_excel_file(
+    file: Union[str, Path],
+    row_count: int,
+    excel_definition: ExcelDefinition,
+    seed: int = 0,
+) -> List[str]:
+    """
+    Generate a synthetic backlog based on the excel definition.
+
+    parm file:
+        The output Excel file
+
+    parm row_count:
+        How many stories will be generated
+
+    parm excel_definition:
+        The definition which describes the columns
+
+    return
+        The column names of the generated Excel file.
+    """
+    column_names = [column["name"] for column in excel_definition.get_columns()]
+
+    work_book = openpyxl.Workbook(write_only=True)
+    sheet = work_book.create_sheet()
+    sheet.append(column_names)
+    for row in generate_rows(row_count, excel_definition, seed):
+        sheet.append(row)
+
+    work_book.save(str(file))
+    work_book.close()
+    return column_names
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> Tuple[float, Any]:
+    """Run the function several times and return the best wall time."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        begin = perf_counter()
+        result = func()
+        best = min(best, perf_counter() - begin)
+    return best, result
+
+
+def mock_jira_requests_with_latency(
+    latency: float,
+    search_page_size_limit: Optional[int] = None,
+    failure_rate: float = 0.0,
+    seed: int = 0,
+) -> Adapter:
+    """
+    The mock Jira server of the tests, but every request will be delayed.
+
+    parm latency:
+        The delay in seconds of each request
+
+    parm search_page_size_limit:
+        How many issues the search API returns in one page at most
+
+    parm failure_rate:
+        The probability that a request is rejected with 503. The response
+        asks the client to retry immediately.
+    """
+    rand = random.Random(seed)
+    rand_lock = Lock()
+
+    def matcher(request: _RequestObjectProxy) -> Optional[Response]:
+        sleep(latency)
+        with rand_lock:
+            # The server info is requested before the retry policy of the
+            # client is applied.
+            failed = (
+                not request.path.endswith("/serverinfo")
+                and rand.random() < failure_rate
+            )
+        if failed:
+            return create_response(
+                request=request,
+                status_code=503,
+                headers={"Retry-After": "0"},
+                json={"errorMessages": ["Service Unavailable"], "errors": {}},
+            )
+        if search_page_size_limit is not None and request.path.endswith("/search"):
+            return mock_search_response(
+                request, page_size_limit=search_page_size_limit
+            )
+        return custom_matcher(request)
+
+    adapter = Adapter(False)
+    adapter.add_matcher(matcher)
+    return adapter
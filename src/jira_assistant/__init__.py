@@ -14,7 +14,11 @@ from .console_script import (
     update_jira_info,
     get_package_version,
 )
-from .excel_definition import ExcelDefinition, ExcelDefinitionColumn
+from .excel_definition import (
+    CompiledExcelDefinition,
+    ExcelDefinition,
+    ExcelDefinitionColumn,
+)
 from .excel_operation import output_to_excel_file, read_excel_file
 from .milestone import Milestone
 from .priority import Priority
@@ -26,6 +30,7 @@ __version__ = get_package_version()
 __all__ = [
     "ExcelDefinition",
     "ExcelDefinitionColumn",
+    "CompiledExcelDefinition",
     "read_excel_file",
     "output_to_excel_file",
     "run_steps_and_sort_excel_file",
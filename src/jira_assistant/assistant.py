@@ -2,21 +2,49 @@
 """This module will provide console command signatures."""
 import pathlib
 import warnings
-from json import dump
+from contextlib import nullcontext
+from json import dumps
 from os import environ, remove
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from dotenv import load_dotenv
 from termcolor import cprint
 from urllib3 import disable_warnings
 
-from .excel_definition import ExcelDefinition, ExcelDefinitionColumn
+from .excel_definition import (
+    CompiledExcelDefinition,
+    ExcelDefinition,
+    ExcelDefinitionColumn,
+)
 from .excel_operation import output_to_excel_file, read_excel_file
-from .jira_client import JiraClient, JiraField, JiraIssueType, is_jira_cloud_url
+from .jira_client import (
+    JiraClient,
+    JiraField,
+    JiraIssueType,
+    JiraProject,
+    is_jira_cloud_url,
+)
+from .jira_metadata_cache import JiraMetadataCache, JiraStoryCache
+from .jira_transport import JiraTransportConfig
+from .profiler import Profiler
 from .sprint_schedule import SprintScheduleStore
 from .story import (
     Story,
+    format_property_value,
     sort_stories_by_inline_weights,
     sort_stories_by_property_and_order,
     sort_stories_by_raise_ranking,
@@ -41,6 +69,14 @@ DEFAULT_SPRINT_SCHEDULE_FILE = ASSETS / "sprint_schedule.json"
 DEFAULT_EXCEL_DEFINITION_FILE = ASSETS / "excel_definition.json"
 
 
+def _profile_section(
+    profiler: Optional[Profiler], category: str, name: str
+) -> ContextManager[None]:
+    if profiler is None:
+        return nullcontext()
+    return profiler.section(category, name)
+
+
 def __clear_env_variables():
     if "JIRA_URL" in environ:
         del environ["JIRA_URL"]
@@ -50,7 +86,9 @@ def __clear_env_variables():
         del environ["JIRA_USER_EMAIL"]
 
 
-def __get_jira_client(env_file: Optional[Path] = None) -> Optional[JiraClient]:
+def __get_jira_client(
+    env_file: Optional[Path] = None, profiler: Optional[Profiler] = None
+) -> Optional[JiraClient]:
     if env_file is None:
         if not load_dotenv(ASSETS / ".env"):
             cprint(
@@ -109,8 +147,51 @@ Please use the update-jira-info command to add/update user email.""",
     if tmp is not None:
         jira_timeout = float(tmp)
 
+    jira_max_workers: Optional[int] = None
+    tmp = environ.get("JIRA_MAX_WORKERS", default=None)
+    if tmp is not None:
+        jira_max_workers = int(tmp)
+
+    jira_requests_per_second: Optional[float] = None
+    tmp = environ.get("JIRA_REQUESTS_PER_SECOND", default=None)
+    if tmp is not None:
+        jira_requests_per_second = float(tmp)
+
+    jira_transport_config: JiraTransportConfig = {}
+    tmp = environ.get("JIRA_POOL_SIZE", default=None)
+    if tmp is not None:
+        jira_transport_config["pool_size"] = int(tmp)
+    tmp = environ.get("JIRA_MAX_RETRIES", default=None)
+    if tmp is not None:
+        jira_transport_config["max_retries"] = int(tmp)
+    tmp = environ.get("JIRA_RETRY_BACKOFF_FACTOR", default=None)
+    if tmp is not None:
+        jira_transport_config["backoff_factor"] = float(tmp)
+    tmp = environ.get("JIRA_MAX_RETRY_DELAY", default=None)
+    if tmp is not None:
+        jira_transport_config["max_retry_delay"] = float(tmp)
+
+    jira_metadata_cache_ttl: Optional[float] = None
+    tmp = environ.get("JIRA_METADATA_CACHE_TTL", default=None)
+    if tmp is not None:
+        jira_metadata_cache_ttl = float(tmp)
+
+    jira_metadata_cache = JiraMetadataCache(
+        jira_url,
+        folder=environ.get("JIRA_CACHE_FOLDER", default=None),
+        ttl=jira_metadata_cache_ttl,
+    )
+
     jira_client = JiraClient(
-        jira_url, jira_access_token, user_email=jira_user_email, timeout=jira_timeout
+        jira_url,
+        jira_access_token,
+        user_email=jira_user_email,
+        timeout=jira_timeout,
+        max_workers=jira_max_workers,
+        requests_per_second=jira_requests_per_second,
+        metadata_cache=jira_metadata_cache,
+        transport_config=jira_transport_config,
+        profiler=profiler,
     )
 
     if not jira_client.health_check():
@@ -128,21 +209,43 @@ Please use the update-jira-info command to add/update token.""",
 
 def __query_jira_information(
     stories: List[Story],
-    excel_definition: ExcelDefinition,
+    excel_definition: CompiledExcelDefinition,
     env_file: Optional[Path] = None,
+    jira_values: Optional[Dict[str, Dict[str, Any]]] = None,
+    incremental: bool = False,
+    profiler: Optional[Profiler] = None,
 ) -> bool:
-    jira_client = __get_jira_client(env_file)
+    """
+    parm jira_values:
+        The current values of the UpdateJiraInfo columns will be saved in it.
+        Story id in lower case -> column name -> value.
+        These columns keep the values from the Excel.
+
+    parm incremental:
+        Only retrieve the stories which have been updated since last run and
+        serve the others from the story cache.
+    """
+    jira_client = __get_jira_client(env_file, profiler)
 
     if jira_client is None:
         return False
 
     jira_fields = []
+    update_jira_fields = []
 
-    for definition_column in excel_definition.get_columns():
-        if (
-            not definition_column["query_jira_info"]
-            or definition_column["jira_field_mapping"] is None
-        ):
+    for definition_column in excel_definition.columns:
+        if definition_column["jira_field_mapping"] is None:
+            continue
+        if definition_column["update_jira_info"] and jira_values is not None:
+            update_jira_fields.append(
+                {
+                    "name": definition_column["name"],
+                    "jira_name": definition_column["jira_field_mapping"]["name"],
+                    "jira_path": definition_column["jira_field_mapping"]["path"],
+                }
+            )
+            continue
+        if not definition_column["query_jira_info"]:
             continue
         jira_fields.append(
             {
@@ -153,8 +256,37 @@ def __query_jira_information(
             }
         )
 
+    story_cache: Optional[JiraStoryCache] = None
+    if incremental:
+        jira_story_cache_ttl: Optional[float] = None
+        tmp = environ.get("JIRA_STORY_CACHE_TTL", default=None)
+        if tmp is not None:
+            jira_story_cache_ttl = float(tmp)
+        story_cache = JiraStoryCache(
+            jira_client.jira.server_url,
+            folder=environ.get("JIRA_CACHE_FOLDER", default=None),
+            ttl=jira_story_cache_ttl,
+        )
+
     jira_query_result = jira_client.get_stories_detail(
-        [story["storyid"].strip() for story in stories], jira_fields
+        [story["storyid"].strip() for story in stories],
+        jira_fields + update_jira_fields,
+        story_cache=story_cache,
+    )
+
+    # Story ID has been changed because of convertion.
+    # Resolve all of them together instead of searching one by one.
+    missing_story_ids = [
+        strip_lower(story["storyid"])
+        for story in stories
+        if strip_lower(story["storyid"]) not in jira_query_result
+    ]
+    moved_stories = (
+        jira_client.get_moved_stories_detail(
+            missing_story_ids, jira_fields + update_jira_fields
+        )
+        if missing_story_ids
+        else {}
     )
 
     for story in stories:
@@ -164,17 +296,31 @@ def __query_jira_information(
                 story[jira_field["name"]] = jira_query_result[story_id].get(
                     jira_field["jira_path"], None
                 )
+            if jira_values is not None and update_jira_fields:
+                jira_values[story_id] = {
+                    jira_field["name"]: jira_query_result[story_id].get(
+                        jira_field["jira_path"], None
+                    )
+                    for jira_field in update_jira_fields
+                }
         else:
-            # Story ID has been changed because of convertion.
-            tmp_res = jira_client.get_stories_detail([story_id], jira_fields)
-            if len(tmp_res) > 0:
-                story["storyid"] = list(tmp_res.keys())[0].upper()
+            if story_id in moved_stories:
+                current_story_id, current_fields = moved_stories[story_id]
+                story["storyid"] = current_story_id.upper()
                 for jira_field in jira_fields:
+                    field_value = current_fields.get(jira_field["jira_path"], "")
                     story[jira_field["name"]] = (
-                        list(tmp_res.values())[0]
-                        .get(jira_field["jira_path"], "")
-                        .upper()
+                        field_value.upper()
+                        if isinstance(field_value, str)
+                        else field_value
                     )
+                if jira_values is not None and update_jira_fields:
+                    jira_values[current_story_id] = {
+                        jira_field["name"]: current_fields.get(
+                            jira_field["jira_path"], None
+                        )
+                        for jira_field in update_jira_fields
+                    }
                 cprint(
                     f"Story id has been changed. \
 Previous: {story_id.upper()}, \
@@ -189,55 +335,193 @@ Current: {story['storyid'].upper()}",
                 story.need_sort = False
                 continue
 
+    request_counters = jira_client.request_counters
+    if request_counters["throttled"] > 0:
+        cprint(
+            f"""Jira throttled {request_counters["throttled"]} requests. \
+Retried requests: {request_counters["retried"]}.""",
+            color="light_yellow",
+        )
+
     return True
 
 
+class _CreationPlanField(TypedDict):
+    # None means the required field is not defined in the Excel definition.
+    column: Optional[ExcelDefinitionColumn]
+    jira_field: JiraField
+    property_name: str
+    jira_field_path: str
+    required: bool
+
+
+class _CreationPlan(TypedDict):
+    project: JiraProject
+    issue_type: JiraIssueType
+    fields: List[_CreationPlanField]
+
+
+def __build_creation_plan(
+    jira_client: JiraClient,
+    excel_definition: CompiledExcelDefinition,
+    project_type_name: str,
+    issue_type_name: str,
+) -> "Union[_CreationPlan, str]":
+    """
+    Resolve the project, the issue type and the Excel columns of each Jira
+    field once for all stories with the same ProjectType/IssueType.
+
+    return
+        The plan or the warning message if the ProjectType/IssueType is
+        invalid.
+    """
+    project_type = jira_client.get_project_by_project_name(project_type_name)
+    if project_type is None:
+        return f"ProjectType: {project_type_name} is not supported."
+    issue_type = jira_client.get_issue_type_by_project_name_and_issue_name(
+        project_type.name, issue_type_name
+    )
+    if issue_type is None:
+        return f"IssueType: {issue_type_name} is not supported."
+
+    (
+        required_fields,
+        not_required_fields,
+    ) = jira_client.get_fields_by_project_id_and_issue_id(
+        project_type.id_, issue_type.id_
+    )
+
+    plan_fields: List[_CreationPlanField] = []
+    for jira_field in required_fields + not_required_fields:
+        excel_columns = excel_definition.get_column_by_jira_field_mapping_name(
+            jira_field.id_
+        )
+        if not excel_columns and jira_field.required:
+            plan_fields.append(
+                {
+                    "column": None,
+                    "jira_field": jira_field,
+                    "property_name": "",
+                    "jira_field_path": "",
+                    "required": True,
+                }
+            )
+            continue
+        for excel_column in excel_columns:
+            if excel_column["jira_field_mapping"] is None:
+                continue
+            plan_fields.append(
+                {
+                    "column": excel_column,
+                    "jira_field": jira_field,
+                    "property_name": standardize_column_name(excel_column["name"]),
+                    "jira_field_path": excel_column["jira_field_mapping"]["path"],
+                    "required": jira_field.required,
+                }
+            )
+    return {"project": project_type, "issue_type": issue_type, "fields": plan_fields}
+
+
 def __check_allowed_value(
     current_value: Any,
-    jira_field: JiraField,
-    excel_column: ExcelDefinitionColumn,
+    plan_field: _CreationPlanField,
+    excel_column_name: str,
     project_type_name: str,
     issue_type_name: str,
 ) -> "bool":
-    if excel_column["jira_field_mapping"] is not None:
-        jira_field_path = excel_column["jira_field_mapping"]["path"]
-        if not jira_field.is_value_allowed(str(current_value), jira_field_path):
-            cprint(
-                f"{excel_column['name']} has not allowed value: {current_value}. ProjectType: {project_type_name} and IssueType: {issue_type_name}.",  # pylint: disable=line-too-long
-                color="light_yellow",
-            )
-            cprint("Allowed values:", color="light_yellow")
-            for index, value in enumerate(jira_field.allowed_values[jira_field_path]):
-                cprint(f"{index + 1}. {value}", color="light_yellow")
-            return False
+    if not plan_field["jira_field"].is_value_allowed(
+        str(current_value), plan_field["jira_field_path"]
+    ):
+        cprint(
+            f"{excel_column_name} has not allowed value: {current_value}. ProjectType: {project_type_name} and IssueType: {issue_type_name}.",  # pylint: disable=line-too-long
+            color="light_yellow",
+        )
+        cprint("Allowed values:", color="light_yellow")
+        for index, value in enumerate(
+            plan_field["jira_field"].allowed_values[plan_field["jira_field_path"]]
+        ):
+            cprint(f"{index + 1}. {value}", color="light_yellow")
+        return False
     return True
 
 
-def __assign_new_story_field(
-    is_array: bool,
-    new_story_fields: Dict[str, Any],
-    excel_column: ExcelDefinitionColumn,
-    value: Any,
-):
-    if excel_column is None or excel_column["jira_field_mapping"] is None:
-        return
-    jira_field_path = excel_column["jira_field_mapping"]["path"]
+def __convert_to_jira_field_value(value: Any, is_array: bool, delimiter: str) -> Any:
+    # The values of the array field are separated by the delimiter in one cell.
     if is_array:
-        new_story_fields[jira_field_path] = str(value).split(excel_column["delimiter"])
-    else:
-        new_story_fields[jira_field_path] = value
+        return str(value).split(delimiter)
+    return value
+
+
+def __extract_new_story_fields(
+    story: Story, plan: _CreationPlan, issue_type_name: str
+) -> "Optional[Dict[str, Any]]":
+    new_story_fields: Dict[str, Any] = {}
+    all_fields_valid: bool = True
+    for plan_field in plan["fields"]:
+        excel_column = plan_field["column"]
+        if excel_column is None:
+            cprint(
+                f"Excel definition missing required field: {plan_field['jira_field'].id_}.",  # pylint: disable=line-too-long
+                color="light_red",
+            )
+            all_fields_valid = False
+            continue
+        if not hasattr(story, plan_field["property_name"]):
+            if plan_field["required"]:
+                cprint(
+                    f"Story missing required field: {excel_column['name']}.",
+                    color="light_red",
+                )
+                all_fields_valid = False
+            continue
+        current_value = story[plan_field["property_name"]]
+        if current_value is None and not plan_field["required"]:
+            continue
+        if not __check_allowed_value(
+            current_value,
+            plan_field,
+            excel_column["name"],
+            plan["project"].name,
+            issue_type_name,
+        ):
+            all_fields_valid = False
+            continue
+        new_story_fields[plan_field["jira_field_path"]] = __convert_to_jira_field_value(
+            current_value, plan_field["jira_field"].is_array, excel_column["delimiter"]
+        )
+
+    if not all_fields_valid:
+        return None
+
+    # Special fields
+    new_story_fields["project.id"] = plan["project"].id_
+    return new_story_fields
 
 
 def __create_jira_stories(
     stories: List[Story],
-    excel_definition: ExcelDefinition,
+    excel_definition: CompiledExcelDefinition,
     env_file: Optional[Path] = None,
+    profiler: Optional[Profiler] = None,
 ) -> bool:
-    jira_client = __get_jira_client(env_file)
+    jira_client = __get_jira_client(env_file, profiler)
 
     if jira_client is None:
         return False
 
+    # Only the issue types of the projects which are used will be loaded.
+    jira_client.prefetch_issue_types(
+        [
+            str(story["projecttype"])
+            for story in stories
+            if story["projecttype"] is not None
+        ]
+    )
+
+    # The dict key is: (project_type, issue_type) in lower case.
+    creation_plans: Dict[Tuple[str, str], Union[_CreationPlan, str]] = {}
+    stories_to_create: List[Story] = []
+    fields_to_create: List[Dict[str, Any]] = []
     for story in stories:
         input_project_type: Optional[str] = story["projecttype"]
         input_issue_type: Optional[str] = story["issuetype"]
@@ -249,175 +533,246 @@ Excel row number: {story.excel_row_index}.",
                 color="light_yellow",
             )
             continue
-        project_type = jira_client.get_project_by_project_name(input_project_type)
-        if project_type is None:
-            cprint(
-                f"ProjectType: {input_project_type} is not supported.",
-                color="light_yellow",
+
+        plan_key = (strip_lower(input_project_type), strip_lower(input_issue_type))
+        if plan_key not in creation_plans:
+            creation_plans[plan_key] = __build_creation_plan(
+                jira_client, excel_definition, input_project_type, input_issue_type
             )
+        plan = creation_plans[plan_key]
+        if isinstance(plan, str):
+            cprint(plan, color="light_yellow")
+            continue
+
+        new_story_fields = __extract_new_story_fields(story, plan, input_issue_type)
+        if new_story_fields is None:
+            cprint("Please fix the above issues.", color="light_red")
             continue
-        issue_type: Optional[JiraIssueType] = None
-        for item in jira_client.get_issue_types(project_type.name):
-            if item.name.lower() == input_issue_type.lower():
-                issue_type = item
-                break
-        if issue_type is None:
+
+        stories_to_create.append(story)
+        fields_to_create.append(new_story_fields)
+
+    if not stories_to_create:
+        return True
+
+    all_stories_created: bool = True
+    for story, result in zip(
+        stories_to_create, jira_client.create_stories(fields_to_create)
+    ):
+        new_story = result["issue"]
+        if new_story is None:
             cprint(
-                f"IssueType: {input_issue_type} is not supported.", color="light_yellow"
+                f"Calling create story API failed. \
+Excel row number: {story.excel_row_index}. {result['error']}",
+                color="light_yellow",
             )
+            all_stories_created = False
             continue
+        story["storyid"] = new_story.key
+        cprint(
+            f"New story: {jira_client.get_jira_browser_link(new_story.key)}",
+            color="light_green",
+        )
+    return all_stories_created
 
+
+def __is_same_jira_value(
+    column_type: Optional[type], value: Any, jira_value: Any
+) -> bool:
+    if isinstance(value, list):
+        return isinstance(jira_value, list) and [
+            format_property_value(item) for item in value
+        ] == [format_property_value(item) for item in jira_value]
+    # The number cell can be read as an int, like 1, but Jira returns 1.0.
+    if column_type is float:
+        try:
+            return float(value) == float(jira_value)
+        except (TypeError, ValueError):
+            pass
+    return format_property_value(value) == format_property_value(jira_value)
+
+
+def __update_jira_information(
+    stories: List[Story],
+    excel_definition: CompiledExcelDefinition,
+    jira_values: Dict[str, Dict[str, Any]],
+    env_file: Optional[Path] = None,
+    profiler: Optional[Profiler] = None,
+) -> bool:
+    # (property name, column name, column type, jira field path, delimiter)
+    update_columns: List[Tuple[str, str, Optional[type], str, str]] = [
         (
-            required_fields,
-            not_required_fields,
-        ) = jira_client.get_fields_by_project_id_and_issue_id(
-            project_type.id_, issue_type.id_
+            standardize_column_name(column["name"]),
+            column["name"],
+            column["type"],
+            column["jira_field_mapping"]["path"],
+            column["delimiter"],
         )
+        for column in excel_definition.columns
+        if column["update_jira_info"] and column["jira_field_mapping"] is not None
+    ]
+    if not update_columns:
+        return True
 
-        new_story_fields: Dict[str, Any] = {}
+    jira_client = __get_jira_client(env_file, profiler)
 
-        # Required fields
-        all_fields_valid: bool = True
-        for required_field in required_fields:
-            excel_columns = excel_definition.get_column_by_jira_field_mapping_name(
-                required_field.id_
-            )
+    if jira_client is None:
+        return False
 
-            if not excel_columns:
-                cprint(
-                    f"Excel definition missing required field: {required_field.id_}.",  # pylint: disable=line-too-long
-                    color="light_red",
-                )
-                all_fields_valid = False
+    # The values of these paths will be split like creating the stories.
+    array_field_paths: Set[str] = {
+        jira_field_path
+        for _, _, _, jira_field_path, _ in update_columns
+        if jira_client.is_array_field(jira_field_path.split(".")[0])
+    }
+
+    # Only the changed fields of the changed stories will be sent.
+    # The empty cells won't clear the values in Jira.
+    changed_stories: Dict[str, Story] = {}
+    changed_fields: Dict[str, Dict[str, Any]] = {}
+    for story in stories:
+        if story["storyid"] is None:
+            continue
+        story_id = story["storyid"].strip()
+        current_values = jira_values.get(strip_lower(story_id), None)
+        if current_values is None:
+            continue
+        fields: Dict[str, Any] = {}
+        for (
+            property_name,
+            column_name,
+            column_type,
+            jira_field_path,
+            delimiter,
+        ) in update_columns:
+            value = story[property_name]
+            if format_property_value(value) == "":
                 continue
-
-            for excel_column in excel_columns:
-                excel_column_name = excel_column["name"]
-                if not hasattr(story, standardize_column_name(excel_column_name)):
-                    cprint(
-                        f"Story missing required field: {excel_column_name}.",
-                        color="light_red",
-                    )
-                    all_fields_valid = False
-                    continue
-                current_value = story[standardize_column_name(excel_column_name)]
-                if not __check_allowed_value(
-                    current_value,
-                    required_field,
-                    excel_column,
-                    project_type.name,
-                    input_issue_type,
-                ):
-                    all_fields_valid = False
-                    continue
-                __assign_new_story_field(
-                    required_field.is_array,
-                    new_story_fields,
-                    excel_column,
-                    current_value,
-                )
-
-        # Not required fields
-        for not_required_field in not_required_fields:
-            excel_columns = excel_definition.get_column_by_jira_field_mapping_name(
-                not_required_field.id_
+            value = __convert_to_jira_field_value(
+                value, jira_field_path in array_field_paths, delimiter
             )
-            for excel_column in excel_columns:
-                excel_column_name = excel_column["name"]
-                if not hasattr(story, standardize_column_name(excel_column_name)):
-                    continue
-                is_array = not_required_field.is_array
-                current_value = story[standardize_column_name(excel_column_name)]
-                if current_value is None:
-                    continue
-                if not __check_allowed_value(
-                    current_value,
-                    not_required_field,
-                    excel_column,
-                    project_type.name,
-                    input_issue_type,
-                ):
-                    all_fields_valid = False
-                    continue
-                __assign_new_story_field(
-                    is_array, new_story_fields, excel_column, current_value
-                )
-
-        if not all_fields_valid:
-            cprint("Please fix the above issues.", color="light_red")
-            continue
-
-        # Special fields
-        new_story_fields["project.id"] = project_type.id_
-
-        new_story = jira_client.create_story(new_story_fields)
-        if new_story is not None:
-            story["storyid"] = new_story.key
+            if __is_same_jira_value(
+                column_type, value, current_values.get(column_name, None)
+            ):
+                continue
+            fields[jira_field_path] = value
+        if fields:
+            changed_stories[story_id] = story
+            changed_fields[story_id] = fields
+
+    if not changed_fields:
+        cprint("No changes need to be updated to Jira.")
+        return True
+
+    all_stories_updated: bool = True
+    for story_id, error in jira_client.update_stories(changed_fields).items():
+        story = changed_stories[story_id]
+        if error is not None:
             cprint(
-                f"New story: {jira_client.get_jira_browser_link(new_story.key)}",
-                color="light_green",
+                f"Calling update story API failed. \
+Excel row number: {story.excel_row_index}. {error}",
+                color="light_yellow",
             )
+            all_stories_updated = False
             continue
-        return False
-    return True
+        cprint(
+            f"Updated story: {story_id.upper()}. \
+Fields: {', '.join(changed_fields[story_id].keys())}",
+            color="light_green",
+        )
+    return all_stories_updated
 
 
 def __run_pre_steps(
     stories: List[Story],
-    excel_definition: ExcelDefinition,
+    excel_definition: CompiledExcelDefinition,
     env_file: Optional[Path] = None,
+    profiler: Optional[Profiler] = None,
 ):
     # Execute pre-process steps
     pre_process_steps = excel_definition.get_pre_process_steps()
+    # The values of the UpdateJiraInfo columns in Jira.
+    jira_values: Dict[str, Dict[str, Any]] = {}
+    # The UpdateJiraInfo columns are only retrieved for the update.
+    need_jira_values = (
+        excel_definition.get_pre_process_step_by_name("UpdateJiraInformation")
+        is not None
+    )
 
     for pre_process_step in pre_process_steps:
         cprint(f"Executing step: {pre_process_step.name}...")
-        if strip_lower(pre_process_step.name) == strip_lower("RetrieveJiraInformation"):
-            need_call_jira_api: bool = False
-            for excel_definition_column in excel_definition.get_columns():
-                if excel_definition_column["jira_field_mapping"] is not None:
-                    need_call_jira_api = True
-                    break
-
-            if need_call_jira_api:
-                stories_need_call_jira: List[Story] = []
+        with _profile_section(profiler, "step", pre_process_step.name):
+            if strip_lower(pre_process_step.name) == strip_lower(
+                "RetrieveJiraInformation"
+            ):
+                need_call_jira_api: bool = False
+                for excel_definition_column in excel_definition.columns:
+                    if excel_definition_column["jira_field_mapping"] is not None:
+                        need_call_jira_api = True
+                        break
+
+                if need_call_jira_api:
+                    stories_need_call_jira: List[Story] = []
+                    for story in stories:
+                        if story.need_sort and story["storyid"] is not None:
+                            stories_need_call_jira.append(story)
+                    if not __query_jira_information(
+                        stories_need_call_jira,
+                        excel_definition,
+                        env_file,
+                        jira_values if need_jira_values else None,
+                        pre_process_step.get_config("Incremental") is True,
+                        profiler,
+                    ):
+                        cprint(
+                            "Retrieve jira information failed.",
+                            color="light_yellow",
+                        )
+                        return
+            elif strip_lower(pre_process_step.name) == strip_lower(
+                "FilterOutStoryWithoutId"
+            ):
                 for story in stories:
-                    if story.need_sort and story["storyid"] is not None:
-                        stories_need_call_jira.append(story)
-                if not __query_jira_information(
-                    stories_need_call_jira, excel_definition, env_file
-                ):
-                    cprint("Retrieve jira information failed.", color="light_yellow")
-                    return
-        elif strip_lower(pre_process_step.name) == strip_lower(
-            "FilterOutStoryWithoutId"
-        ):
-            for story in stories:
-                if story["storyid"] is None:
-                    story.need_sort = False
-        elif strip_lower(pre_process_step.name) == strip_lower(
-            "FilterOutStoryBasedOnJiraStatus"
-        ):
-            for story in stories:
-                if (
-                    story["status"] is not None
-                    and pre_process_step.config is not None
-                    and story["status"].upper()
-                    in pre_process_step.config.get("JiraStatuses", [])
-                ):
-                    story.need_sort = False
-        elif strip_lower(pre_process_step.name) == strip_lower("CreateJiraStory"):
-            stories_need_to_create: List[Story] = []
-            for story in stories:
-                if story["storyid"] is None or story["storyid"].strip() == "":
-                    stories_need_to_create.append(story)
-
-            if stories_need_to_create:
-                if not __create_jira_stories(
-                    stories_need_to_create, excel_definition, env_file
+                    if story["storyid"] is None:
+                        story.need_sort = False
+            elif strip_lower(pre_process_step.name) == strip_lower(
+                "FilterOutStoryBasedOnJiraStatus"
+            ):
+                for story in stories:
+                    if (
+                        story["status"] is not None
+                        and pre_process_step.config is not None
+                        and story["status"].upper()
+                        in pre_process_step.config.get("JiraStatuses", [])
+                    ):
+                        story.need_sort = False
+            elif strip_lower(pre_process_step.name) == strip_lower("CreateJiraStory"):
+                stories_need_to_create: List[Story] = []
+                for story in stories:
+                    if story["storyid"] is None or story["storyid"].strip() == "":
+                        stories_need_to_create.append(story)
+
+                if stories_need_to_create:
+                    if not __create_jira_stories(
+                        stories_need_to_create, excel_definition, env_file, profiler
+                    ):
+                        cprint(
+                            "Error occurred when creating Jira stories.",
+                            color="light_yellow",
+                        )
+                        return
+            elif strip_lower(pre_process_step.name) == strip_lower(
+                "UpdateJiraInformation"
+            ):
+                if not __update_jira_information(
+                    [story for story in stories if story.need_sort],
+                    excel_definition,
+                    jira_values,
+                    env_file,
+                    profiler,
                 ):
                     cprint(
-                        "Error occurred when creating Jira stories.",
+                        "Error occurred when updating Jira stories.",
                         color="light_yellow",
                     )
                     return
@@ -425,7 +780,9 @@ def __run_pre_steps(
 
 
 def __run_sort_logics(
-    stories: List[Story], excel_definition: ExcelDefinition
+    stories: List[Story],
+    excel_definition: CompiledExcelDefinition,
+    profiler: Optional[Profiler] = None,
 ) -> Tuple[List[Story], List[Story]]:
     stories_no_need_sort = []
     stories_need_sort = []
@@ -441,20 +798,21 @@ def __run_sort_logics(
 
     for sort_strategy in sort_strategies:
         cprint(f"Executing {sort_strategy.name} sorting...")
-        if strip_lower(sort_strategy.name) == strip_lower("InlineWeights"):
-            stories_need_sort = sort_stories_by_inline_weights(stories_need_sort)
-        elif strip_lower(sort_strategy.name) == strip_lower("SortOrder"):
-            sort_stories_by_property_and_order(
-                stories_need_sort,
-                excel_definition.get_columns(),
-                sort_strategy,
-            )
-        elif strip_lower(sort_strategy.name) == strip_lower("RaiseRanking"):
-            stories_need_sort = sort_stories_by_raise_ranking(
-                stories_need_sort,
-                excel_definition.get_columns(),
-                sort_strategy,
-            )
+        with _profile_section(profiler, "strategy", sort_strategy.name):
+            if strip_lower(sort_strategy.name) == strip_lower("InlineWeights"):
+                stories_need_sort = sort_stories_by_inline_weights(stories_need_sort)
+            elif strip_lower(sort_strategy.name) == strip_lower("SortOrder"):
+                sort_stories_by_property_and_order(
+                    stories_need_sort,
+                    excel_definition.columns,
+                    sort_strategy,
+                )
+            elif strip_lower(sort_strategy.name) == strip_lower("RaiseRanking"):
+                stories_need_sort = sort_stories_by_raise_ranking(
+                    stories_need_sort,
+                    excel_definition.columns,
+                    sort_strategy,
+                )
         cprint("Executing finish.")
 
     return stories_need_sort, stories_no_need_sort
@@ -507,6 +865,8 @@ def run_steps_and_sort_excel_file(
     sprint_schedule_file: Optional[Union[str, Path]] = None,
     over_write: bool = True,
     env_file: Optional[Path] = None,
+    profiler: Optional[Profiler] = None,
+    streaming: bool = False,
 ):
     """
     Sort the Excel file and output the result
@@ -526,10 +886,19 @@ def run_steps_and_sort_excel_file(
 
     parm over_write:
         Whether the exist output file will be over-write.
+
+    parm profiler:
+        Record how long the phases, the pre-process steps, the sort strategies
+        and the Jira requests take.
+
+    parm streaming:
+        Whether to write the output file row by row, see
+        :py:func:`output_to_excel_file`.
     """
-    excel_definition, excel_columns, stories = __pre_parse_excel_file(
-        input_file, excel_definition_file, sprint_schedule_file
-    )
+    with _profile_section(profiler, "phase", "ReadExcelFile"):
+        excel_definition, excel_columns, stories = __pre_parse_excel_file(
+            input_file, excel_definition_file, sprint_schedule_file
+        )
 
     if stories is None or excel_columns is None:
         cprint("Parse excel file failed.", color="light_red")
@@ -539,26 +908,44 @@ def run_steps_and_sort_excel_file(
         cprint("There are no stories inside the excel file.", color="light_yellow")
         return
 
-    __run_pre_steps(stories, excel_definition, env_file)
-
-    stories_need_sort, stories_no_need_sort = __run_sort_logics(
-        stories, excel_definition
+    # The definition has been validated, so it has been compiled.
+    compiled_excel_definition = cast(
+        CompiledExcelDefinition, excel_definition.compiled
     )
 
-    output_to_excel_file(
-        output_file,
-        stories_need_sort + stories_no_need_sort,  # First output the sorted stories.
-        excel_column_names=excel_columns,
-        over_write=over_write,
-    )
+    with _profile_section(profiler, "phase", "PreProcessSteps"):
+        __run_pre_steps(stories, compiled_excel_definition, env_file, profiler)
+
+    with _profile_section(profiler, "phase", "SortStrategies"):
+        stories_need_sort, stories_no_need_sort = __run_sort_logics(
+            stories, compiled_excel_definition, profiler
+        )
+
+    with _profile_section(profiler, "phase", "WriteExcelFile"):
+        output_to_excel_file(
+            output_file,
+            # First output the sorted stories.
+            stories_need_sort + stories_no_need_sort,
+            excel_column_names=excel_columns,
+            over_write=over_write,
+            streaming=streaming,
+        )
 
     cprint(f"{output_file} has been saved.", color="light_green")
 
 
 def generate_jira_field_mapping_file(
-    file: Union[str, Path], over_write: bool = True, env_file: Optional[Path] = None
+    file: Union[str, Path],
+    over_write: bool = True,
+    env_file: Optional[Path] = None,
+    compact: bool = False,
 ) -> bool:
-    """Generate jira field mapping"""
+    """
+    Generate jira field mapping
+
+    parm compact:
+        Write the JSON file without the indents and the line breaks.
+    """
     jira_client = __get_jira_client(env_file)
 
     if jira_client is None:
@@ -580,19 +967,49 @@ def generate_jira_field_mapping_file(
             )
 
     with open(output_file_path, mode="x", encoding="utf-8") as output_file:
-        dump(
-            jira_client.get_all_fields(),
-            output_file,
-            default=lambda o: o.__dict__,
-            indent=DEFAULT_JSON_IDENT,
-            sort_keys=True,
+        __write_jira_field_mapping(
+            output_file, jira_client.iter_all_fields(), compact
         )
-        output_file.flush()
-        output_file.close()
 
     return True
 
 
+def __write_jira_field_mapping(
+    output_file: TextIO,
+    fields: "Iterator[Tuple[str, Dict[str, Any]]]",
+    compact: bool,
+):
+    # The same as dumping the whole dict with the sorted keys, but each field
+    # is written once it has been resolved.
+    if compact:
+        output_file.write("{")
+        for index, (field_name, field) in enumerate(fields):
+            if index > 0:
+                output_file.write(",")
+            output_file.write(dumps(field_name))
+            output_file.write(":")
+            output_file.write(
+                dumps(field, separators=(",", ":"), sort_keys=True)
+            )
+        output_file.write("}")
+        return
+
+    indent = " " * DEFAULT_JSON_IDENT
+    empty = True
+    output_file.write("{")
+    for field_name, field in fields:
+        output_file.write("\n" if empty else ",\n")
+        empty = False
+        output_file.write(f"{indent}{dumps(field_name)}: ")
+        # The strings in JSON never contain the line breaks.
+        output_file.write(
+            dumps(field, indent=DEFAULT_JSON_IDENT, sort_keys=True).replace(
+                "\n", "\n" + indent
+            )
+        )
+    output_file.write("}" if empty else "\n}")
+
+
 def dry_run_steps_and_sort_excel_file(
     input_file: Union[str, Path],
     excel_definition_file: Optional[Union[str, Path]] = None,
@@ -13,7 +13,7 @@ from shutil import copyfile
 from typing import Optional
 from urllib.parse import ParseResult, urlparse
 
-from dotenv import set_key
+from dotenv import load_dotenv, set_key
 from termcolor import cprint
 
 from .assistant import (
@@ -23,6 +23,8 @@ from .assistant import (
 )
 from .excel_definition import ExcelDefinition
 from .excel_operation import output_to_excel_file
+from .jira_metadata_cache import clear_all_metadata_caches
+from .profiler import Profiler
 
 __all__ = [
     "process_excel_file",
@@ -94,6 +96,26 @@ def get_args_for_process_excel_file() -> Namespace:
         action="store_true",
         help="Only analyze the input and definition files. No side effects at all.",
     )
+    parser.add_argument(
+        "--profile",
+        required=False,
+        action="store_true",
+        help="Print how long the steps and the Jira requests take.",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        "--profile_trace",
+        metavar="<path>",
+        type=pathlib.Path,
+        required=False,
+        help="Save the timing of the steps and the Jira requests as a JSON trace file.",
+    )
+    parser.add_argument(
+        "--streaming",
+        required=False,
+        action="store_true",
+        help="Write the output Excel file row by row to use less memory.",
+    )
     parser.add_argument(
         "--v",
         "--version",
@@ -199,6 +221,10 @@ def process_excel_file() -> None:
                 sprint_schedule_file_absolute_path,
             )
         else:
+            profiler: Optional[Profiler] = None
+            if args.profile is True or args.profile_trace is not None:
+                profiler = Profiler()
+
             run_steps_and_sort_excel_file(
                 input_file_absolute_path,
                 output_file_absolute_path,
@@ -206,8 +232,22 @@ def process_excel_file() -> None:
                 sprint_schedule_file_absolute_path,
                 over_write,
                 env_file,
+                profiler,
+                args.streaming,
             )
 
+            if profiler is not None and args.profile is True:
+                cprint(profiler.format_summary(), color="light_cyan")
+            if profiler is not None and args.profile_trace is not None:
+                profile_trace_absolute_path = pathlib.Path(
+                    pathlib.Path.cwd() / args.profile_trace.as_posix()
+                ).resolve()
+                profiler.save_trace(profile_trace_absolute_path)
+                cprint(
+                    f"{profile_trace_absolute_path} has been saved.",
+                    color="light_green",
+                )
+
         sys.exit(0)
     except Exception as e:
         cprint(e, color="light_red")
@@ -247,6 +287,12 @@ Choices: excel, excel-definition, sprint-schedule or jira-field-mapping.""",
         required=False,
         help="Env file which contains info like jira url.",
     )
+    parser.add_argument(
+        "--compact",
+        required=False,
+        action="store_true",
+        help="Write the jira field mapping file without indents and line breaks.",
+    )
     parser.add_argument(
         "--v",
         "--version",
@@ -297,6 +343,7 @@ def generate_template():
                     output_folder, "jira-field-mapping", ".json"
                 ),
                 args.env_file,
+                args.compact,
             )
         else:
             cprint(
@@ -347,10 +394,12 @@ def __generate_excel_template(output_file: "Path") -> Optional[Path]:
 
 
 def __generate_jira_field_mapping_template(
-    output_file: "Path", env_file: Optional[Path] = None
+    output_file: "Path", env_file: Optional[Path] = None, compact: bool = False
 ) -> Optional[Path]:
     try:
-        if generate_jira_field_mapping_file(output_file, env_file=env_file):
+        if generate_jira_field_mapping_file(
+            output_file, env_file=env_file, compact=compact
+        ):
             return output_file
     except Exception as e:
         cprint(e, color="light_red")
@@ -396,6 +445,13 @@ def get_args_for_update_jira_info() -> Namespace:
         required=False,
         help="Custom env file",
     )
+    parser.add_argument(
+        "--clear-cache",
+        "--clear_cache",
+        action="store_true",
+        required=False,
+        help="Remove the cached jira projects, issue types and fields.",
+    )
     parser.add_argument(
         "--v",
         "--version",
@@ -420,6 +476,13 @@ def update_jira_info():
         if not env_file.exists():
             env_file.touch()
 
+        # CACHE Part
+        if args.clear_cache is True:
+            # The cache folder can be customized in the env file.
+            load_dotenv(env_file)
+            clear_all_metadata_caches(os.environ.get("JIRA_CACHE_FOLDER", None))
+            cprint("Clear jira metadata cache success!", color="light_green")
+
         # URL Part
         if args.url is not None:
             parsed_url: ParseResult = urlparse(str(args.url))
@@ -10,7 +10,7 @@ from datetime import datetime
 from json import loads
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
 
 from .milestone import Milestone
 from .priority import Priority
@@ -22,7 +22,12 @@ from .utils import (
     strip_lower,
 )
 
-__all__ = ["ExcelDefinition", "ExcelDefinitionColumn", "SortStrategy"]
+__all__ = [
+    "ExcelDefinition",
+    "ExcelDefinitionColumn",
+    "CompiledExcelDefinition",
+    "SortStrategy",
+]
 
 
 class BasicStep:
@@ -262,12 +267,128 @@ def parse_json_item_to_excel_definition_column(json_item: Any) -> ExcelDefinitio
     )
 
 
+class CompiledExcelDefinition:
+    """
+    The read-only form of a validated :py:class:`ExcelDefinition`. The columns
+    are indexed and the steps and the strategies are sorted once, so the
+    lookups don't copy anything. The returned items must not be modified.
+    """
+
+    def __init__(
+        self,
+        columns: "List[ExcelDefinitionColumn]",
+        pre_process_steps: "List[PreProcessStep]",
+        sort_strategies: "List[SortStrategy]",
+    ) -> None:
+        """
+        parm columns:
+            The columns sorted by the index.
+        """
+        self.__columns: Tuple[ExcelDefinitionColumn, ...] = tuple(deepcopy(columns))
+        self.__column_names = tuple(column["name"] for column in self.__columns)
+        self.__standardized_column_names = tuple(
+            standardize_column_name(name) for name in self.__column_names
+        )
+        self.__columns_by_name: Dict[str, ExcelDefinitionColumn] = {}
+        self.__columns_by_index: Dict[int, ExcelDefinitionColumn] = {}
+        self.__columns_by_jira_field_mapping_name: Dict[
+            str, Tuple[ExcelDefinitionColumn, ...]
+        ] = {}
+        for column, standardized_name in zip(
+            self.__columns, self.__standardized_column_names
+        ):
+            self.__columns_by_name.setdefault(standardized_name, column)
+            self.__columns_by_index.setdefault(column["index"], column)
+            jira_field_mapping = column["jira_field_mapping"]
+            if jira_field_mapping is not None:
+                jira_field_mapping_name = standardize_column_name(
+                    jira_field_mapping["path"].split(".")[0]
+                )
+                self.__columns_by_jira_field_mapping_name[jira_field_mapping_name] = (
+                    self.__columns_by_jira_field_mapping_name.get(
+                        jira_field_mapping_name, ()
+                    )
+                    + (column,)
+                )
+
+        steps = deepcopy(pre_process_steps)
+        # Enabled -> the steps sorted by the priority.
+        self.__pre_process_steps: Dict[bool, Tuple[PreProcessStep, ...]] = {
+            enabled: tuple(
+                sorted(
+                    (step for step in steps if step.enabled == enabled),
+                    key=lambda step: step.priority,
+                )
+            )
+            for enabled in (True, False)
+        }
+        # (Step name in lower case, enabled) -> the first defined step.
+        self.__pre_process_steps_by_name: Dict[Tuple[str, bool], PreProcessStep] = {}
+        for step in steps:
+            self.__pre_process_steps_by_name.setdefault(
+                (strip_lower(step.name), step.enabled), step
+            )
+        strategies = deepcopy(sort_strategies)
+        # Enabled -> the strategies sorted by the priority.
+        self.__sort_strategies: Dict[bool, Tuple[SortStrategy, ...]] = {
+            enabled: tuple(
+                sorted(
+                    (
+                        strategy
+                        for strategy in strategies
+                        if strategy.enabled == enabled
+                    ),
+                    key=lambda strategy: strategy.priority,
+                )
+            )
+            for enabled in (True, False)
+        }
+
+    @property
+    def columns(self) -> "Tuple[ExcelDefinitionColumn, ...]":
+        return self.__columns
+
+    def get_columns_name(self, standardized: bool = True) -> "Tuple[str, ...]":
+        if standardized:
+            return self.__standardized_column_names
+        return self.__column_names
+
+    def get_column_by_name(self, name: str) -> "Optional[ExcelDefinitionColumn]":
+        return self.__columns_by_name.get(standardize_column_name(name), None)
+
+    def get_column_by_index(self, index: int) -> "Optional[ExcelDefinitionColumn]":
+        return self.__columns_by_index.get(index, None)
+
+    def get_column_by_jira_field_mapping_name(
+        self, name: str
+    ) -> "Tuple[ExcelDefinitionColumn, ...]":
+        return self.__columns_by_jira_field_mapping_name.get(
+            standardize_column_name(name), ()
+        )
+
+    def get_pre_process_steps(
+        self, enabled: bool = True
+    ) -> "Tuple[PreProcessStep, ...]":
+        return self.__pre_process_steps[enabled]
+
+    def get_pre_process_step_by_name(
+        self, step_name: str, enabled: bool = True
+    ) -> "Optional[PreProcessStep]":
+        return self.__pre_process_steps_by_name.get(
+            (strip_lower(step_name), enabled), None
+        )
+
+    def get_sort_strategies(self, enabled: bool = True) -> "Tuple[SortStrategy, ...]":
+        return self.__sort_strategies[enabled]
+
+
 class ExcelDefinition:
     def __init__(self) -> None:
         self.__version = 1
         self.__columns: list[ExcelDefinitionColumn] = []
         self.__sort_strategies: list[SortStrategy] = []
         self.__pre_process_steps: list[PreProcessStep] = []
+        self.__compiled: Optional[CompiledExcelDefinition] = None
 
     def load(self, content: str) -> "ExcelDefinition":
         """
@@ -277,6 +398,7 @@ class ExcelDefinition:
             JSON string content
         """
 
+        self.__compiled = None
         try:
             raw_data = loads(s=content)
         except JSONDecodeError as e:
@@ -352,11 +474,32 @@ class ExcelDefinition:
         return self
 
     def validate(self) -> "List[str]":
-        return (
+        """
+        Validate the definition. The :py:attr:`compiled` definition will be
+        created if there is no issue.
+
+        return
+            The issues need to be fixed.
+        """
+        self.__compiled = None
+        invalid_definitions = (
             self.__validate_pre_process_steps()
             + self.__validate_sort_strategies()
             + self.__validate_column_definitions()
         )
+        if not invalid_definitions:
+            self.__compiled = CompiledExcelDefinition(
+                self.__columns, self.__pre_process_steps, self.__sort_strategies
+            )
+        return invalid_definitions
+
+    @property
+    def compiled(self) -> Optional[CompiledExcelDefinition]:
+        """
+        The read-only definition with the indexed columns. It is None until
+        the definition has been validated successfully.
+        """
+        return self.__compiled
 
     def __validate_pre_process_steps(self) -> "List[str]":
         invalid_definitions: List[str] = []
@@ -365,6 +508,7 @@ class ExcelDefinition:
             "FilterOutStoryWithoutId".lower(),
             "RetrieveJiraInformation".lower(),
             "FilterOutStoryBasedOnJiraStatus".lower(),
+            "UpdateJiraInformation".lower(),
         ]
 
         # Validate PreProcessSteps
@@ -418,6 +562,23 @@ class ExcelDefinition:
                     )
                 continue
 
+            # Validate UpdateJiraInformation
+            if (
+                pre_process_step.name.lower() == "UpdateJiraInformation".lower()
+                and pre_process_step.enabled
+            ):
+                retrieve_jira_info_step = self.get_pre_process_step_by_name(
+                    "RetrieveJiraInformation"
+                )
+                if (
+                    retrieve_jira_info_step is None
+                    or retrieve_jira_info_step.priority >= pre_process_step.priority
+                ):
+                    invalid_definitions.append(
+                        "The step named RetrieveJiraInformation must be processed before UpdateJiraInformation."
+                    )
+                continue
+
             if (
                 pre_process_step.priority is None
                 or not isinstance(pre_process_step.priority, int)
@@ -450,6 +611,19 @@ class ExcelDefinition:
                         f"The format of the Jira Statuses is invalid. PreProcessStep: {pre_process_step.name}. Supported format like: ['CLOSED', 'PENDING RELEASE']."
                     )
 
+            if pre_process_step.config is not None and dict_has_key(
+                pre_process_step.config, "Incremental"
+            ):
+                if pre_process_step.name.lower() != "RetrieveJiraInformation".lower():
+                    invalid_definitions.append(
+                        f"Only RetrieveJiraInformation step support Incremental config. PreProcessStep: {pre_process_step.name}."
+                    )
+
+                if not isinstance(pre_process_step.get_config("Incremental"), bool):
+                    invalid_definitions.append(
+                        f"The format of the Incremental is invalid. PreProcessStep: {pre_process_step.name}. Supported format like: true/false."
+                    )
+
         return invalid_definitions
 
     def __validate_sort_strategies(self) -> "List[str]":
@@ -524,6 +698,8 @@ class ExcelDefinition:
             column_jira_field_mapping: Optional[
                 ExcelDefinitionColumnJiraFieldMapping
             ] = column["jira_field_mapping"]
+            column_query_jira_info: bool = column["query_jira_info"]
+            column_update_jira_info: bool = column["update_jira_info"]
 
             # Check Name cannot be empty
             if len(column_name) == 0:
@@ -632,6 +808,21 @@ class ExcelDefinition:
                         f"Column do not support Scope Raise Ranking feature. Column: {column_name}"
                     )
 
+            # Check UpdateJiraInfo
+            if column_update_jira_info is True:
+                if column_jira_field_mapping is None:
+                    invalid_definitions.append(
+                        f"Update Jira Info requires the Jira Field Mapping. Column: {column_name}"
+                    )
+                if column_query_jira_info is True:
+                    invalid_definitions.append(
+                        f"Query Jira Info and Update Jira Info cannot be both enabled. Column: {column_name}"
+                    )
+                if column_type not in (str, float):
+                    invalid_definitions.append(
+                        f"Column do not support Update Jira Info. Currently only str and number type support. Column: {column_name}"
+                    )
+
             if column_jira_field_mapping is None:
                 continue
             if column_jira_field_mapping is not None and not isinstance(
@@ -6,19 +6,19 @@ import pathlib
 import warnings
 from os import remove
 from pathlib import Path
-from typing import List, Optional, Tuple, TypedDict, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import openpyxl
-from openpyxl.cell.cell import Cell, MergedCell
-from openpyxl.cell.read_only import EmptyCell
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.worksheet import Worksheet
 from urllib3 import disable_warnings
 
 from .excel_definition import ExcelDefinition, ExcelDefinitionColumn
+from .milestone import Milestone
 from .sprint_schedule import SprintScheduleStore
-from .story import Story, StoryFactory
+from .story import Story, StoryFactory, format_property_value, get_value_converter
 from .utils import is_absolute_path_valid, standardize_column_name
 
 __all__ = ["read_excel_file", "output_to_excel_file"]
@@ -76,103 +76,44 @@ def read_excel_file(
 
             sheet: Union[Worksheet, ReadOnlyWorksheet] = work_book.active
 
-            column_count = sheet.max_column
-            if column_count is None:
-                column_count = excel_definition.max_column_index
-
             if sheet.max_row is not None and sheet.max_row < 2:
                 return [], []
 
-            actual_excel_columns: List[str] = []
-            actual_column_names: List[str] = []
-            for column_index in range(1, column_count + 1):
-                column_value = str(
-                    sheet.cell(row=1, column=column_index).value  # type: ignore[misc]
+            # The sheets which are written in write-only mode are unsized,
+            # so the whole header row will be read and the trailing empty
+            # cells will be dropped.
+            header: List[Any] = list(
+                next(
+                    sheet.iter_rows(  # type: ignore[misc]
+                        min_row=1, max_row=1, max_col=sheet.max_column, values_only=True
+                    ),
+                    (),
                 )
-                if column_value is None or not str(column_value):
-                    raise ValueError("The input excel file has invalid/empty column.")
-                actual_excel_columns.append(column_value)
-                if standardize_column_name(column_value) in actual_column_names:
-                    raise ValueError(
-                        f"""The input excel file has duplicate column.
-Column name: {column_value}."""
-                    )
-                actual_column_names.append(standardize_column_name(column_value))
+            )
+            if sheet.max_column is None:
+                while header and header[-1] is None:
+                    header.pop()
+            actual_excel_columns: List[str] = [str(value) for value in header]
 
-            stories: List[Story] = []
+            story_factory = StoryFactory(excel_definition.get_columns())
+            row_decoder = _RowDecoder(actual_excel_columns, story_factory)
 
-            defined_excel_columns = excel_definition.get_columns()
-
-            class _DefinedColumn(TypedDict):
-                finded: bool
-                name: str
-                self: ExcelDefinitionColumn
-
-            defined_columns: List[_DefinedColumn] = [
-                {
-                    "finded": False,
-                    "name": standardize_column_name(i["name"]),
-                    "self": i,
-                }
-                for i in defined_excel_columns
-            ]
-            story_factory = StoryFactory(defined_excel_columns)
-
-            for row in sheet.iter_rows(  # type: ignore[misc]
-                min_row=2,
-                max_row=sheet.max_row,
-                min_col=1,
-                max_col=len(actual_excel_columns),
+            stories: List[Story] = []
+            for row_number, row in enumerate(
+                sheet.iter_rows(  # type: ignore[misc]
+                    min_row=2,
+                    max_row=sheet.max_row,
+                    min_col=1,
+                    max_col=len(actual_excel_columns),
+                    values_only=True,
+                ),
+                start=2,
             ):
                 if __should_skip(row):
                     continue
 
-                story: Story = story_factory.create_story()
-                story.excel_row_index = __extract_row_number(row)
-                actual_column_values: List[Cell | MergedCell] = list(row)
-
-                for actual_column_index, actual_column_name in enumerate(
-                    actual_column_names
-                ):
-                    if not actual_column_name:
-                        continue
-                    finded = False
-                    for finded_defined_excel_column in defined_columns:
-                        if finded_defined_excel_column[
-                            "name"
-                        ] == standardize_column_name(actual_column_name):
-                            finded_defined_excel_column["finded"] = True
-                            story.set_value(
-                                finded_defined_excel_column["self"]["type"],
-                                actual_column_name,
-                                actual_column_values[actual_column_index].value,
-                            )
-                            finded = True
-                            break
-                    if not finded:
-                        story.set_value(
-                            str,
-                            actual_column_name,
-                            actual_column_values[actual_column_index].value,
-                        )
-                not_finded_defined_excel_column_names = [
-                    i["self"]["name"] for i in defined_columns if i["finded"] is False
-                ]
-                if not_finded_defined_excel_column_names:
-                    missing_msg = "\n".join(
-                        [
-                            f"{index + 1}.{name}"
-                            for index, name in enumerate(
-                                not_finded_defined_excel_column_names
-                            )
-                        ]
-                    )
-                    raise ValueError(f"Following columns are missing:\n{missing_msg}.")
-
-                for item in defined_columns:
-                    item["finded"] = False
-
-                story.calc_sprint_schedule(sprint_schedule)
+                story = row_decoder.decode(row, sprint_schedule)
+                story.excel_row_index = row_number
                 stories.append(story)
         raw_file.close()
     finally:
@@ -181,24 +122,80 @@ Column name: {column_value}."""
     return actual_excel_columns, stories
 
 
-def __should_skip(row: Tuple[Cell | MergedCell, ...]) -> bool:
-    is_all_cell_empty = True
-    for cell in row:
-        if (
-            cell
-            and not isinstance(cell, EmptyCell)
-            and cell.value is not None
-            and str(cell.value).strip()
-        ):
-            is_all_cell_empty = False
-    return is_all_cell_empty
+class _RowDecoder:
+    """
+    Resolve the Excel header once and decode each row based on it.
+
+    Every column of the sheet is bound to the story property and the converter
+    defined in the :py:class:`ExcelDefinition`. The columns which are not in
+    the definition will be kept as raw values.
+    """
+
+    def __init__(self, actual_excel_columns: List[str], story_factory: StoryFactory):
+        self.__story_factory = story_factory
+        # (column position, slot index, converter)
+        self.__column_decoders: List[Tuple[int, int, Callable[[Any], Any]]] = []
+        self.__milestone_slot_indexes: List[int] = []
+
+        defined_columns: Dict[str, ExcelDefinitionColumn] = {
+            standardize_column_name(column["name"]): column
+            for column in story_factory.columns
+        }
+
+        actual_column_names: Set[str] = set()
+        for column_position, column_value in enumerate(actual_excel_columns):
+            if column_value is None or not str(column_value):
+                raise ValueError("The input excel file has invalid/empty column.")
+            column_name = standardize_column_name(column_value)
+            if column_name in actual_column_names:
+                raise ValueError(
+                    f"""The input excel file has duplicate column.
+Column name: {column_value}."""
+                )
+            actual_column_names.add(column_name)
+            if not column_name:
+                continue
+
+            defined_column = defined_columns.get(column_name, None)
+            column_type = str if defined_column is None else defined_column["type"]
+            slot_index = story_factory.assign_slot(column_name)
+            self.__column_decoders.append(
+                (column_position, slot_index, get_value_converter(column_type))
+            )
+            if column_type is Milestone:
+                self.__milestone_slot_indexes.append(slot_index)
+
+        not_finded_defined_excel_column_names = [
+            column["name"]
+            for name, column in defined_columns.items()
+            if name not in actual_column_names
+        ]
+        if not_finded_defined_excel_column_names:
+            missing_msg = "\n".join(
+                [
+                    f"{index + 1}.{name}"
+                    for index, name in enumerate(not_finded_defined_excel_column_names)
+                ]
+            )
+            raise ValueError(f"Following columns are missing:\n{missing_msg}.")
+
+    def decode(
+        self, row: Tuple[Any, ...], sprint_schedule: SprintScheduleStore
+    ) -> Story:
+        # Every slot of the factory is bound to one of the columns.
+        values: List[Any] = [None] * self.__story_factory.slot_count
+        for column_position, slot_index, converter in self.__column_decoders:
+            values[slot_index] = converter(row[column_position])
+        for slot_index in self.__milestone_slot_indexes:
+            values[slot_index].calc_priority(sprint_schedule)
+        return self.__story_factory.create_story(values)
 
 
-def __extract_row_number(row: Tuple[Cell | MergedCell, ...]) -> int:
-    for cell in row:
-        if cell and not isinstance(cell, (EmptyCell, MergedCell)):
-            return int(cell.row)
-    return 0
+def __should_skip(row: Tuple[Any, ...]) -> bool:
+    for value in row:
+        if value is not None and str(value).strip():
+            return False
+    return True
 
 
 def output_to_excel_file(
@@ -206,6 +203,7 @@ def output_to_excel_file(
     stories: "List[Story]",
     excel_column_names: List[str],
     over_write: bool = True,
+    streaming: bool = False,
 ):
     """
     Generate Excel file
@@ -222,6 +220,10 @@ def output_to_excel_file(
 
     parm over_write:
         Whether the exist output file will be over-write.
+
+    parm streaming:
+        Whether to use the write-only worksheet which appends the rows one by
+        one instead of keeping every cell in memory.
     """
     if file is None or not pathlib.Path(file).is_absolute():
         raise ValueError("The output file path is invalid.")
@@ -237,29 +239,31 @@ def output_to_excel_file(
         else:
             raise FileExistsError(f"The output excel file: {file} is already exist.")
 
-    work_book = openpyxl.Workbook(write_only=False)
+    work_book = openpyxl.Workbook(write_only=streaming)
 
-    if work_book.active is None or (
-        not isinstance(work_book.active, Worksheet)
-        and not isinstance(work_book.active, Worksheet)
-    ):
-        work_book.close()
-        raise ValueError("The output excel file cannot be generated.")
-
-    sheet: Worksheet = work_book.active
-
-    for column_index, column_name in enumerate(excel_column_names):
-        cell = sheet.cell(row=1, column=column_index + 1)
-        # There are three kinds of Cells. Only the Cell has the value attribute.
-        if hasattr(cell, "value"):
-            setattr(cell, "value", column_name)
+    sheet: Union[Worksheet, WriteOnlyWorksheet]
+    if streaming:
+        sheet = work_book.create_sheet()
+    else:
+        if work_book.active is None or not isinstance(work_book.active, Worksheet):
+            work_book.close()
+            raise ValueError("The output excel file cannot be generated.")
+        sheet = work_book.active
 
-    if stories:
-        for row_index, story in enumerate(stories):
-            for column_index, column_name in enumerate(excel_column_names):
-                cell = sheet.cell(row=row_index + 2, column=column_index + 1)
-                if hasattr(cell, "value"):
-                    setattr(cell, "value", story.format_value(column_name))
+    sheet.append(excel_column_names)
+    for row in __generate_rows(stories, excel_column_names):
+        sheet.append(row)
 
     work_book.save(str(file))
     work_book.close()
+
+
+def __generate_rows(
+    stories: "List[Story]", excel_column_names: List[str]
+) -> Iterator[List[str]]:
+    property_names = [standardize_column_name(name) for name in excel_column_names]
+    for story in stories or []:
+        yield [
+            format_property_value(getattr(story, property_name, None))
+            for property_name in property_names
+        ]
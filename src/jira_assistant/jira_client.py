@@ -4,15 +4,43 @@ This module is used to store excel column definition information.
 """
 import pathlib
 import warnings
-from json import loads
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from json import dumps, loads
+from math import ceil
+from time import time
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from jira import JIRA, Issue, JIRAError
 from termcolor import cprint
 from typing_extensions import NotRequired, Required, Self
 from urllib3 import disable_warnings
 
-from .utils import dict_has_key, strip_lower
+from .jira_metadata_cache import JiraMetadataCache, JiraStoryCache
+from .jira_search import (
+    IssueFieldsExtractor,
+    SearchedIssue,
+    get_next_search_page_params,
+    iter_search_result_issues,
+)
+from .jira_transport import (
+    JiraRequestCounters,
+    JiraTransportConfig,
+    configure_jira_session,
+    get_host_rate_limiter,
+)
+from .profiler import Profiler
+from .utils import strip_lower
 
 # Currently, the openpyxl package will report an obsolete warning.
 warnings.simplefilter(action="ignore", category=UserWarning)
@@ -83,19 +111,55 @@ class JiraFieldTypeDefinition:
         self.__array_item_type = value
 
 
-_jira_field_types: List[JiraFieldTypeDefinition] = []
-_current_jira_field_types_file_path: pathlib.Path = DEFAULT_JIRA_FIELD_TYPE_FILE
+class JiraFieldPropertyPathDefinition(TypedDict):
+    path: Required[str]
+    is_array: Required[bool]
 
 
-def __init_jira_field_types(jira_field_type_file: Optional[pathlib.Path]):
-    if not _jira_field_types or (
-        jira_field_type_file is not None
-        and not _current_jira_field_types_file_path.samefile(jira_field_type_file)
-    ):
-        if jira_field_type_file is None:
-            jira_field_type_file = DEFAULT_JIRA_FIELD_TYPE_FILE
-        for i in loads(s=jira_field_type_file.read_text(encoding="utf-8")):
-            _jira_field_types.append(__parse_json_to_jira_field_type_definition(i))
+class _JiraFieldTypeIndex(TypedDict):
+    # Field type in lower case -> definition.
+    types: Dict[str, JiraFieldTypeDefinition]
+    # Field type in lower case -> the property paths relative to the field.
+    paths: Dict[str, List[JiraFieldPropertyPathDefinition]]
+
+
+# Resolved jira field type file -> the field types in it.
+_jira_field_type_indexes: Dict[pathlib.Path, _JiraFieldTypeIndex] = {}
+
+
+def __get_jira_field_type_index(
+    jira_field_type_file: Optional[pathlib.Path], reload: bool = False
+) -> _JiraFieldTypeIndex:
+    if jira_field_type_file is None:
+        # It has been resolved.
+        jira_field_type_file = DEFAULT_JIRA_FIELD_TYPE_FILE
+    else:
+        jira_field_type_file = jira_field_type_file.resolve()
+    index = _jira_field_type_indexes.get(jira_field_type_file, None)
+    if index is not None and not reload:
+        return index
+    # Parse the whole file before it is visible, so the concurrent lookups
+    # use either the old index or the new one.
+    index = {"types": {}, "paths": {}}
+    for i in loads(s=jira_field_type_file.read_text(encoding="utf-8")):
+        definition = __parse_json_to_jira_field_type_definition(i)
+        if definition.type_ is not None:
+            # The first definition of the same type is used.
+            index["types"].setdefault(definition.type_.lower(), definition)
+    if reload:
+        _jira_field_type_indexes[jira_field_type_file] = index
+        return index
+    return _jira_field_type_indexes.setdefault(jira_field_type_file, index)
+
+
+def reload_jira_field_types(jira_field_type_file: Optional[pathlib.Path] = None):
+    """
+    Parse the jira field type file again, for example, it has been changed.
+
+    parm jira_field_type_file:
+        The default file will be reloaded if it is not set.
+    """
+    __get_jira_field_type_index(jira_field_type_file, reload=True)
 
 
 def __parse_json_to_jira_field_type_definition(raw: Any) -> JiraFieldTypeDefinition:
@@ -123,19 +187,8 @@ def get_jira_field(
 ) -> Optional[JiraFieldTypeDefinition]:
     if field_type is None or len(field_type.strip()) == 0:
         return None
-    __init_jira_field_types(jira_field_type_file)
-    for jira_field_type in _jira_field_types:
-        if (
-            jira_field_type.type_ is not None
-            and jira_field_type.type_.lower() == field_type.lower()
-        ):
-            return jira_field_type
-    return None
-
-
-class JiraFieldPropertyPathDefinition(TypedDict):
-    path: Required[str]
-    is_array: Required[bool]
+    index = __get_jira_field_type_index(jira_field_type_file)
+    return index["types"].get(field_type.lower(), None)
 
 
 def get_field_paths_of_jira_field(
@@ -143,31 +196,45 @@ def get_field_paths_of_jira_field(
     field_property_name: str,
     jira_field_type_file: Optional[pathlib.Path] = None,
 ) -> Optional[List[JiraFieldPropertyPathDefinition]]:
-    jira_field = get_jira_field(field_type, jira_field_type_file)
+    index = __get_jira_field_type_index(jira_field_type_file)
+    jira_field = index["types"].get(field_type.lower(), None)
     if jira_field is None:
         return None
+    # The paths are resolved once per field type, because every custom field
+    # has its own property name.
+    relative_paths = index["paths"].get(field_type.lower(), None)
+    if relative_paths is None:
+        relative_paths = __resolve_field_paths_of_jira_field(index, jira_field)
+        index["paths"][field_type.lower()] = relative_paths
+    return [
+        JiraFieldPropertyPathDefinition(
+            path=connect_jira_field_path(field_property_name, item["path"]),
+            is_array=item["is_array"],
+        )
+        for item in relative_paths
+    ]
+
+
+def __resolve_field_paths_of_jira_field(
+    index: _JiraFieldTypeIndex, jira_field: JiraFieldTypeDefinition
+) -> List[JiraFieldPropertyPathDefinition]:
     if jira_field.is_basic is True:
-        return [
-            JiraFieldPropertyPathDefinition(path=field_property_name, is_array=False)
-        ]
+        return [JiraFieldPropertyPathDefinition(path="", is_array=False)]
     result: List[JiraFieldPropertyPathDefinition] = []
     is_array_item = jira_field.array_item_type is not None
-    # Following code will use the same jira field type file, so no need to pass.
+    # The child types are defined in the same jira field type file.
     __internal_get_field_paths_of_jira_field(
+        index,
         jira_field,
         is_array_item,
-        [
-            JiraFieldPropertyPathDefinition(
-                path=field_property_name,
-                is_array=is_array_item,
-            )
-        ],
+        [JiraFieldPropertyPathDefinition(path="", is_array=is_array_item)],
         result,
     )
     return result
 
 
 def __internal_get_field_paths_of_jira_field(
+    index: _JiraFieldTypeIndex,
     jira_field: Optional[JiraFieldTypeDefinition],
     is_array_item: bool,
     temp: List[JiraFieldPropertyPathDefinition],
@@ -186,7 +253,11 @@ def __internal_get_field_paths_of_jira_field(
         temp.clear()
     if jira_field.array_item_type is not None:
         __internal_get_field_paths_of_jira_field(
-            get_jira_field(jira_field.array_item_type), True, temp, final
+            index,
+            index["types"].get(jira_field.array_item_type.lower(), None),
+            True,
+            temp,
+            final,
         )
     if jira_field.properties is not None:
         for field_property in jira_field.properties:
@@ -196,14 +267,15 @@ def __internal_get_field_paths_of_jira_field(
                         item["path"], field_property.name
                     )
                 __internal_get_field_paths_of_jira_field(
-                    get_jira_field(field_property.array_item_type),
+                    index,
+                    index["types"].get(field_property.array_item_type.lower(), None),
                     True,
                     temp,
                     final,
                 )
             if field_property.type_ is None:
                 continue
-            child_field = get_jira_field(field_property.type_)
+            child_field = index["types"].get(field_property.type_.lower(), None)
             if child_field is None:
                 continue
             if child_field.is_basic:
@@ -218,6 +290,7 @@ def __internal_get_field_paths_of_jira_field(
                     )
             else:
                 __internal_get_field_paths_of_jira_field(
+                    index,
                     child_field,
                     is_array_item,
                     [
@@ -310,6 +383,13 @@ class JiraField:
             self.__allowed_values = allowed_values
         else:
             self.__allowed_values = {}
+        # The lists keep the original order for the messages,
+        # the sets are used to validate the values.
+        self.__allowed_value_sets: Dict[str, FrozenSet[str]] = {
+            path: frozenset(values) for path, values in self.__allowed_values.items()
+        }
+        # Only built for the paths which are validated ignoring the case.
+        self.__casefolded_allowed_value_sets: Dict[str, FrozenSet[str]] = {}
 
     @property
     def required(self) -> bool:
@@ -347,16 +427,64 @@ class JiraField:
     def allowed_values(self) -> Dict[str, List[str]]:
         return self.__allowed_values
 
-    def is_value_allowed(self, value: Optional[str], jira_field_path: str) -> bool:
-        if (
-            self.__allowed_values.get(jira_field_path, None) is not None
-            and value not in self.__allowed_values[jira_field_path]
-        ):
-            return False
-        return True
+    def is_value_allowed(
+        self, value: Optional[str], jira_field_path: str, ignore_case: bool = False
+    ) -> bool:
+        """
+        parm value:
+            The value which needs to be validated.
+
+        parm jira_field_path:
+            The path of the property, for example: component.name
+
+        parm ignore_case:
+            Whether to compare the case-folded values.
+
+        return
+            True if the property doesn't limit the values.
+        """
+        allowed_values = self.__allowed_value_sets.get(jira_field_path, None)
+        if allowed_values is None:
+            return True
+        if ignore_case:
+            casefolded_allowed_values = self.__casefolded_allowed_value_sets.get(
+                jira_field_path, None
+            )
+            if casefolded_allowed_values is None:
+                casefolded_allowed_values = frozenset(
+                    allowed_value.casefold() for allowed_value in allowed_values
+                )
+                self.__casefolded_allowed_value_sets[
+                    jira_field_path
+                ] = casefolded_allowed_values
+            return value is not None and value.casefold() in casefolded_allowed_values
+        return value in allowed_values
 
 
 _DEFAULT_JIRA_TIMEOUT = 60.0
+_DEFAULT_JIRA_MAX_WORKERS = 4
+_JIRA_SEARCH_BATCH_SIZE = 200
+# The default limit of the Jira bulk create API.
+_JIRA_BULK_CREATE_BATCH_SIZE = 50
+# The bulk create API is not supported by the Jira host. The stories may have
+# been created for the other errors, so they won't be created again.
+_JIRA_BULK_CREATE_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
+
+class JiraCreateStoryResult(TypedDict):
+    issue: Optional[Issue]
+    error: Optional[str]
+
+
+_PROJECTS_CACHE_KEY = "projects"
+
+
+def _get_issue_types_cache_key(project_id: int) -> str:
+    return f"issue_types/{project_id}"
+
+
+def _get_fields_cache_key(project_id: int, issue_id: int) -> str:
+    return f"fields/{project_id}/{issue_id}"
 
 
 # Jira are case-sensitive APIs.
@@ -367,7 +495,31 @@ class JiraClient:
         access_token: str,
         user_email: Optional[str] = None,
         timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        metadata_cache: Optional[JiraMetadataCache] = None,
+        transport_config: Optional[JiraTransportConfig] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
+        """
+        parm max_workers:
+            How many search/update requests can be sent at the same time.
+
+        parm requests_per_second:
+            The limit of the requests per second to the Jira host. No limit if
+            it is not set until the requests are throttled by the Jira host.
+
+        parm metadata_cache:
+            The persistent cache of the projects, issue types and fields.
+            The metadata will be downloaded every time if it is not set.
+
+        parm transport_config:
+            The connection pool size and the retry policy of the requests.
+
+        parm profiler:
+            Record the endpoint, the latency, the payload size and the outcome
+            of the requests to the Jira host.
+        """
         self.__is_jira_cloud = is_jira_cloud_url(url)
         # Authentication/Authorization
         # https://developer.atlassian.com/cloud/jira/software/basic-auth-for-rest-apis/
@@ -391,10 +543,29 @@ class JiraClient:
 
         # TODO: Fix this hack later.
         self.jira.deploymentType = ()
+        if max_workers is None:
+            max_workers = _DEFAULT_JIRA_MAX_WORKERS
+        self.__max_workers = max(max_workers, 1)
+        self.__retrying_request = configure_jira_session(
+            self.jira._session,  # pylint: disable=protected-access
+            get_host_rate_limiter(url, requests_per_second),
+            transport_config or {},
+            default_pool_size=self.__max_workers,
+            profiler=profiler,
+        )
+        # Some Jira websites return less issues than requested in one page.
+        self.__search_batch_size = _JIRA_SEARCH_BATCH_SIZE
+        self.__metadata_cache = metadata_cache
+        # Some Jira websites reject the bulk create API.
+        self.__bulk_create_supported = True
         self.__field_cache: Dict[
             str, Dict[str, Optional[List[JiraFieldPropertyPathDefinition]]]
         ] = {}
+        # The ids of the fields of which the value is an array, like labels.
+        self.__array_field_ids: Optional[FrozenSet[str]] = None
         self.__project_map: Dict[str, JiraProject] = {}
+        # The cached project list may not contain the new projects.
+        self.__projects_loaded_from_metadata_cache = False
         # The dict key is project_name
         self.__project_issue_map_using_name: Dict[str, List[JiraIssueType]] = {}
         # The dict key is project_id
@@ -402,6 +573,14 @@ class JiraClient:
         # The dict key is: (project_id, issue_id).
         self.__project_issue_field_map: Dict[Tuple[int, int], List[JiraField]] = {}
 
+    @property
+    def request_counters(self) -> JiraRequestCounters:
+        """
+        How many requests have been sent, throttled by the Jira host and
+        retried by this client.
+        """
+        return self.__retrying_request.counters
+
     def health_check(self) -> bool:
         try:
             if self.jira.myself() is not None:
@@ -411,17 +590,149 @@ class JiraClient:
             return False
 
     def create_story(self, fields: Dict[str, Any]) -> "Optional[Issue]":
+        result = self.__create_issue(convert_fields_to_create_issue_body(fields))
+        if result["error"] is not None:
+            cprint(
+                f"Calling create story API failed. {result['error']}",
+                color="light_yellow",
+            )
+        return result["issue"]
+
+    def create_stories(
+        self, fields_list: List[Dict[str, Any]]
+    ) -> "List[JiraCreateStoryResult]":
+        """
+        Create the stories in batches by using the bulk create API. If the
+        API is not supported by the Jira host, the stories will be created one
+        by one concurrently. If the bulk creation of a batch fails for other
+        reasons, the stories of the batch won't be created again, because
+        some of them may have been created.
+
+        parm fields_list:
+            The fields of each story
+
+        return
+            The created issue or the error message of each story, in the same
+            order as the fields_list.
+        """
+        results: List[JiraCreateStoryResult] = []
+        for begin in range(0, len(fields_list), _JIRA_BULK_CREATE_BATCH_SIZE):
+            create_issue_bodies = [
+                convert_fields_to_create_issue_body(fields)
+                for fields in fields_list[begin: begin + _JIRA_BULK_CREATE_BATCH_SIZE]
+            ]
+            if self.__bulk_create_supported:
+                try:
+                    results.extend(self.__create_issues_in_bulk(create_issue_bodies))
+                    continue
+                except JIRAError as e:
+                    if e.status_code not in _JIRA_BULK_CREATE_UNSUPPORTED_STATUS_CODES:
+                        error = self.__extract_error_message(e)
+                        results.extend(
+                            {"issue": None, "error": error}
+                            for _ in create_issue_bodies
+                        )
+                        continue
+                    self.__bulk_create_supported = False
+                    cprint(
+                        f"Calling bulk create API failed, the stories will be created one by one. {self.__extract_error_message(e)}",  # pylint: disable=line-too-long
+                        color="light_yellow",
+                    )
+            results.extend(self.__create_issues_concurrently(create_issue_bodies))
+        return results
+
+    def __create_issues_in_bulk(
+        self, create_issue_bodies: List[Dict[str, Any]]
+    ) -> "List[JiraCreateStoryResult]":
         try:
-            create_issue_body = convert_fields_to_create_issue_body(fields)
-            return self.jira.create_issue(
-                fields=create_issue_body,
-                prefetch=False,
+            items = self.jira.create_issues(
+                field_list=create_issue_bodies, prefetch=False
             )
+        except (KeyError, TypeError, ValueError) as e:
+            # The error response doesn't contain the errors of each issue,
+            # for example, a 400 response without the errors array.
+            return [
+                {"issue": None, "error": f"Unexpected response. {e!r}"}
+                for _ in create_issue_bodies
+            ]
+        results: List[JiraCreateStoryResult] = []
+        for item in items:
+            if item["status"] == "Success":
+                results.append({"issue": item["issue"], "error": None})
+                continue
+            errors: Dict[str, Any] = item["error"] or {}
+            results.append(
+                {
+                    "issue": None,
+                    "error": "|".join([f"{k}: {v}" for k, v in errors.items()])
+                    or "Unknown error.",
+                }
+            )
+        return results
+
+    def __create_issues_concurrently(
+        self, create_issue_bodies: List[Dict[str, Any]]
+    ) -> "List[JiraCreateStoryResult]":
+        if len(create_issue_bodies) <= 1:
+            return [self.__create_issue(body) for body in create_issue_bodies]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.__max_workers, len(create_issue_bodies))
+        ) as executor:
+            return list(executor.map(self.__create_issue, create_issue_bodies))
+
+    def __create_issue(
+        self, create_issue_body: Dict[str, Any]
+    ) -> "JiraCreateStoryResult":
+        try:
+            return {
+                "issue": self.jira.create_issue(
+                    fields=create_issue_body,
+                    prefetch=False,
+                ),
+                "error": None,
+            }
         except JIRAError as e:
-            cprint(
-                f"Calling create story API failed. {self.__extract_error_message(e)}",
-                color="light_yellow",
+            return {"issue": None, "error": self.__extract_error_message(e)}
+
+    def update_stories(
+        self, fields_by_story_id: Dict[str, Dict[str, Any]]
+    ) -> "Dict[str, Optional[str]]":
+        """
+        Update the fields of the stories concurrently, one request per story.
+
+        parm fields_by_story_id:
+            The story id -> the fields which need to be updated.
+
+        return
+            The story id -> the error message, None means success.
+        """
+        story_ids = list(fields_by_story_id.keys())
+        if not story_ids:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.__max_workers, len(story_ids))
+        ) as executor:
+            errors = list(
+                executor.map(
+                    self.__update_issue,
+                    story_ids,
+                    [fields_by_story_id[story_id] for story_id in story_ids],
+                )
             )
+        return dict(zip(story_ids, errors))
+
+    def __update_issue(self, story_id: str, fields: Dict[str, Any]) -> "Optional[str]":
+        try:
+            # The jira package can only update the issue which has been
+            # retrieved, so the edit API is called directly.
+            self.jira._session.put(  # pylint: disable=protected-access
+                self.jira._get_url(f"issue/{story_id}"),  # pylint: disable=protected-access
+                data=dumps({"fields": convert_fields_to_create_issue_body(fields)}),
+            )
+        except JIRAError as e:
+            return self.__extract_error_message(e)
         return None
 
     def get_jira_browser_link(self, key: str) -> "str":
@@ -432,14 +743,30 @@ class JiraClient:
         result = self.__project_map.get(project_name, None)
         if result is None:
             self.get_projects()
-        return self.__project_map.get(project_name, None)
+            result = self.__project_map.get(project_name, None)
+        if result is None and self.__projects_loaded_from_metadata_cache:
+            # The project may be created after the cache was saved.
+            self.get_projects(force_refresh=True)
+            result = self.__project_map.get(project_name, None)
+        return result
 
     def get_projects(self, force_refresh: bool = False) -> "List[JiraProject]":
+        """
+        Get the project list. The issue types of the projects are loaded
+        lazily, see :py:meth:`prefetch_issue_types`.
+        """
         # Otherwise, if there is no project,
         # still will call API to retrieve project list.
         if self.__project_map and force_refresh is not True:
             return list(self.__project_map.values())
         self.__project_map.clear()
+        self.__project_issue_map_using_name.clear()
+        self.__project_issue_map_using_id.clear()
+        self.__projects_loaded_from_metadata_cache = (
+            force_refresh is not True and self.__load_projects_from_metadata_cache()
+        )
+        if self.__projects_loaded_from_metadata_cache:
+            return list(self.__project_map.values())
         project_response = self.jira.projects()
         for proj in project_response:
             proj_name: Optional[str] = getattr(proj, "key", None)
@@ -448,49 +775,150 @@ class JiraClient:
                 self.__project_map[strip_lower(proj_name)] = JiraProject(
                     proj_id, proj_name
                 )
+        self.__save_projects_to_metadata_cache()
+        return list(self.__project_map.values())
 
-                try:
-                    issue_types: List[JiraIssueType] = []
-
-                    if self.__is_jira_cloud:
-                        get_project_response = self.jira.project(str(proj_id))
-                        issue_types.extend(
-                            [
-                                JiraIssueType(issue_type.id, issue_type.name, proj_id)
-                                for issue_type in get_project_response.issueTypes
-                                if hasattr(issue_type, "id")
-                                and hasattr(issue_type, "name")
-                            ]
-                        )
-                    else:
-                        # loading project related issue types
-                        response = self.jira.project_issue_types(str(proj_id))
-                        issue_types.extend(
-                            [
-                                JiraIssueType(issue_type.id, issue_type.name, proj_id)
-                                for issue_type in response
-                                if hasattr(issue_type, "id")
-                                and hasattr(issue_type, "name")
-                            ]
-                        )
-                    self.__project_issue_map_using_name[strip_lower(proj_name)] = (
-                        issue_types
-                    )
-                    self.__project_issue_map_using_id[proj_id] = issue_types
-                except JIRAError as e:
-                    cprint(
-                        f"""Get issue types failed. Project: {proj_name}. {self.__extract_error_message(e)}""",  # pylint: disable=line-too-long
-                        color="light_yellow",
-                    )
+    def prefetch_issue_types(self, project_names: List[str]):
+        """
+        Load the issue types of the projects concurrently. The projects
+        which issue types have been loaded will be skipped.
+
+        parm project_names:
+            The projects which will be used, for example, the ProjectType
+            values of the stories.
+        """
+        projects: List[JiraProject] = []
+        for project_name in dict.fromkeys(strip_lower(name) for name in project_names):
+            if project_name in self.__project_issue_map_using_name:
+                continue
+            project = self.get_project_by_project_name(project_name)
+            if project is not None:
+                projects.append(project)
+        self.__load_issue_types(projects)
+
+    def __load_issue_types(self, projects: List[JiraProject]):
+        """
+        Fetch the issue types of the projects concurrently and save them to
+        the metadata cache.
+        """
+        if not projects:
+            return
+
+        loaded_projects: List[JiraProject] = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.__max_workers, len(projects))
+        ) as executor:
+            for project, issue_types in zip(
+                projects, executor.map(self.__try_fetch_issue_types, projects)
+            ):
+                if issue_types is None:
                     continue
-        return list(self.__project_map.values())
+                self.__project_issue_map_using_name[strip_lower(project.name)] = (
+                    issue_types
+                )
+                self.__project_issue_map_using_id[project.id_] = issue_types
+                loaded_projects.append(project)
+        self.__save_issue_types_to_metadata_cache(loaded_projects)
+
+    def __try_fetch_issue_types(
+        self, project: JiraProject
+    ) -> "Optional[List[JiraIssueType]]":
+        try:
+            return self.__fetch_issue_types(project.id_)
+        except JIRAError as e:
+            cprint(
+                f"""Get issue types failed. Project: {project.name}. {self.__extract_error_message(e)}""",  # pylint: disable=line-too-long
+                color="light_yellow",
+            )
+            return None
+
+    def __fetch_issue_types(self, project_id: int) -> "List[JiraIssueType]":
+        if self.__is_jira_cloud:
+            issue_types = self.jira.project(str(project_id)).issueTypes
+        else:
+            # loading project related issue types
+            issue_types = self.jira.project_issue_types(str(project_id))
+        return [
+            JiraIssueType(issue_type.id, issue_type.name, project_id)
+            for issue_type in issue_types
+            if hasattr(issue_type, "id") and hasattr(issue_type, "name")
+        ]
+
+    def __load_projects_from_metadata_cache(self) -> bool:
+        if self.__metadata_cache is None:
+            return False
+        cached_projects = self.__metadata_cache.get(_PROJECTS_CACHE_KEY)
+        if not cached_projects:
+            return False
+        for cached_project in cached_projects:
+            proj_id = cached_project["id"]
+            proj_name = cached_project["name"]
+            self.__project_map[strip_lower(proj_name)] = JiraProject(
+                proj_id, proj_name
+            )
+            # The issue types are cached separately, so adding them doesn't
+            # renew the project list.
+            cached_issue_types = self.__metadata_cache.get(
+                _get_issue_types_cache_key(proj_id)
+            )
+            # The issue types of the project haven't been loaded.
+            if cached_issue_types is None:
+                continue
+            issue_types = [
+                JiraIssueType(issue_type["id"], issue_type["name"], proj_id)
+                for issue_type in cached_issue_types
+            ]
+            self.__project_issue_map_using_name[strip_lower(proj_name)] = issue_types
+            self.__project_issue_map_using_id[proj_id] = issue_types
+        return True
+
+    def __save_projects_to_metadata_cache(self):
+        if self.__metadata_cache is None or not self.__project_map:
+            return
+        self.__metadata_cache.set(
+            _PROJECTS_CACHE_KEY,
+            [
+                {"id": project.id_, "name": project.name}
+                for project in self.__project_map.values()
+            ],
+        )
+
+    def __save_issue_types_to_metadata_cache(self, projects: List[JiraProject]):
+        if self.__metadata_cache is None:
+            return
+        self.__metadata_cache.set_many(
+            {
+                _get_issue_types_cache_key(project.id_): [
+                    {"id": issue_type.id_, "name": issue_type.name}
+                    for issue_type in self.__project_issue_map_using_id[project.id_]
+                ]
+                for project in projects
+            }
+        )
+
+    def clear_metadata_cache(self):
+        """
+        Drop the projects, issue types and fields which have been loaded
+        and remove the persistent metadata cache.
+        """
+        self.__project_map.clear()
+        self.__project_issue_map_using_name.clear()
+        self.__project_issue_map_using_id.clear()
+        self.__project_issue_field_map.clear()
+        if self.__metadata_cache is not None:
+            self.__metadata_cache.clear()
 
     def get_issue_type_by_project_id_and_issue_name(
         self, project_id: int, issue_name: str
     ) -> "Optional[JiraIssueType]":
+        if project_id not in self.__project_issue_map_using_id:
+            for project in self.get_projects():
+                if project.id_ == project_id:
+                    self.prefetch_issue_types([project.name])
+                    break
         match_result = [
             i
-            for i in self.__project_issue_map_using_id[project_id]
+            for i in self.__project_issue_map_using_id.get(project_id, [])
             if strip_lower(i.name) == strip_lower(issue_name)
         ]
         if match_result:
@@ -501,6 +929,8 @@ class JiraClient:
         self, project_name: str, issue_name: str
     ) -> "Optional[JiraIssueType]":
         project_name = strip_lower(project_name)
+        if project_name not in self.__project_issue_map_using_name:
+            self.prefetch_issue_types([project_name])
         if project_name not in self.__project_issue_map_using_name:
             return None
         match_result = [
@@ -514,9 +944,8 @@ class JiraClient:
 
     def get_issue_types(self, project_name: str) -> "List[JiraIssueType]":
         project_name = strip_lower(project_name)
-        result = self.__project_issue_map_using_name.get(project_name, [])
-        if not result:
-            self.get_project_by_project_name(project_name)
+        if project_name not in self.__project_issue_map_using_name:
+            self.prefetch_issue_types([project_name])
         return self.__project_issue_map_using_name.get(project_name, [])
 
     def get_fields_by_project_id_and_issue_id(
@@ -527,26 +956,23 @@ class JiraClient:
             [],
         )
         if not result:
-            issue_type_ids: List[int] = []
-
-            if self.__is_jira_cloud:
-                project_response = self.jira.project(str(project_id))
-                issue_type_ids.extend(
-                    [
-                        issue_type.id
-                        for issue_type in project_response.issueTypes
-                        if hasattr(issue_type, "id")
-                    ]
-                )
-            else:
-                issue_response = self.jira.project_issue_types(str(project_id))
-                issue_type_ids.extend(
+            result = self.__load_fields_from_metadata_cache(project_id, issue_id)
+        if not result:
+            if project_id not in self.__project_issue_map_using_id:
+                # Like prefetch_issue_types, so they are kept and cached. The
+                # project id is used as the name if it is not in the list.
+                self.__load_issue_types(
                     [
-                        issue_type.id
-                        for issue_type in issue_response
-                        if hasattr(issue_type, "id")
+                        project
+                        for project in self.get_projects()
+                        if project.id_ == project_id
                     ]
+                    or [JiraProject(project_id, str(project_id))]
                 )
+            issue_types = self.__project_issue_map_using_id.get(project_id, [])
+            issue_type_ids: List[int] = [issue_type.id_ for issue_type in issue_types]
+            # The fields of all issue types are saved to the cache file once.
+            loaded_issue_type_ids: List[int] = []
             # Loading all issue types and related fields.
             for issue_type_id in issue_type_ids:
                 # Should be same as issue_name
@@ -569,6 +995,7 @@ class JiraClient:
                                 self.__convert_field_type_to_jira_field(field_type)
                                 for field_type in field_types_cloud["fields"]
                             ]
+                            loaded_issue_type_ids.append(issue_type_id)
                     else:
                         field_types = self.jira.project_issue_fields(
                             str(project_id), str(issue_type_id)
@@ -580,6 +1007,8 @@ class JiraClient:
                                 self.__convert_field_type_to_jira_field(field_type.raw)
                                 for field_type in field_types
                             ]
+                            loaded_issue_type_ids.append(issue_type_id)
+            self.__save_fields_to_metadata_cache(project_id, loaded_issue_type_ids)
         # Try to search again.
         result = self.__project_issue_field_map.get(
             (project_id, issue_id),
@@ -594,17 +1023,51 @@ class JiraClient:
                 not_required_fields.append(item)
         return required_fields, not_required_fields
 
+    def __load_fields_from_metadata_cache(
+        self, project_id: int, issue_id: int
+    ) -> "List[JiraField]":
+        if self.__metadata_cache is None:
+            return []
+        cached_fields = self.__metadata_cache.get(
+            _get_fields_cache_key(project_id, issue_id)
+        )
+        if not cached_fields:
+            return []
+        fields = [
+            JiraField(
+                cached_field["required"],
+                cached_field["is_array"],
+                cached_field["name"],
+                cached_field["id"],
+                cached_field["allowed_values"],
+            )
+            for cached_field in cached_fields
+        ]
+        self.__project_issue_field_map[(project_id, issue_id)] = fields
+        return fields
+
+    def __save_fields_to_metadata_cache(self, project_id: int, issue_ids: List[int]):
+        if self.__metadata_cache is None:
+            return
+        self.__metadata_cache.set_many(
+            {
+                _get_fields_cache_key(project_id, issue_id): [
+                    {
+                        "required": field.required,
+                        "is_array": field.is_array,
+                        "name": field.name,
+                        "id": field.id_,
+                        "allowed_values": field.allowed_values,
+                    }
+                    for field in self.__project_issue_field_map[(project_id, issue_id)]
+                ]
+                for issue_id in issue_ids
+            }
+        )
+
     @staticmethod
     def __convert_field_type_to_jira_field(field_type: Any) -> "JiraField":
-        result: JiraField
-
-        result = JiraField(
-            field_type["required"],
-            field_type["schema"]["type"] == "array",
-            field_type.get("name", ""),
-            field_type.get("fieldId", ""),
-            None,
-        )
+        allowed_values: Dict[str, List[str]] = {}
 
         schema: Dict = field_type.get("schema")
         is_array: bool = "items" in schema
@@ -615,10 +1078,7 @@ class JiraClient:
 
         def __extract_allowed_values(item: Union[str, Dict], pre_key: str):
             if isinstance(item, str):
-                if dict_has_key(result.allowed_values, pre_key):
-                    result.allowed_values[pre_key].append(item)
-                else:
-                    result.allowed_values[pre_key] = [item]
+                allowed_values.setdefault(pre_key, []).append(item)
             if isinstance(item, dict):
                 for _key, _value in item.items():
                     __extract_allowed_values(
@@ -634,107 +1094,414 @@ class JiraClient:
                             value, connect_jira_field_path(value_type, key)
                         )
 
-        return result
+        return JiraField(
+            field_type["required"],
+            field_type["schema"]["type"] == "array",
+            field_type.get("name", ""),
+            field_type.get("fieldId", ""),
+            allowed_values,
+        )
 
     def get_all_fields(
         self,
     ) -> "Dict[str, Dict[str, Optional[List[JiraFieldPropertyPathDefinition]]]]":
         if not self.__field_cache:
-            for field in self.jira.fields():
-                if "schema" not in field.keys():
-                    continue
-
-                temp: Dict[str, Optional[List[JiraFieldPropertyPathDefinition]]] = {
-                    "id": field["id"],
-                }
-
-                class _FieldSchema(TypedDict):
-                    type: str
-                    items: NotRequired[str]
-                    custom: NotRequired[str]
-                    customId: NotRequired[int]
-                    system: NotRequired[str]
-
-                schema: _FieldSchema = field["schema"]
-                property_name = field["id"]
-                is_array = "items" in schema
-                if is_array:
-                    field_type = schema.get("items", None)
-                else:
-                    field_type = schema.get("type", None)
+            for field_name, field in self.iter_all_fields():
+                self.__field_cache[field_name] = field
+        return self.__field_cache
 
-                if field_type is not None:
-                    temp["properties"] = get_field_paths_of_jira_field(
-                        field_type, property_name
-                    )
+    def is_array_field(self, field_id: str) -> bool:
+        """
+        parm field_id:
+            The id of the Jira field, for example: components
+
+        return
+            True if the value of the field is an array.
+        """
+        if self.__array_field_ids is None:
+            self.__array_field_ids = frozenset(
+                field["id"]
+                for field in self.jira.fields()
+                if "items" in field.get("schema", {})
+            )
+        return field_id in self.__array_field_ids
 
-                    self.__field_cache[field["name"]] = temp
-        return self.__field_cache
+    def iter_all_fields(
+        self,
+    ) -> "Iterator[Tuple[str, Dict[str, Optional[List[JiraFieldPropertyPathDefinition]]]]]":  # pylint: disable=line-too-long
+        """
+        Resolve the property paths of the fields one by one, so they can be
+        written out without keeping all of them.
+
+        return
+            An iterator over the field name and the field sorted by the name.
+            The same as :py:meth:`get_all_fields`.
+        """
+        if self.__field_cache:
+            yield from sorted(self.__field_cache.items())
+            return
+
+        class _FieldSchema(TypedDict):
+            type: str
+            items: NotRequired[str]
+            custom: NotRequired[str]
+            customId: NotRequired[int]
+            system: NotRequired[str]
+
+        # The last field of the same name is used.
+        raw_fields: Dict[str, Dict[str, Any]] = {}
+        for field in self.jira.fields():
+            if "schema" not in field.keys():
+                continue
+            schema: _FieldSchema = field["schema"]
+            if schema.get("items" if "items" in schema else "type", None) is None:
+                continue
+            raw_fields[field["name"]] = field
+
+        for field_name in sorted(raw_fields):
+            field = raw_fields[field_name]
+            schema = field["schema"]
+            yield field_name, {
+                "id": field["id"],
+                "properties": get_field_paths_of_jira_field(
+                    schema["items"] if "items" in schema else schema["type"],
+                    field["id"],
+                ),
+            }
 
     def get_stories_detail(
-        self, story_ids: List[str], jira_fields: List[Dict[str, str]]
+        self,
+        story_ids: List[str],
+        jira_fields: List[Dict[str, str]],
+        story_cache: Optional[JiraStoryCache] = None,
     ) -> "Dict[str, Dict[str, str]]":
-        final_result = {}
-        batch_size = 200
-
-        if len(story_ids) > batch_size:
-            start_index = 0
-            end_index = batch_size
-            while end_index <= len(story_ids) and start_index < len(story_ids):
-                final_result.update(
-                    self.__internal_get_stories_detail(
-                        story_ids[start_index:end_index], jira_fields
-                    )
+        """
+        Retrieve the fields of the stories.
+
+        parm story_ids:
+            The story ids
+
+        parm jira_fields:
+            The fields which need to be retrieved
+
+        parm story_cache:
+            If provided, only the stories which are not in the cache or have
+            been updated since they were cached will be retrieved, the others
+            will be served from the cache.
+
+        return
+            The story id in lower case -> fields of the story. The stories
+            which key has been changed are not included.
+        """
+        if story_cache is not None:
+            return self.__get_stories_detail_incrementally(
+                story_ids, jira_fields, story_cache
+            )
+        final_result: Dict[str, Dict[str, str]] = {}
+        # The results are merged in the order of the batches,
+        # so it is the same as the sequential way.
+        for issues in self.__search_issues_in_batches(
+            self.__split_into_batches(story_ids), IssueFieldsExtractor(jira_fields)
+        ):
+            for story_id, fields, _ in issues or []:
+                final_result[story_id] = fields
+        return final_result
+
+    def __get_stories_detail_incrementally(
+        self,
+        story_ids: List[str],
+        jira_fields: List[Dict[str, str]],
+        story_cache: JiraStoryCache,
+    ) -> "Dict[str, Dict[str, str]]":
+        field_paths = [field["jira_path"] for field in jira_fields]
+        cached_stories = story_cache.get_stories(field_paths)
+        # Take the time before searching, so the changes which happen during
+        # the searching will be retrieved next time.
+        synced_at = time()
+
+        requested_story_ids: Set[str] = set()
+        cached_story_ids: List[str] = []
+        uncached_story_ids: List[str] = []
+        for story_id in story_ids:
+            if not story_id or strip_lower(str(story_id)) in requested_story_ids:
+                continue
+            requested_story_ids.add(strip_lower(str(story_id)))
+            if strip_lower(str(story_id)) in cached_stories:
+                cached_story_ids.append(story_id)
+            else:
+                uncached_story_ids.append(story_id)
+
+        final_result = self.get_stories_detail(uncached_story_ids, jira_fields)
+        synced_story_ids = set(final_result.keys())
+        retrieved_story_ids = set(final_result.keys())
+        # The stories which are not returned by the full searching have been
+        # deleted or moved, so they are removed from the cache.
+        removed_story_ids: Set[str] = {
+            strip_lower(str(story_id))
+            for story_id in uncached_story_ids
+            if strip_lower(str(story_id)) not in final_result
+        }
+        moved_story_ids: Set[str] = set()
+        if cached_story_ids:
+            # The relative time is calculated by the Jira server, so neither
+            # the timezone nor the clock of this machine matters. One more
+            # minute is added because JQL only supports the minute precision.
+            oldest_synced_at = min(
+                cached_stories[strip_lower(str(story_id))][0]
+                for story_id in cached_story_ids
+            )
+            minutes = ceil(max(synced_at - oldest_synced_at, 0) / 60) + 1
+            batches = self.__split_into_batches(cached_story_ids)
+            for batch, issues in zip(
+                batches,
+                self.__search_issues_in_batches(
+                    batches,
+                    IssueFieldsExtractor(jira_fields),
+                    expand="changelog",
+                    jql_filter=f'updated >= "-{minutes}m"',
+                ),
+            ):
+                if issues is None:
+                    # Keep serving the cached stories, but don't move the
+                    # watermark, so the changes will be retrieved next time.
+                    continue
+                synced_story_ids.update(
+                    strip_lower(str(story_id)) for story_id in batch
                 )
-                start_index = end_index
-                if start_index + batch_size < len(story_ids):
-                    end_index = start_index + batch_size
-                else:
-                    end_index = start_index + (len(story_ids) - end_index)
-            return final_result
-        return self.__internal_get_stories_detail(story_ids, jira_fields)
+                for story_id, fields, previous_story_ids in issues:
+                    if story_id in requested_story_ids:
+                        final_result[story_id] = fields
+                        retrieved_story_ids.add(story_id)
+                    else:
+                        # The key has been changed, so let the caller
+                        # handle it as a moved story.
+                        moved_story_ids |= requested_story_ids & previous_story_ids
+            for cached_story_id in cached_story_ids:
+                story_id = strip_lower(str(cached_story_id))
+                if story_id not in final_result and story_id not in moved_story_ids:
+                    final_result[story_id] = cached_stories[story_id][1]
+
+        story_cache.save_stories(
+            field_paths,
+            {
+                story_id: fields
+                for story_id, fields in final_result.items()
+                if story_id in requested_story_ids and story_id in synced_story_ids
+            },
+            synced_at,
+            removed_story_ids | moved_story_ids,
+            retrieved_story_ids,
+        )
+        return final_result
 
-    def __internal_get_stories_detail(
+    def get_moved_stories_detail(
         self, story_ids: List[str], jira_fields: List[Dict[str, str]]
-    ) -> "Dict[str, Dict[str, str]]":
+    ) -> "Dict[str, Tuple[str, Dict[str, str]]]":
+        """
+        Find the current key and the detail of the stories which key has been
+        changed, for example, the story has been moved to another project.
+
+        The stories are searched in batches together with their changelog and
+        the previous key is matched by the "Key" change history. Only the
+        stories which cannot be matched in this way will be searched one by
+        one.
+
+        parm story_ids:
+            The previous story ids
+
+        parm jira_fields:
+            The fields which need to be retrieved
+
+        return
+            The previous story id in lower case ->
+            (current story id in lower case, fields of the story)
+        """
+        result: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        unresolved_story_ids: List[str] = []
+        extractor = IssueFieldsExtractor(jira_fields)
+
+        batches = self.__split_into_batches(story_ids)
+        for batch, issues in zip(
+            batches,
+            self.__search_issues_in_batches(batches, extractor, expand="changelog"),
+        ):
+            pending_story_ids = {
+                strip_lower(str(story_id)) for story_id in batch if story_id
+            }
+            unclaimed_stories: List[Tuple[str, Dict[str, str]]] = []
+            for current_story_id, fields, previous_keys in issues or []:
+                previous_story_ids = pending_story_ids & (
+                    {current_story_id} | previous_keys
+                )
+                if not previous_story_ids:
+                    unclaimed_stories.append((current_story_id, fields))
+                for previous_story_id in previous_story_ids:
+                    result[previous_story_id] = (current_story_id, fields)
+                pending_story_ids -= previous_story_ids
+
+            if not pending_story_ids or not unclaimed_stories:
+                continue
+            if len(pending_story_ids) == 1 and len(unclaimed_stories) == 1:
+                result[pending_story_ids.pop()] = unclaimed_stories[0]
+            else:
+                unresolved_story_ids.extend(sorted(pending_story_ids))
+
+        for story_id, issues in zip(
+            unresolved_story_ids,
+            self.__search_issues_in_batches(
+                [[story_id] for story_id in unresolved_story_ids], extractor
+            ),
+        ):
+            if issues:
+                result[story_id] = (issues[0][0], issues[0][1])
+        return result
+
+    def __split_into_batches(self, story_ids: List[str]) -> "List[List[str]]":
+        batch_size = self.__search_batch_size
+        return [
+            story_ids[start_index: start_index + batch_size]
+            for start_index in range(0, len(story_ids), batch_size)
+        ]
+
+    def __search_issues_in_batches(
+        self,
+        batches: "List[List[str]]",
+        extractor: IssueFieldsExtractor,
+        expand: Optional[str] = None,
+        jql_filter: Optional[str] = None,
+    ) -> "List[Optional[List[SearchedIssue]]]":
+        if len(batches) <= 1:
+            return [
+                self.__search_issues(batch, extractor, expand, jql_filter)
+                for batch in batches
+            ]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.__max_workers, len(batches)),
+            thread_name_prefix="jira-search",
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda batch: self.__search_issues(
+                        batch, extractor, expand, jql_filter
+                    ),
+                    batches,
+                )
+            )
+
+    def __search_issues(
+        self,
+        story_ids: List[str],
+        extractor: IssueFieldsExtractor,
+        expand: Optional[str] = None,
+        jql_filter: Optional[str] = None,
+    ) -> "Optional[List[SearchedIssue]]":
         id_query = ",".join(
             [f"'{str(story_id).strip()}'" for story_id in story_ids if story_id]
         )
-
+        jql = f"id in ({id_query})"
+        if jql_filter:
+            jql = f"{jql} AND {jql_filter}"
+
+        params: Dict[str, Any] = {
+            "jql": jql,
+            "startAt": 0,
+            "maxResults": len(story_ids),
+            "validateQuery": True,
+            "fields": extractor.search_fields,
+            "expand": expand,
+        }
+        result: List[SearchedIssue] = []
+        # The next page is fetched while the current page is processed.
+        executor: Optional[ThreadPoolExecutor] = None
         try:
-            search_result: Dict[str, Any] = self.jira.search_issues(
-                jql_str=f"id in ({id_query})",
-                maxResults=len(story_ids),
-                fields=[field["jira_path"].split(".")[0] for field in jira_fields],
-                json_result=True,
-            )  # type: ignore
-
-            final_result = {}
-            for issue in search_result["issues"]:
-                fields_result = {}
-                for field in jira_fields:
-                    # First element in the tuple is jira
-                    # field name like "customfield_13210 or status..."
-                    field_path = field["jira_path"]
-                    # Remain elements represent the property path.
-                    # Maybe no fields.
-                    if "fields" in issue:
-                        field_value: Any = issue["fields"]
-                        for field_path_ in field["jira_path"].split("."):
-                            if field_value is None:
-                                field_value = ""
-                                break
-                            field_value = field_value.get(field_path_, None)
-                        fields_result[field_path] = field_value
-                final_result[issue["key"].lower()] = fields_result
-
-            return final_result
+            page: Optional[str] = self.__fetch_search_page(params)
+            while page is not None:
+                page_properties: Dict[str, Any] = {}
+                issues = iter_search_result_issues(page, page_properties)
+                # The paging properties are usually in front of the issues.
+                first_issue = next(issues, None)
+                next_params = get_next_search_page_params(params, page_properties)
+                next_page: Optional[Future[str]] = None
+                if next_params is not None and first_issue is not None:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="jira-search-page"
+                        )
+                    next_page = executor.submit(self.__fetch_search_page, next_params)
+
+                if first_issue is None:
+                    break
+                result.append(self.__convert_searched_issue(first_issue, extractor))
+                result.extend(
+                    self.__convert_searched_issue(issue, extractor) for issue in issues
+                )
+                self.__adapt_search_batch_size(params, page_properties)
+
+                if next_page is not None:
+                    page = next_page.result()
+                else:
+                    next_params = get_next_search_page_params(params, page_properties)
+                    page = (
+                        None
+                        if next_params is None
+                        else self.__fetch_search_page(next_params)
+                    )
+                if next_params is not None:
+                    params = next_params
+            return result
         except JIRAError as e:
             cprint(
                 f"Calling search API failed. {self.__extract_error_message(e)}",
                 color="light_yellow",
             )
-        return {}
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        return None
+
+    def __fetch_search_page(self, params: Dict[str, Any]) -> "str":
+        # Call the search API directly instead of the search_issues, so the
+        # issues can be decoded and extracted one by one.
+        response = self.jira._session.get(  # pylint: disable=protected-access
+            self.jira._get_url("search"),  # pylint: disable=protected-access
+            params=params,
+        )
+        return response.text
+
+    def __convert_searched_issue(
+        self, issue: Dict[str, Any], extractor: IssueFieldsExtractor
+    ) -> "SearchedIssue":
+        return (
+            issue["key"].lower(),
+            extractor.extract(issue),
+            self.__extract_previous_keys(issue),
+        )
+
+    def __adapt_search_batch_size(
+        self, params: Dict[str, Any], page_properties: Dict[str, Any]
+    ):
+        page_size = page_properties.get("maxResults", None)
+        if (
+            isinstance(page_size, int)
+            and 0 < page_size < params["maxResults"]
+            and page_size < self.__search_batch_size
+        ):
+            # Let the next batches fit in one page of the Jira server.
+            self.__search_batch_size = page_size
+
+    @staticmethod
+    def __extract_previous_keys(issue: Dict[str, Any]) -> "Set[str]":
+        previous_keys: Set[str] = set()
+        changelog: Dict[str, Any] = issue.get("changelog", None) or {}
+        for history in changelog.get("histories", None) or []:
+            for item in history.get("items", None) or []:
+                if (
+                    strip_lower(str(item.get("field", ""))) == "key"
+                    and item.get("fromString", None) is not None
+                ):
+                    previous_keys.add(strip_lower(str(item["fromString"])))
+        return previous_keys
 
     @staticmethod
     def __extract_error_message(error: JIRAError) -> "str":
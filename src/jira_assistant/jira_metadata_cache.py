@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+This module is used to persist the Jira metadata like projects, issue types
+and fields, and the retrieved story details, so that they don't need to be
+downloaded on every run.
+"""
+import pathlib
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from os import replace
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from termcolor import cprint
+
+from .utils import strip_lower
+
+__all__ = [
+    "JiraMetadataCache",
+    "JiraStoryCache",
+    "DEFAULT_JIRA_CACHE_FOLDER",
+    "DEFAULT_JIRA_METADATA_CACHE_TTL",
+    "DEFAULT_JIRA_STORY_CACHE_TTL",
+    "clear_all_metadata_caches",
+]
+
+DEFAULT_JIRA_CACHE_FOLDER = pathlib.Path.home() / ".jira-assistant" / "cache"
+# One day.
+DEFAULT_JIRA_METADATA_CACHE_TTL = 24 * 60 * 60.0
+# One day.
+DEFAULT_JIRA_STORY_CACHE_TTL = 24 * 60 * 60.0
+
+_CACHE_FILE_SUFFIX = ".metadata.json"
+_STORY_CACHE_FILE_SUFFIX = ".stories.json"
+_CACHE_FORMAT_VERSION = 1
+
+
+def _get_cache_file(
+    jira_url: str, folder: Optional[Union[str, pathlib.Path]], suffix: str
+) -> pathlib.Path:
+    if folder is None:
+        folder = DEFAULT_JIRA_CACHE_FOLDER
+    return pathlib.Path(folder) / (
+        sha256(jira_url.encode("utf-8")).hexdigest()[:32] + suffix
+    )
+
+
+def _read_cache_file(file: pathlib.Path, jira_url: str) -> Optional[Dict[str, Any]]:
+    if not file.exists():
+        return None
+    try:
+        content = loads(file.read_text(encoding="utf-8"))
+    except (OSError, JSONDecodeError, UnicodeDecodeError):
+        # The broken cache will be overwritten.
+        return None
+    if (
+        not isinstance(content, dict)
+        or content.get("version", None) != _CACHE_FORMAT_VERSION
+        or content.get("url", None) != jira_url
+    ):
+        return None
+    return content
+
+
+def _write_cache_file(file: pathlib.Path, jira_url: str, content: Dict[str, Any]):
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so the other processes never
+        # read a partial file.
+        with NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=file.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_file.write(
+                dumps({"version": _CACHE_FORMAT_VERSION, "url": jira_url, **content})
+            )
+        replace(temp_file.name, file)
+    except OSError as e:
+        cprint(
+            f"Saving the Jira cache failed. {e}",
+            color="light_yellow",
+        )
+
+
+class JiraMetadataCache:
+    """
+    A JSON file which contains the metadata of one Jira website. Each entry
+    will be expired after the TTL.
+    """
+
+    def __init__(
+        self,
+        jira_url: str,
+        folder: Optional[Union[str, pathlib.Path]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        parm jira_url:
+            The Jira website which the metadata belongs to.
+
+        parm folder:
+            The folder which contains the cache files.
+
+        parm ttl:
+            How many seconds the entries are valid. 0 means disable the cache.
+        """
+        if ttl is None:
+            ttl = DEFAULT_JIRA_METADATA_CACHE_TTL
+        self.__jira_url = strip_lower(jira_url).rstrip("/")
+        self.__file = _get_cache_file(self.__jira_url, folder, _CACHE_FILE_SUFFIX)
+        self.__ttl = ttl
+        self.__lock = Lock()
+        self.__entries: Dict[str, Dict[str, Any]] = {}
+        if self.enabled:
+            self.__entries = self.__load()
+
+    @property
+    def file(self) -> pathlib.Path:
+        return self.__file
+
+    @property
+    def ttl(self) -> float:
+        return self.__ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.__ttl > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the cached value.
+
+        parm key:
+            The key of the entry
+
+        return
+            None if the entry doesn't exist or has been expired.
+        """
+        if not self.enabled:
+            return None
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+        if entry is None or time() - entry["saved_at"] > self.__ttl:
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any):
+        """
+        Add/Update the entry and save the cache file.
+
+        parm key:
+            The key of the entry
+
+        parm value:
+            A JSON serializable value
+        """
+        self.set_many({key: value})
+
+    def set_many(self, entries: Dict[str, Any]):
+        """
+        Add/Update the entries and save the cache file once.
+
+        parm entries:
+            The key of the entry -> a JSON serializable value
+        """
+        if not self.enabled or not entries:
+            return
+        saved_at = time()
+        with self.__lock:
+            for key, value in entries.items():
+                self.__entries[key] = {"saved_at": saved_at, "value": value}
+            self.__save()
+
+    def clear(self):
+        """Remove all entries and the cache file."""
+        with self.__lock:
+            self.__entries = {}
+            self.__file.unlink(missing_ok=True)
+
+    def __load(self) -> "Dict[str, Dict[str, Any]]":
+        content = _read_cache_file(self.__file, self.__jira_url)
+        if content is None or not isinstance(content.get("entries", None), dict):
+            return {}
+        entries: Dict[str, Dict[str, Any]] = content["entries"]
+        return entries
+
+    def __save(self):
+        _write_cache_file(self.__file, self.__jira_url, {"entries": self.__entries})
+
+
+class JiraStoryCache:
+    """
+    A JSON file which contains the retrieved fields of the stories of one
+    Jira website and when they were retrieved. Each story will be expired
+    after the TTL since Jira returned it last time, because the deleted
+    stories are never reported by the searching of the updated stories.
+    """
+
+    def __init__(
+        self,
+        jira_url: str,
+        folder: Optional[Union[str, pathlib.Path]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        parm jira_url:
+            The Jira website which the stories belong to.
+
+        parm folder:
+            The folder which contains the cache files.
+
+        parm ttl:
+            How many seconds the stories are valid. 0 means disable the cache.
+        """
+        if ttl is None:
+            ttl = DEFAULT_JIRA_STORY_CACHE_TTL
+        self.__jira_url = strip_lower(jira_url).rstrip("/")
+        self.__file = _get_cache_file(
+            self.__jira_url, folder, _STORY_CACHE_FILE_SUFFIX
+        )
+        self.__ttl = ttl
+        self.__field_paths: List[str] = []
+        # Story id in lower case -> (synced at, retrieved at, fields)
+        self.__stories: Dict[str, Tuple[float, float, Dict[str, Any]]] = {}
+        content = _read_cache_file(self.__file, self.__jira_url)
+        if content is not None and isinstance(content.get("stories", None), dict):
+            self.__field_paths = content.get("fields", [])
+            self.__stories = {
+                story_id: (
+                    story["synced_at"],
+                    story.get("retrieved_at", 0.0),
+                    story["fields"],
+                )
+                for story_id, story in content["stories"].items()
+            }
+
+    @property
+    def file(self) -> pathlib.Path:
+        return self.__file
+
+    @property
+    def ttl(self) -> float:
+        return self.__ttl
+
+    def get_stories(
+        self, field_paths: List[str]
+    ) -> "Dict[str, Tuple[float, Dict[str, Any]]]":
+        """
+        Get the cached stories.
+
+        parm field_paths:
+            The jira field paths which need to be retrieved.
+
+        return
+            Story id in lower case -> (synced at, fields). Nothing will be
+            returned if the stories were cached with the other fields. The
+            expired stories are not included.
+        """
+        if self.__ttl <= 0 or sorted(field_paths) != self.__field_paths:
+            return {}
+        now = time()
+        return {
+            story_id: (synced_at, fields)
+            for story_id, (synced_at, retrieved_at, fields) in self.__stories.items()
+            if now - retrieved_at <= self.__ttl
+        }
+
+    def save_stories(
+        self,
+        field_paths: List[str],
+        stories: Dict[str, Dict[str, Any]],
+        synced_at: float,
+        removed_story_ids: Iterable[str] = (),
+        retrieved_story_ids: Optional[Iterable[str]] = None,
+    ):
+        """
+        Add/Update the stories and save the cache file.
+
+        parm field_paths:
+            The jira field paths which have been retrieved.
+
+        parm stories:
+            Story id in lower case -> fields.
+
+        parm synced_at:
+            When the retrieving started.
+
+        parm removed_story_ids:
+            The stories which don't exist anymore, for example, the key has
+            been changed.
+
+        parm retrieved_story_ids:
+            The stories which have been returned by Jira, so they won't be
+            expired until the TTL passes again. The others keep the time when
+            they were returned last time. All stories are treated as
+            returned if it is None.
+        """
+        if sorted(field_paths) != self.__field_paths:
+            self.__field_paths = sorted(field_paths)
+            self.__stories = {}
+        for story_id in removed_story_ids:
+            self.__stories.pop(story_id, None)
+        retrieved_at = time()
+        retrieved = None if retrieved_story_ids is None else set(retrieved_story_ids)
+        for story_id, fields in stories.items():
+            if retrieved is None or story_id in retrieved:
+                self.__stories[story_id] = (synced_at, retrieved_at, fields)
+            elif story_id in self.__stories:
+                self.__stories[story_id] = (
+                    synced_at,
+                    self.__stories[story_id][1],
+                    fields,
+                )
+            else:
+                self.__stories[story_id] = (synced_at, 0.0, fields)
+        _write_cache_file(
+            self.__file,
+            self.__jira_url,
+            {
+                "fields": self.__field_paths,
+                "stories": {
+                    story_id: {
+                        "synced_at": story_synced_at,
+                        "retrieved_at": story_retrieved_at,
+                        "fields": fields,
+                    }
+                    for story_id, (
+                        story_synced_at,
+                        story_retrieved_at,
+                        fields,
+                    ) in self.__stories.items()
+                },
+            },
+        )
+
+    def clear(self):
+        """Remove all stories and the cache file."""
+        self.__field_paths = []
+        self.__stories = {}
+        self.__file.unlink(missing_ok=True)
+
+
+def clear_all_metadata_caches(
+    folder: Optional[Union[str, pathlib.Path]] = None
+) -> int:
+    """
+    Remove the metadata and story caches of all Jira websites.
+
+    parm folder:
+        The folder which contains the cache files.
+
+    return
+        How many cache files have been removed.
+    """
+    if folder is None:
+        folder = DEFAULT_JIRA_CACHE_FOLDER
+    folder = pathlib.Path(folder)
+    if not folder.is_dir():
+        return 0
+    count = 0
+    for suffix in (_CACHE_FILE_SUFFIX, _STORY_CACHE_FILE_SUFFIX):
+        for cache_file in folder.glob(f"*{suffix}"):
+            cache_file.unlink(missing_ok=True)
+            count += 1
+    return count
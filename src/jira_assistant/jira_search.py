@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+This module is used to decode the search result of the Jira host page by page.
+"""
+from json import JSONDecoder
+from re import compile as re_compile
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+class IssueFieldsExtractor:
+    """
+    Extract the fields from the issues of the search result. The field paths
+    are split once when the extractor is created instead of once per issue.
+    """
+
+    def __init__(self, jira_fields: List[Dict[str, str]]) -> None:
+        # (jira path, properties of the path)
+        self.__accessors: List[Tuple[str, Tuple[str, ...]]] = [
+            (field["jira_path"], tuple(field["jira_path"].split(".")))
+            for field in jira_fields
+        ]
+        # The search API only supports the top-level fields.
+        self.__search_fields: List[str] = list(
+            dict.fromkeys(properties[0] for _, properties in self.__accessors)
+        )
+
+    @property
+    def search_fields(self) -> List[str]:
+        return self.__search_fields
+
+    def extract(self, issue: Dict[str, Any]) -> "Dict[str, str]":
+        fields_result: Dict[str, Any] = {}
+        # Maybe no fields.
+        if "fields" not in issue:
+            return fields_result
+        issue_fields = issue["fields"]
+        for jira_path, properties in self.__accessors:
+            field_value: Any = issue_fields
+            for property_ in properties:
+                if field_value is None:
+                    field_value = ""
+                    break
+                field_value = field_value.get(property_, None)
+            fields_result[jira_path] = field_value
+        return fields_result
+
+
+# The key in lower case, the fields and the previous keys of the issue.
+SearchedIssue = Tuple[str, Dict[str, str], Set[str]]
+
+_json_decoder = JSONDecoder()
+_json_whitespace = re_compile(r"[ \t\n\r]*")
+
+
+def _skip_json_whitespace(text: str, index: int) -> int:
+    return _json_whitespace.match(text, index).end()  # type: ignore[union-attr]
+
+
+def iter_search_result_issues(
+    text: str, properties: Optional[Dict[str, Any]] = None
+) -> "Iterator[Dict[str, Any]]":
+    """
+    Decode the issues of the search result one by one, so only one decoded
+    issue is kept in memory at the same time instead of the whole result.
+
+    parm properties:
+        The other properties of the result, like the total, will be saved in
+        it once they are decoded.
+    """
+    index = _skip_json_whitespace(text, 0)
+    if text[index: index + 1] != "{":
+        raise ValueError("The search result is not a JSON object.")
+    index = _skip_json_whitespace(text, index + 1)
+    while text[index: index + 1] != "}":
+        key, index = _json_decoder.raw_decode(text, index)
+        index = _skip_json_whitespace(text, index)
+        if text[index: index + 1] != ":":
+            raise ValueError(f"Expecting ':' delimiter in the search result: {index}")
+        index = _skip_json_whitespace(text, index + 1)
+        if key == "issues" and text[index: index + 1] == "[":
+            index = _skip_json_whitespace(text, index + 1)
+            while text[index: index + 1] != "]":
+                issue, index = _json_decoder.raw_decode(text, index)
+                yield issue
+                index = _skip_json_whitespace(text, index)
+                if text[index: index + 1] == ",":
+                    index = _skip_json_whitespace(text, index + 1)
+            index += 1
+        else:
+            value, index = _json_decoder.raw_decode(text, index)
+            if properties is not None:
+                properties[key] = value
+        index = _skip_json_whitespace(text, index)
+        if text[index: index + 1] == ",":
+            index = _skip_json_whitespace(text, index + 1)
+
+
+def get_next_search_page_params(
+    params: Dict[str, Any], page_properties: Dict[str, Any]
+) -> "Optional[Dict[str, Any]]":
+    """
+    Find the parameters of the next page based on the paging properties of
+    the current page. Both the "nextPageToken" of the Jira Cloud and the
+    "startAt"/"total" are supported.
+
+    return
+        None if it is the last page or the paging properties haven't been
+        decoded.
+    """
+    if page_properties.get("isLast", None) is True:
+        return None
+    next_page_token = page_properties.get("nextPageToken", None)
+    if next_page_token:
+        next_params = {
+            key: value for key, value in params.items() if key != "startAt"
+        }
+        next_params["nextPageToken"] = next_page_token
+        return next_params
+
+    total = page_properties.get("total", None)
+    page_size = page_properties.get("maxResults", None)
+    if not isinstance(total, int) or not isinstance(page_size, int) or page_size <= 0:
+        return None
+    next_start_at = page_properties.get("startAt", params.get("startAt", 0)) + page_size
+    if next_start_at >= total:
+        return None
+    return {**params, "startAt": next_start_at}
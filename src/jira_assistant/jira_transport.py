@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+"""
+This module is used to control how the requests are sent to the Jira host,
+including the connection pool, the rate limit and the retries.
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Optional, Tuple, TypedDict
+from urllib.parse import urlparse
+
+from jira import JIRAError
+from jira.resilientsession import ResilientSession
+from requests import Response
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from typing_extensions import NotRequired
+
+from .profiler import Profiler
+from .utils import strip_lower
+
+__all__ = [
+    "JiraRequestCounters",
+    "JiraTransportConfig",
+    "TokenBucket",
+    "AdaptiveRateLimiter",
+    "RetryingRequest",
+    "get_host_rate_limiter",
+    "configure_jira_session",
+]
+
+_DEFAULT_JIRA_MAX_RETRIES = 3
+_DEFAULT_JIRA_RETRY_BACKOFF_FACTOR = 1.0
+_DEFAULT_JIRA_MAX_RETRY_DELAY = 60.0
+# The rate which is used when the requests without limit are throttled and
+# the Jira host doesn't tell its rate limit.
+_DEFAULT_JIRA_THROTTLED_RATE = 10.0
+_MIN_JIRA_REQUESTS_PER_SECOND = 0.1
+
+
+class JiraRequestCounters(TypedDict):
+    # How many requests have been sent including the retries.
+    requests: int
+    # How many requests have been rejected by the rate limit (429).
+    throttled: int
+    # How many requests have been retried.
+    retried: int
+
+
+class JiraTransportConfig(TypedDict):
+    """
+    How the requests are sent to the Jira host.
+    """
+
+    # How many connections to the Jira host are kept alive for reuse.
+    pool_size: NotRequired[int]
+    # How many times a request which failed with 429/503 or a connection
+    # error will be retried.
+    max_retries: NotRequired[int]
+    # The base delay in seconds of the exponential backoff.
+    backoff_factor: NotRequired[float]
+    # The maximum delay in seconds between retries.
+    max_retry_delay: NotRequired[float]
+
+
+# The requests which can be sent again safely after a connection error.
+_IDEMPOTENT_HTTP_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+_RETRYABLE_HTTP_STATUSES = frozenset(
+    [HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE]
+)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # The Retry-After header is either the seconds or an HTTP date.
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _get_payload_size(payload: Any) -> int:
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    if isinstance(payload, bytes):
+        return len(payload)
+    return 0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket which allows ``rate`` calls per second on average.
+    """
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("The rate of the token bucket must be positive.")
+        self.__rate = rate
+        self.__capacity = max(rate, 1.0)
+        self.__tokens = self.__capacity
+        self.__updated_at = monotonic()
+        self.__paused_until = 0.0
+        self.__lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    @rate.setter
+    def rate(self, value: float):
+        if value <= 0:
+            raise ValueError("The rate of the token bucket must be positive.")
+        with self.__lock:
+            self.__refill(monotonic())
+            self.__rate = value
+            self.__capacity = max(value, 1.0)
+            self.__tokens = min(self.__tokens, self.__capacity)
+
+    def pause(self, seconds: float):
+        """No calls are allowed in the next seconds."""
+        with self.__lock:
+            self.__paused_until = monotonic() + seconds
+
+    def acquire(self):
+        with self.__lock:
+            now = monotonic()
+            self.__refill(now)
+            # Reserve the token first, so the callers are served in order.
+            self.__tokens -= 1
+            wait_seconds = max(
+                -self.__tokens / self.__rate if self.__tokens < 0 else 0,
+                self.__paused_until - now,
+            )
+        if wait_seconds > 0:
+            sleep(wait_seconds)
+
+    def __refill(self, now: float):
+        self.__tokens = min(
+            self.__capacity,
+            self.__tokens + (now - self.__updated_at) * self.__rate,
+        )
+        self.__updated_at = now
+
+
+def _get_rate_limit_of_jira_host(response: Optional[Response]) -> Optional[float]:
+    # Jira Cloud refills "X-RateLimit-FillRate" tokens every
+    # "X-RateLimit-Interval-Seconds".
+    if response is None:
+        return None
+    try:
+        fill_rate = float(response.headers["X-RateLimit-FillRate"])
+        interval = float(response.headers["X-RateLimit-Interval-Seconds"])
+    except (KeyError, ValueError):
+        return None
+    if fill_rate <= 0 or interval <= 0:
+        return None
+    return fill_rate / interval
+
+
+class AdaptiveRateLimiter:
+    """
+    The rate limit of all requests to one Jira host. The rate follows the
+    rate limit headers of the Jira host. Without the headers, the rate is
+    halved when the requests are throttled and increased slowly when they
+    succeed, but never beyond the configured rate.
+    """
+
+    def __init__(self, max_rate: Optional[float]) -> None:
+        self.__max_rate = max_rate
+        # No limit until the requests are throttled.
+        self.__bucket: Optional[TokenBucket] = (
+            None if max_rate is None else TokenBucket(max_rate)
+        )
+        self.__succeeded_requests = 0
+        self.__lock = Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        bucket = self.__bucket
+        return None if bucket is None else bucket.rate
+
+    def acquire(self):
+        bucket = self.__bucket
+        if bucket is not None:
+            bucket.acquire()
+
+    def on_succeeded(self, response: Response):
+        rate_limit = _get_rate_limit_of_jira_host(response)
+        with self.__lock:
+            if rate_limit is not None:
+                self.__set_rate(rate_limit)
+                return
+            if self.__bucket is None or (
+                self.__max_rate is not None and self.__bucket.rate >= self.__max_rate
+            ):
+                return
+            # Increase the rate by 1 after about one second of successes.
+            self.__succeeded_requests += 1
+            if self.__succeeded_requests >= self.__bucket.rate:
+                self.__succeeded_requests = 0
+                self.__set_rate(self.__bucket.rate + 1)
+
+    def on_throttled(self, response: Optional[Response], retry_after: float):
+        """
+        parm retry_after:
+            How many seconds all requests to the Jira host should wait.
+        """
+        rate_limit = _get_rate_limit_of_jira_host(response)
+        with self.__lock:
+            self.__succeeded_requests = 0
+            if rate_limit is not None:
+                self.__set_rate(rate_limit)
+            elif self.__bucket is None:
+                self.__set_rate(_DEFAULT_JIRA_THROTTLED_RATE)
+            else:
+                self.__set_rate(self.__bucket.rate / 2)
+            if self.__bucket is not None:
+                self.__bucket.pause(retry_after)
+
+    def __set_rate(self, rate: float):
+        rate = max(rate, _MIN_JIRA_REQUESTS_PER_SECOND)
+        if self.__max_rate is not None:
+            rate = min(rate, self.__max_rate)
+        if self.__bucket is None:
+            self.__bucket = TokenBucket(rate)
+        elif self.__bucket.rate != rate:
+            self.__bucket.rate = rate
+
+
+_host_rate_limiters: Dict[Tuple[str, Optional[float]], AdaptiveRateLimiter] = {}
+_host_rate_limiters_lock = Lock()
+
+
+def get_host_rate_limiter(url: str, rate: Optional[float]) -> AdaptiveRateLimiter:
+    # All clients which visit the same host share the same limit.
+    key = (strip_lower(urlparse(url).netloc), rate)
+    with _host_rate_limiters_lock:
+        if key not in _host_rate_limiters:
+            _host_rate_limiters[key] = AdaptiveRateLimiter(rate)
+        return _host_rate_limiters[key]
+
+
+class RetryingRequest:
+    """
+    Wrap the request method of the session, so all requests share the rate
+    limit of the Jira host. The requests which are rejected because of the
+    rate limit (429) or the maintenance (503), and the idempotent requests
+    which failed because of the connection errors will be retried.
+    """
+
+    def __init__(
+        self,
+        request: Callable[..., Response],
+        rate_limiter: AdaptiveRateLimiter,
+        max_retries: int,
+        backoff_factor: float,
+        max_retry_delay: float,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """
+        parm profiler:
+            Record the endpoint, the latency, the payload size and the outcome
+            of every request which is sent, including the retries.
+        """
+        self.__request = request
+        self.__profiler = profiler
+        self.__rate_limiter = rate_limiter
+        self.__max_retries = max(max_retries, 0)
+        self.__backoff_factor = max(backoff_factor, 0.0)
+        self.__max_retry_delay = max(max_retry_delay, 0.0)
+        self.__counters: JiraRequestCounters = {
+            "requests": 0,
+            "throttled": 0,
+            "retried": 0,
+        }
+        self.__counters_lock = Lock()
+
+    @property
+    def counters(self) -> JiraRequestCounters:
+        with self.__counters_lock:
+            return self.__counters.copy()
+
+    def __call__(self, method: str, url: Any, *args: Any, **kwargs: Any) -> Response:
+        retry_number = 0
+        while True:
+            self.__rate_limiter.acquire()
+            self.__count("requests")
+            try:
+                response = self.__send(method, url, *args, **kwargs)
+                self.__rate_limiter.on_succeeded(response)
+                return response
+            except (JIRAError, RequestsConnectionError) as e:
+                delay = self.__get_retry_delay(method, e, retry_number)
+                throttled = (
+                    isinstance(e, JIRAError)
+                    and e.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                )
+                if throttled:
+                    self.__count("throttled")
+                    # All requests to the host will wait, including this one
+                    # when the rate limiter is acquired again.
+                    self.__rate_limiter.on_throttled(e.response, delay or 0.0)
+                if delay is None:
+                    raise
+            retry_number += 1
+            self.__count("retried")
+            if not throttled:
+                sleep(delay)
+
+    def __send(self, method: str, url: Any, *args: Any, **kwargs: Any) -> Response:
+        if self.__profiler is None:
+            return self.__request(method, url, *args, **kwargs)
+        started_at = self.__profiler.now()
+        response: Optional[Response] = None
+        outcome = ""
+        try:
+            response = self.__request(method, url, *args, **kwargs)
+            outcome = str(response.status_code)
+            return response
+        except JIRAError as e:
+            response = e.response
+            outcome = str(e.status_code or type(e).__name__)
+            raise
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            self.__profiler.record_request(
+                method,
+                str(url),
+                started_at,
+                self.__profiler.now() - started_at,
+                _get_payload_size(kwargs.get("data", None)),
+                # Reading the streamed content would consume it.
+                0
+                if response is None or kwargs.get("stream", False)
+                else _get_payload_size(response.content),
+                outcome,
+            )
+
+    def __count(self, name: str):
+        with self.__counters_lock:
+            self.__counters[name] += 1  # type: ignore[literal-required]
+
+    def __get_retry_delay(
+        self, method: str, error: Exception, retry_number: int
+    ) -> Optional[float]:
+        if retry_number >= self.__max_retries:
+            return None
+        if isinstance(error, JIRAError):
+            if error.status_code not in _RETRYABLE_HTTP_STATUSES:
+                return None
+            retry_after = (
+                None
+                if error.response is None
+                else _parse_retry_after(error.response.headers.get("Retry-After"))
+            )
+            if retry_after is not None:
+                return min(retry_after, self.__max_retry_delay)
+        elif method.upper() not in _IDEMPOTENT_HTTP_METHODS:
+            return None
+        # The jitter prevents the concurrent requests from retrying at the
+        # same time.
+        return min(
+            self.__backoff_factor * 2.0**retry_number, self.__max_retry_delay
+        ) * uniform(0.5, 1.0)
+
+
+def configure_jira_session(
+    session: ResilientSession,
+    rate_limiter: AdaptiveRateLimiter,
+    transport_config: JiraTransportConfig,
+    default_pool_size: int = DEFAULT_POOLSIZE,
+    profiler: Optional[Profiler] = None,
+) -> RetryingRequest:
+    """
+    Apply the connection pool size, the rate limit and the retry policy to the
+    session of the Jira client.
+
+    parm default_pool_size:
+        The pool size if it is not configured. It should be at least the
+        number of the concurrent requests.
+
+    parm profiler:
+        Record every request which is sent by the session.
+
+    return
+        The wrapped request method of the session which counts the requests.
+    """
+    # Every worker should be able to reuse a kept-alive connection.
+    pool_size = transport_config.get(
+        "pool_size", max(default_pool_size, DEFAULT_POOLSIZE)
+    )
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix,
+            HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size),
+        )
+    # The built-in retry of the Jira session waits at least 10 seconds and
+    # cannot be configured, so it is replaced.
+    session.max_retries = 0
+    retrying_request = RetryingRequest(
+        session.request,
+        rate_limiter,
+        max_retries=transport_config.get("max_retries", _DEFAULT_JIRA_MAX_RETRIES),
+        backoff_factor=transport_config.get(
+            "backoff_factor", _DEFAULT_JIRA_RETRY_BACKOFF_FACTOR
+        ),
+        max_retry_delay=transport_config.get(
+            "max_retry_delay", _DEFAULT_JIRA_MAX_RETRY_DELAY
+        ),
+        profiler=profiler,
+    )
+    session.request = retrying_request  # type: ignore[method-assign]
+    return retrying_request
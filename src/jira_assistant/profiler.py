@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+This module is used to record how long the Jira requests, the pre-process
+steps and the sort strategies take, so the time can be reported as a summary
+table or a JSON trace file.
+"""
+import os
+import pathlib
+import re
+import threading
+from contextlib import contextmanager
+from json import dump
+from time import perf_counter
+from typing import Dict, Iterator, List, Tuple, TypedDict, Union
+from urllib.parse import urlparse
+
+__all__ = [
+    "Profiler",
+    "JiraRequestRecord",
+    "SectionRecord",
+    "get_request_endpoint",
+]
+
+# The segments like "10001" or "A-1" are replaced, so the requests to the
+# same API are grouped.
+_PATH_ID_SEGMENT = re.compile(r"^(\d+|[A-Za-z][A-Za-z0-9_]*-\d+)$")
+
+
+class JiraRequestRecord(TypedDict):
+    method: str
+    endpoint: str
+    # Seconds since the profiler has been created.
+    started_at: float
+    latency: float
+    request_size: int
+    response_size: int
+    # The HTTP status code or the name of the exception.
+    outcome: str
+    thread_id: int
+
+
+class SectionRecord(TypedDict):
+    # For example: step or strategy.
+    category: str
+    name: str
+    # Seconds since the profiler has been created.
+    started_at: float
+    duration: float
+    thread_id: int
+
+
+def get_request_endpoint(url: str) -> str:
+    """
+    Get the endpoint of the request which doesn't contain the ids of the
+    issues or the other resources.
+
+    return
+        For example: /rest/api/2/issue/{id}
+    """
+    segments = urlparse(url).path.split("/")
+    for index, segment in enumerate(segments):
+        # Keep the API version, for example: /rest/api/2
+        if index > 0 and segments[index - 1] == "api":
+            continue
+        if _PATH_ID_SEGMENT.match(segment):
+            segments[index] = "{id}"
+    return "/".join(segments)
+
+
+def _is_failed(outcome: str) -> bool:
+    return not outcome.isdigit() or int(outcome) >= 400
+
+
+class Profiler:
+    """
+    Collect the time of the Jira requests and the steps. It can be shared by
+    multiple threads.
+    """
+
+    def __init__(self) -> None:
+        self.__origin = perf_counter()
+        self.__lock = threading.Lock()
+        self.__requests: List[JiraRequestRecord] = []
+        self.__sections: List[SectionRecord] = []
+
+    @property
+    def requests(self) -> List[JiraRequestRecord]:
+        with self.__lock:
+            return self.__requests.copy()
+
+    @property
+    def sections(self) -> List[SectionRecord]:
+        with self.__lock:
+            return self.__sections.copy()
+
+    def now(self) -> float:
+        """Seconds since the profiler has been created."""
+        return perf_counter() - self.__origin
+
+    def record_request(
+        self,
+        method: str,
+        url: str,
+        started_at: float,
+        latency: float,
+        request_size: int,
+        response_size: int,
+        outcome: str,
+    ):
+        """
+        Record one request which has been sent to the Jira host. The retries
+        are recorded separately.
+
+        parm started_at:
+            The value of :py:meth:`now` when the request was sent.
+        """
+        record: JiraRequestRecord = {
+            "method": method.upper(),
+            "endpoint": get_request_endpoint(url),
+            "started_at": started_at,
+            "latency": latency,
+            "request_size": request_size,
+            "response_size": response_size,
+            "outcome": outcome,
+            "thread_id": threading.get_ident(),
+        }
+        with self.__lock:
+            self.__requests.append(record)
+
+    @contextmanager
+    def section(self, category: str, name: str) -> Iterator[None]:
+        """
+        Record how long the code inside the ``with`` statement takes.
+
+        parm category:
+            For example: step or strategy.
+        """
+        started_at = self.now()
+        try:
+            yield
+        finally:
+            record: SectionRecord = {
+                "category": category,
+                "name": name,
+                "started_at": started_at,
+                "duration": self.now() - started_at,
+                "thread_id": threading.get_ident(),
+            }
+            with self.__lock:
+                self.__sections.append(record)
+
+    def format_summary(self) -> str:
+        """
+        Format the time of the sections and the requests grouped by the
+        endpoint as a table.
+        """
+        lines: List[str] = [
+            f"{'Category':<10} {'Name':<48} {'Time (ms)':>10}",
+            "-" * 70,
+        ]
+        # The outer sections finish later but start earlier.
+        for section in sorted(self.sections, key=lambda item: item["started_at"]):
+            lines.append(
+                f"{section['category']:<10} {section['name']:<48} "
+                f"{section['duration'] * 1000:>10.1f}"
+            )
+
+        groups: Dict[Tuple[str, str], List[JiraRequestRecord]] = {}
+        for request in self.requests:
+            groups.setdefault((request["method"], request["endpoint"]), []).append(
+                request
+            )
+        lines.extend(
+            [
+                "",
+                f"{'Method':<6} {'Endpoint':<40} {'Count':>5} {'Errors':>6} "
+                f"{'Total (ms)':>10} {'Avg (ms)':>9} {'Max (ms)':>9} "
+                f"{'Sent (KB)':>9} {'Recv (KB)':>9}",
+                "-" * 111,
+            ]
+        )
+        for (method, endpoint), records in sorted(
+            groups.items(), key=lambda item: -sum(r["latency"] for r in item[1])
+        ):
+            latencies = [record["latency"] for record in records]
+            errors = sum(1 for record in records if _is_failed(record["outcome"]))
+            lines.append(
+                f"{method:<6} {endpoint:<40} {len(records):>5} {errors:>6} "
+                f"{sum(latencies) * 1000:>10.1f} "
+                f"{sum(latencies) / len(latencies) * 1000:>9.1f} "
+                f"{max(latencies) * 1000:>9.1f} "
+                f"{sum(r['request_size'] for r in records) / 1024:>9.1f} "
+                f"{sum(r['response_size'] for r in records) / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def save_trace(self, file: Union[str, pathlib.Path]):
+        """
+        Save the sections and the requests as a JSON file in the trace event
+        format, which can be opened by chrome://tracing or Perfetto.
+        """
+        events: List[Dict] = []
+        pid = os.getpid()
+        for section in self.sections:
+            events.append(
+                {
+                    "name": section["name"],
+                    "cat": section["category"],
+                    "ph": "X",
+                    "ts": round(section["started_at"] * 1_000_000),
+                    "dur": round(section["duration"] * 1_000_000),
+                    "pid": pid,
+                    "tid": section["thread_id"],
+                }
+            )
+        for request in self.requests:
+            events.append(
+                {
+                    "name": f"{request['method']} {request['endpoint']}",
+                    "cat": "request",
+                    "ph": "X",
+                    "ts": round(request["started_at"] * 1_000_000),
+                    "dur": round(request["latency"] * 1_000_000),
+                    "pid": pid,
+                    "tid": request["thread_id"],
+                    "args": {
+                        "request_size": request["request_size"],
+                        "response_size": request["response_size"],
+                        "outcome": request["outcome"],
+                    },
+                }
+            )
+        events.sort(key=lambda event: event["ts"])
+        with open(file, mode="w", encoding="utf-8") as trace_file:
+            dump(
+                {"traceEvents": events, "displayTimeUnit": "ms"},
+                trace_file,
+                indent=2,
+            )
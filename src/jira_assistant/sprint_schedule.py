@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 import pathlib
+from bisect import bisect_right
 from json import loads, JSONDecodeError
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Dict, List, Tuple, Union
 from .utils import strip_lower
 
 __all__ = ["SprintScheduleStore"]
 
 
+# The separator never appears in the sprint names, so a match of the search
+# cannot cross two sprints.
+_SPRINT_SEPARATOR = "\0"
+
+
 class SprintScheduleStore:
     def __init__(self) -> None:
         self.__store: List[Tuple[str, int]] = []
+        # All upper-cased sprint names joined by the separator.
+        self.__search_text: str = ""
+        # The offset of each sprint name in the search text.
+        self.__offsets: List[int] = []
+        # Sprint -> priority which has been resolved before.
+        self.__memo: Dict[str, int] = {}
 
     def load(self, content: str):
         """
@@ -52,6 +64,23 @@ Hint: {e.msg} in line {e.lineno}:{e.colno}."""
             sprints.clear()
             priority = -1
 
+        self.__build_index()
+
+    def __build_index(self):
+        upper_sprints = [sprint.upper() for sprint, _ in self.__store]
+        self.__offsets = []
+        offset = 0
+        for upper_sprint in upper_sprints:
+            self.__offsets.append(offset)
+            offset += len(upper_sprint) + len(_SPRINT_SEPARATOR)
+        self.__search_text = _SPRINT_SEPARATOR.join(upper_sprints)
+
+        self.__memo = {}
+        # The sprint names are the most common inputs.
+        for sprint, _ in self.__store:
+            self.__memo[sprint] = self.__search_priority(sprint)
+            self.__memo[sprint.upper()] = self.__memo[sprint]
+
     def load_file(self, file: Union[str, Path]):
         """
         Load json file to generate the Excel definition
@@ -77,10 +106,30 @@ and the path should be absolute. File: {file}."""
                 schedule_file.close()
 
     def get_priority(self, sprint: str) -> int:
-        for item in self.__store:
-            if sprint.upper() in item[0].upper():
-                return item[1]
-        return 0
+        """
+        Get the priority of the first sprint which contains the input
+        (case-insensitive).
+
+        :param sprint:
+            The sprint name or a part of it
+
+        :return:
+            The priority, 0 means not found.
+        """
+        priority = self.__memo.get(sprint, None)
+        if priority is None:
+            priority = self.__search_priority(sprint)
+            self.__memo[sprint] = priority
+        return priority
+
+    def __search_priority(self, sprint: str) -> int:
+        target = sprint.upper()
+        if _SPRINT_SEPARATOR in target:
+            return 0
+        position = self.__search_text.find(target)
+        if position == -1 or not self.__store:
+            return 0
+        return self.__store[bisect_right(self.__offsets, position) - 1][1]
 
     def total_count(self) -> int:
         return len(self.__store)
@@ -2,9 +2,9 @@
 import re
 from datetime import datetime
 from decimal import Decimal
-from functools import cmp_to_key
-from operator import attrgetter, itemgetter
-from typing import Any, Dict, List, Optional, Set, Tuple
+from itertools import repeat
+from operator import attrgetter, is_, itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from dateutil import parser
 
@@ -20,6 +20,9 @@ __all__ = [
     "convert_to_bool",
     "convert_to_datetime",
     "convert_to_decimal",
+    "format_property_value",
+    "get_value_converter",
+    "build_inline_weights_sort_key",
     "sort_stories_by_property_and_order",
     "sort_stories_by_raise_ranking",
     "sort_stories_by_inline_weights",
@@ -56,10 +59,68 @@ def convert_to_datetime(raw: Any) -> Optional[datetime]:
     return parser.parse(raw)
 
 
+def _keep_value(raw: Any) -> Any:
+    return raw
+
+
+def get_value_converter(property_type: Any) -> Callable[[Any], Any]:
+    """
+    Get the function which converts the raw cell value into the property type.
+
+    parm property_type:
+        The type of the column which is defined in the :py:class:`ExcelDefinition`
+
+    return
+        A function which accepts the raw value and returns the converted one.
+    """
+    if property_type is bool:
+        return convert_to_bool
+    if property_type is Priority:
+        return convert_to_priority
+    if property_type is datetime:
+        return convert_to_datetime
+    if property_type is Milestone:
+        return Milestone
+    return _keep_value
+
+
+def format_property_value(property_value: Any) -> str:
+    """
+    Format the property value of the :py:class:`Story` into the Excel cell value.
+
+    parm property_value:
+        The property value which needs to be written to the Excel
+
+    return
+        The formatted string value.
+    """
+    if property_value is None:
+        return ""
+    if isinstance(property_value, datetime):
+        return property_value.date().isoformat()
+    if isinstance(property_value, bool):
+        if property_value:
+            return "Yes"
+        return "No"
+    return str(property_value)
+
+
+# Marks the property which has not been assigned to the story yet.
+_UNASSIGNED: Any = object()
+
+
 class Story:
-    def __init__(self, factory: "StoryFactory") -> None:
+    # The property values are kept in a list which is indexed by the slot
+    # assigned by the :py:class:`StoryFactory`, so the story doesn't need
+    # a __dict__.
+    __slots__ = ("factory", "__need_sort", "__excel_row_index", "__values")
+
+    def __init__(
+        self, factory: "StoryFactory", values: "Optional[List[Any]]" = None
+    ) -> None:
         self.__need_sort = True
         self.__excel_row_index = 0
+        self.__values: List[Any] = [] if values is None else values
         if factory is None:
             raise ValueError("Story must be created from a specific factory!")
         self.factory = factory
@@ -80,38 +141,63 @@ class Story:
     def excel_row_index(self, value: int):
         self.__excel_row_index = value
 
+    @property
+    def slot_values(self) -> "List[Any]":
+        """The values indexed by the slots. Please don't modify it directly."""
+        return self.__values
+
+    def get_slot_value(self, slot_index: int, default: Any = _UNASSIGNED) -> Any:
+        if slot_index < len(self.__values):
+            value = self.__values[slot_index]
+            if value is not _UNASSIGNED:
+                return value
+        return default
+
+    def set_slot_value(self, slot_index: int, value: Any):
+        values = self.__values
+        if slot_index >= len(values):
+            values.extend([_UNASSIGNED] * (slot_index + 1 - len(values)))
+        values[slot_index] = value
+
+    def __get_value(self, standardized_name: str, default: Any = _UNASSIGNED) -> Any:
+        slot_index = self.factory.get_slot_index(standardized_name)
+        if slot_index is None:
+            return default
+        return self.get_slot_value(slot_index, default)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only be called when the normal lookup fails. The internal attributes
+        # must not be looked up from the slots, otherwise it will be recursive.
+        if name not in ("factory", "_Story__values"):
+            value = self.__get_value(name)
+            if value is not _UNASSIGNED:
+                return value
+        raise AttributeError(f"'Story' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any):
+        if hasattr(Story, name):
+            object.__setattr__(self, name, value)
+        else:
+            self.set_slot_value(self.factory.assign_slot(name), value)
+
     def __getitem__(self, property_name: str) -> Any:
-        return getattr(self, standardize_column_name(property_name))
+        value = self.__get_value(self.factory.standardize_name(property_name))
+        if value is _UNASSIGNED:
+            raise AttributeError(
+                f"'Story' object has no attribute '{property_name}'"
+            )
+        return value
 
     def format_value(self, property_name: str) -> str:
-        property_value = getattr(self, standardize_column_name(property_name), None)
-        if property_value is None:
-            return ""
-        if isinstance(property_value, datetime):
-            return property_value.date().isoformat()
-        if isinstance(property_value, bool):
-            if property_value:
-                return "Yes"
-            return "No"
-        if isinstance(property_value, float):
-            return str(property_value)
-        return str(property_value)
+        return format_property_value(
+            self.__get_value(self.factory.standardize_name(property_name), None)
+        )
 
     def set_value(self, property_type: Any, property_name: str, property_value: Any):
-        property_name = standardize_column_name(property_name)
-        if property_type is str:
-            setattr(self, property_name, property_value)
-        elif property_type is bool:
-            setattr(self, property_name, convert_to_bool(property_value))
-        elif property_type is Priority:
-            setattr(self, property_name, convert_to_priority(property_value))
-        elif property_type is datetime:
-            setattr(self, property_name, convert_to_datetime(property_value))
-        elif property_type is Milestone:
-            milestone = Milestone(property_value)
-            setattr(self, property_name, milestone)
-        else:
-            setattr(self, property_name, property_value)
+        self.set_slot_value(
+            self.factory.register_property(property_name),
+            get_value_converter(property_type)(property_value),
+        )
 
     def __setitem__(self, property_name, property_value):
         self.set_value(type(property_value), property_name, property_value)
@@ -155,6 +241,12 @@ class StoryFactory:
         if columns is None:
             raise ValueError("Columns must be provided!")
         self.__columns = columns
+        # Standardized property name -> slot index of the story values.
+        self.__slot_indexes: Dict[str, int] = {}
+        # Raw property name -> standardized property name.
+        self.__standardized_names: Dict[str, str] = {}
+        for column in self.__columns:
+            self.register_property(column["name"])
         self.__inline_weight_compare_rules = (
             self.__generate_inline_weights_compare_rules()
         )
@@ -180,16 +272,140 @@ class StoryFactory:
     def inline_weights_compare_rules(self) -> "List[Tuple[str, int]]":
         return self.__inline_weight_compare_rules
 
-    def create_story(self) -> Story:
-        return Story(self)
+    @property
+    def slot_count(self) -> int:
+        return len(self.__slot_indexes)
+
+    def standardize_name(self, property_name: str) -> str:
+        standardized_name = self.__standardized_names.get(property_name, None)
+        if standardized_name is None:
+            standardized_name = standardize_column_name(property_name)
+            self.__standardized_names[property_name] = standardized_name
+        return standardized_name
+
+    def get_slot_index(self, standardized_name: str) -> Optional[int]:
+        return self.__slot_indexes.get(standardized_name, None)
+
+    def register_property(self, property_name: str) -> int:
+        """
+        Assign a slot to the property if it hasn't one yet.
+
+        parm property_name:
+            The property name which will be standardized
+
+        return
+            The slot index of the property.
+        """
+        return self.assign_slot(self.standardize_name(property_name))
+
+    def assign_slot(self, standardized_name: str) -> int:
+        slot_index = self.__slot_indexes.get(standardized_name, None)
+        if slot_index is None:
+            slot_index = len(self.__slot_indexes)
+            self.__slot_indexes[standardized_name] = slot_index
+        return slot_index
+
+    def property_getter(self, property_names: "List[str]") -> Callable[[Story], Any]:
+        """
+        Build a function like the :py:func:`operator.attrgetter` which reads
+        the slots of the stories created by this factory directly.
+
+        parm property_names:
+            The standardized property names
+
+        return
+            A function which returns the value of the property if there is only
+            one property, otherwise a tuple of the values.
+        """
+        fallback = attrgetter(*property_names)
+        slot_indexes = [self.get_slot_index(name) for name in property_names]
+        if None in slot_indexes:
+            return fallback
+        get_items = itemgetter(*slot_indexes)
+        single = len(slot_indexes) == 1
+
+        def get_values(story: Story) -> Any:
+            try:
+                values = get_items(story.slot_values)
+            except IndexError:
+                return fallback(story)
+            # The fallback raises the AttributeError of the unassigned property.
+            if single:
+                if values is _UNASSIGNED:
+                    return fallback(story)
+            elif any(map(is_, values, repeat(_UNASSIGNED))):
+                return fallback(story)
+            return values
+
+        return get_values
+
+    def create_story(self, values: "Optional[List[Any]]" = None) -> Story:
+        return Story(self, values)
 
 
 def sort_stories_by_inline_weights(stories: "List[Story]") -> "List[Story]":
+    if not stories:
+        return []
+
+    for story in stories:
+        if story is None:
+            raise ValueError("The compare stories cannot be None.")
+        if story.factory is None or story.factory != stories[0].factory:
+            raise ValueError("The compare stories were built by different factory.")
+
     return sorted(
-        stories, key=cmp_to_key(compare_story_based_on_inline_weights), reverse=True
+        stories,
+        key=build_inline_weights_sort_key(stories[0].factory),
+        reverse=True,
     )
 
 
+def build_inline_weights_sort_key(
+    story_factory: StoryFactory,
+) -> "Callable[[Story], Tuple[Tuple[int, int], ...]]":
+    """
+    Build the sort key which gives the same order as the
+    :py:func:`compare_story_based_on_inline_weights`.
+
+    The comparator picks the highest priority which hasn't been compared of
+    each story again and again, and the earlier rule wins if the priorities
+    are the same. So the key of a story is the list of
+    (priority, -rule position) which is ordered in the same way.
+
+    parm story_factory:
+        The factory which creates the stories that need to be sorted
+
+    return
+        A function which can be used as the key of :py:func:`sorted`.
+    """
+    slot_indexes: List[Tuple[int, int]] = [
+        (story_factory.assign_slot(property_name), -rule_position)
+        for rule_position, (property_name, _) in enumerate(
+            story_factory.inline_weights_compare_rules
+        )
+    ]
+
+    def sort_key(story: Story) -> Tuple[Tuple[int, int], ...]:
+        return tuple(
+            sorted(
+                [
+                    (__get_priority_value(story.get_slot_value(slot_index)), position)
+                    for slot_index, position in slot_indexes
+                ],
+                reverse=True,
+            )
+        )
+
+    return sort_key
+
+
+def __get_priority_value(value: Any) -> int:
+    # Keep consistent with the comparison of the Priority.
+    if isinstance(value, int):
+        return int(value)
+    return -1
+
+
 def compare_story_based_on_inline_weights(
     story_a: Optional[Story], story_b: Optional[Story]
 ) -> int:
@@ -292,11 +508,14 @@ def compare_story_based_on_inline_weights(
 
 def sort_stories_by_property_and_order(
     stories: "List[Story]",
-    excel_definition_columns: "List[ExcelDefinitionColumn]",
+    excel_definition_columns: "Sequence[ExcelDefinitionColumn]",
     sort_strategy: Optional[SortStrategy],
 ):
     sort_rules: List[Tuple[str, bool]] = []
-    excel_definition_columns.sort(key=itemgetter("index"), reverse=False)
+    # The columns may be shared, so they are not sorted in place.
+    excel_definition_columns = sorted(
+        excel_definition_columns, key=itemgetter("index")
+    )
 
     parent_scope_index: Optional[Set[int]] = None
     if sort_strategy is not None:
@@ -336,8 +555,10 @@ def sort_stories_by_property_and_order(
 def __internal_sort_stories_by_property_and_order(
     stories: "List[Story]", sort_rules: "List[Tuple[str, bool]]"
 ):
-    for column_name, sort_order in reversed(sort_rules):
-        stories.sort(key=attrgetter(column_name), reverse=sort_order)
+    if not sort_rules or not stories:
+        return
+    sort_key, reverse = __build_sort_key(stories, sort_rules)
+    stories.sort(key=sort_key, reverse=reverse)
 
 
 def __internal_sort_stories_by_property_and_order_considering_parent_range(
@@ -347,53 +568,130 @@ def __internal_sort_stories_by_property_and_order_considering_parent_range(
     parent_level_index_range: "Set[int]",
 ) -> "List[Story]":
     """
-    Walk through all stories from 0 to N, only sort when
-    specified columns are all equaled.
+    Only sort the stories inside the group which the specified
+    parent columns are all equaled.
     """
-    begin_index = 0
-    end_index = 0
-    while end_index <= len(stories) - 1:
-        for i in range(begin_index, len(stories) - 1):
-            all_parent_column_matched = True
-            for column_index in parent_level_index_range:
-                if (
-                    stories[i][
-                        standardize_column_name(story_columns[column_index]["name"])
-                    ]
-                    != stories[i + 1][
-                        standardize_column_name(story_columns[column_index]["name"])
-                    ]
-                ):
-                    all_parent_column_matched = False
-                    break
-            if all_parent_column_matched:
-                continue
-            end_index = i
-            break
-        # Same parent level process
-        for column_name, sort_order in reversed(sort_rules):
-            if begin_index != end_index:
-                stories[begin_index: end_index + 1] = sorted(
-                    stories[begin_index: end_index + 1],
-                    key=attrgetter(column_name),
-                    reverse=sort_order,
-                )
+    if not sort_rules or not stories:
+        return stories
+    sort_key, reverse = __build_sort_key(stories, sort_rules)
+    for begin_index, end_index in __find_parent_groups(
+        stories, story_columns, parent_level_index_range
+    ):
+        stories[begin_index:end_index] = sorted(
+            stories[begin_index:end_index], key=sort_key, reverse=reverse
+        )
+    return stories
 
-        begin_index = end_index + 1
-        end_index = begin_index
 
-    return stories
+class _DescendingValue:
+    """Reverse the order of the value inside an ascending composite key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_DescendingValue") -> bool:
+        return bool(other.value < self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DescendingValue) and self.value == other.value
+
+
+def __build_property_getter(
+    stories: "List[Story]", property_names: "List[str]"
+) -> Callable[[Story], Any]:
+    story_factory = stories[0].factory
+    if all(story.factory is story_factory for story in stories):
+        return story_factory.property_getter(property_names)
+    return attrgetter(*property_names)
+
+
+def __build_sort_key(
+    stories: "List[Story]",
+    sort_rules: "List[Tuple[str, bool]]",
+) -> "Tuple[Callable[[Story], Any], bool]":
+    """
+    Build one composite key which gives the same order as sorting the stories
+    by each rule from the last one to the first one.
+
+    parm stories:
+        The stories which need to be sorted
+
+    parm sort_rules:
+        The property name and whether it is descending
+
+    return
+        The key function and the reverse flag for the :py:func:`sorted`.
+    """
+    property_names = [property_name for property_name, _ in sort_rules]
+    sort_orders = {sort_order for _, sort_order in sort_rules}
+    if len(sort_orders) == 1:
+        # All rules have the same direction, so the sort can be reversed
+        # as a whole.
+        return __build_property_getter(stories, property_names), sort_orders.pop()
+
+    get_values = __build_property_getter(stories, property_names)
+    descending = [sort_order for _, sort_order in sort_rules]
+
+    def sort_key(story: Story) -> Tuple[Any, ...]:
+        return tuple(
+            _DescendingValue(value) if is_descending else value
+            for value, is_descending in zip(get_values(story), descending)
+        )
+
+    return sort_key, False
+
+
+def __find_parent_groups(
+    stories: "List[Story]",
+    story_columns: "Dict[int, ExcelDefinitionColumn]",
+    parent_level_index_range: "Set[int]",
+) -> "List[Tuple[int, int]]":
+    """
+    Find the ranges of the adjacent stories which have the same values in all
+    parent columns. Only the range which has more than one story and is
+    followed by a different parent will be returned, the stories after the
+    last change of the parent are kept as they are.
+
+    return
+        A list of the (begin, end) range. The end is exclusive.
+    """
+    groups: List[Tuple[int, int]] = []
+    if len(stories) < 2 or not parent_level_index_range:
+        return groups
+
+    get_parent_values = __build_property_getter(
+        stories,
+        [
+            standardize_column_name(story_columns[column_index]["name"])
+            for column_index in parent_level_index_range
+        ],
+    )
+    parent_values = [get_parent_values(story) for story in stories]
+
+    begin_index = 0
+    for i in range(len(parent_values) - 1):
+        if parent_values[i] != parent_values[i + 1]:
+            # Nothing to sort if there is only one story.
+            if i > begin_index:
+                groups.append((begin_index, i + 1))
+            begin_index = i + 1
+    return groups
 
 
 def sort_stories_by_raise_ranking(
     stories: "List[Story]",
-    excel_definition_columns: "List[ExcelDefinitionColumn]",
+    excel_definition_columns: "Sequence[ExcelDefinitionColumn]",
     sort_strategy: Optional[SortStrategy],
 ) -> "List[Story]":
     if stories is None:
         return []
     sort_rules: List[Tuple[str, int]] = []
-    excel_definition_columns.sort(key=itemgetter("index"), reverse=False)
+    # The columns may be shared, so they are not sorted in place.
+    excel_definition_columns = sorted(
+        excel_definition_columns, key=itemgetter("index")
+    )
 
     result = []
 
@@ -463,39 +761,43 @@ def __internal_raise_story_ranking_by_property_considering_parent_level(
     sort_rules: "List[Tuple[str, int]]",
     parent_level_index_range: "Set[int]",
 ) -> "List[Story]":
-    begin_index = 0
-    end_index = 0
-    while end_index <= len(stories) - 1:
-        for i in range(begin_index, len(stories) - 1):
-            all_parent_column_matched = True
-            for column_index in parent_level_index_range:
-                if (
-                    stories[i][
-                        standardize_column_name(story_columns[column_index]["name"])
-                    ]
-                    != stories[i + 1][
-                        standardize_column_name(story_columns[column_index]["name"])
-                    ]
-                ):
-                    all_parent_column_matched = False
-                    break
-            if all_parent_column_matched:
-                continue
-            end_index = i
-            break
-
-        # Same parent level process
-        for column_name, _ in reversed(sort_rules):
-            stories[begin_index: end_index + 1] = __raise_story_ranking_by_property(
-                stories[begin_index: end_index + 1], column_name
+    sort_keys: Dict[Tuple[str, ...], Callable[[Story], Any]] = {}
+    for begin_index, end_index in __find_parent_groups(
+        stories, story_columns, parent_level_index_range
+    ):
+        # Only bool indicator for now
+        property_names = tuple(
+            property_name
+            for property_name, _ in sort_rules
+            if isinstance(getattr(stories[begin_index], property_name), bool)
+        )
+        if not property_names:
+            continue
+        if property_names not in sort_keys:
+            sort_keys[property_names] = __build_raise_ranking_key(
+                __build_property_getter(stories, list(property_names)),
+                len(property_names),
             )
-
-        begin_index = end_index + 1
-        end_index = begin_index
+        stories[begin_index:end_index] = sorted(
+            stories[begin_index:end_index], key=sort_keys[property_names]
+        )
 
     return stories
 
 
+def __build_raise_ranking_key(
+    get_values: Callable[[Story], Any], property_count: int
+) -> Callable[[Story], Any]:
+    """
+    The stories which indicator is True will be raised. The stable sort keeps
+    the original order of the stories which have the same indicators, and the
+    first property is the primary key.
+    """
+    if property_count == 1:
+        return lambda story: not get_values(story)
+    return lambda story: tuple(not value for value in get_values(story))
+
+
 # Only bool indicator for now
 def __raise_story_ranking_by_property(
     stories: "List[Story]", property_name: str
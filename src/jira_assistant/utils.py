@@ -48,6 +48,7 @@ def parse_index_range(statement: Optional[str]) -> "Optional[Set[int]]":
 
 
 def dict_has_key(dictionary: Dict, key: str) -> bool:
-    if strip_lower(key) in [strip_lower(i) for i in dictionary.keys()]:
+    if key in dictionary:
         return True
-    return False
+    key = strip_lower(key)
+    return any(strip_lower(i) == key for i in dictionary.keys())
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from json import load
 from re import DOTALL, IGNORECASE, match, search
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from requests import Response
 from requests_mock import Adapter
@@ -14,12 +14,15 @@ from requests_mock.response import create_response
 
 from . import ASSETS_FILES
 
-mock_jira_stories: Dict[str, Dict[str, str]]
+mock_jira_stories: Dict[str, Dict[str, Any]]
 with open(ASSETS_FILES / "mock_jira_stories.json", encoding="utf-8") as file:
     mock_jira_stories = load(file)
 
+# The stories which match the "updated >=" filter of the search JQL.
+mock_recently_updated_story_ids: Set[str] = set()
 
-def custom_matcher(request: _RequestObjectProxy) -> Optional[Response]:
+
+def custom_matcher(request: _RequestObjectProxy) -> Optional[Response]:  # pylint: disable=too-many-return-statements
     if (
         search(pattern="^/rest/api/2/search", string=request.path, flags=IGNORECASE)
         is not None
@@ -63,6 +66,25 @@ def custom_matcher(request: _RequestObjectProxy) -> Optional[Response]:
         is not None
     ):
         return mock_create_issue_response(request)
+    if (
+        match(
+            pattern=r"^/rest/api/2/issue/bulk$",
+            string=request.path,
+            flags=IGNORECASE | DOTALL,
+        )
+        is not None
+    ):
+        return mock_create_issues_response(request)
+    if (
+        request.method == "PUT"
+        and match(
+            pattern=r"^/rest/api/2/issue/[\w-]+$",
+            string=request.path,
+            flags=IGNORECASE | DOTALL,
+        )
+        is not None
+    ):
+        return create_response(request=request, status_code=204)
     if (
         match(
             pattern=r"^/rest/api/2/issue/createmeta/\w{1,}?/issuetypes$",
@@ -90,6 +112,98 @@ def mock_jira_requests() -> Adapter:
     return adapter
 
 
+def custom_matcher_without_bulk_create(
+    request: _RequestObjectProxy,
+) -> Optional[Response]:
+    if (
+        match(
+            pattern=r"^/rest/api/2/issue/bulk$",
+            string=request.path,
+            flags=IGNORECASE | DOTALL,
+        )
+        is not None
+    ):
+        return create_response(
+            request=request,
+            status_code=404,
+            json={"errorMessages": ["Not Found"], "errors": {}},
+        )
+    return custom_matcher(request)
+
+
+def mock_jira_requests_without_bulk_create() -> Adapter:
+    adapter = Adapter(False)
+    adapter.add_matcher(custom_matcher_without_bulk_create)
+    return adapter
+
+
+def mock_jira_requests_with_bulk_create_error(
+    status_code: int, json: Dict[str, Any]
+) -> Adapter:
+    """The bulk create API always fails with the status code and the body."""
+
+    def matcher(request: _RequestObjectProxy) -> Optional[Response]:
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/bulk$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return create_response(request=request, status_code=status_code, json=json)
+        return custom_matcher(request)
+
+    adapter = Adapter(False)
+    adapter.add_matcher(matcher)
+    return adapter
+
+
+def mock_jira_requests_with_search_errors(
+    errors: List[Tuple[int, Dict[str, str]]]
+) -> Adapter:
+    """
+    The first search requests will fail with the status codes and the headers
+    one by one.
+    """
+    pending_errors = list(errors)
+
+    def matcher(request: _RequestObjectProxy) -> Optional[Response]:
+        if (
+            pending_errors
+            and search(
+                pattern="^/rest/api/2/search", string=request.path, flags=IGNORECASE
+            )
+            is not None
+        ):
+            status_code, headers = pending_errors.pop(0)
+            return create_response(
+                request=request,
+                status_code=status_code,
+                headers=headers,
+                json={"errorMessages": ["Rejected"], "errors": {}},
+            )
+        return custom_matcher(request)
+
+    adapter = Adapter(False)
+    adapter.add_matcher(matcher)
+    return adapter
+
+
+def mock_jira_requests_with_search_page_size_limit(page_size_limit: int) -> Adapter:
+    def matcher(request: _RequestObjectProxy) -> Optional[Response]:
+        if (
+            search(pattern="^/rest/api/2/search", string=request.path, flags=IGNORECASE)
+            is not None
+        ):
+            return mock_search_response(request, page_size_limit=page_size_limit)
+        return custom_matcher(request)
+
+    adapter = Adapter(False)
+    adapter.add_matcher(matcher)
+    return adapter
+
+
 def custom_matcher_with_failed_status_code(
     request: _RequestObjectProxy,
 ) -> Optional[Response]:
@@ -206,38 +320,79 @@ def mock_myself_response(
 
 
 def mock_search_response(
-    request: _RequestObjectProxy, status_code: int = 200
+    request: _RequestObjectProxy,
+    status_code: int = 200,
+    page_size_limit: Optional[int] = None,
 ) -> Response:
+    only_recently_updated = "updated >=" in request.qs["jql"][0]
     story_ids = [
         story_id.strip("'")
         for story_id in re.findall(r"('[\w-]+')+", request.qs["jql"][0])
+        # The stories which don't exist won't be returned.
+        if story_id.strip("'") in mock_jira_stories
+        and (
+            not only_recently_updated
+            or story_id.strip("'") in mock_recently_updated_story_ids
+        )
     ]
 
+    start_at = int(request.qs.get("startat", ["0"])[0])
+    max_results = int(request.qs.get("maxresults", [str(len(story_ids))])[0])
+    if page_size_limit is not None:
+        max_results = min(max_results, page_size_limit)
+
     response_json = {
         "expand": "names,schema",
-        "startAt": 0,
-        "maxResults": len(story_ids),
+        "startAt": start_at,
+        "maxResults": max_results,
         "total": len(story_ids),
         "issues": [],
     }
 
-    for story_id in story_ids:
+    expand_changelog = "changelog" in request.qs.get("expand", [""])[0]
+
+    for story_id in story_ids[start_at: start_at + max_results]:
         new_story_id = mock_jira_stories[story_id].get("originalStoryId", None)
+        histories = []
         if new_story_id is None:
             new_story_id = story_id
-        if isinstance(response_json["issues"], list):
-            response_json["issues"].append(
+        else:
+            histories.append(
                 {
-                    "key": new_story_id,
-                    "fields": {
-                        "customfield_15601": {
-                            "value": mock_jira_stories[story_id]["domain"]
-                        },
-                        "status": {"name": mock_jira_stories[story_id]["status"]},
-                        "reporter": {"name": "Sharry", "displayName": "Big Monkey"},
-                    },
+                    "id": "1",
+                    "items": [
+                        {
+                            "field": "Key",
+                            "fieldtype": "jira",
+                            "fromString": story_id.upper(),
+                            "toString": new_story_id.upper(),
+                        }
+                    ],
                 }
             )
+        if isinstance(response_json["issues"], list):
+            issue = {
+                "key": new_story_id,
+                "fields": {
+                    "customfield_15601": {
+                        "value": mock_jira_stories[story_id]["domain"]
+                    },
+                    "status": {"name": mock_jira_stories[story_id]["status"]},
+                    "reporter": {"name": "Sharry", "displayName": "Big Monkey"},
+                    "customfield_12426": mock_jira_stories[story_id].get(
+                        "developmentImpact", None
+                    ),
+                    "labels": mock_jira_stories[story_id].get("labels", []),
+                },
+            }
+            if expand_changelog:
+                issue["changelog"] = {
+                    "startAt": 0,
+                    "maxResults": len(histories),
+                    "total": len(histories),
+                    "histories": histories,
+                }
+            response_json["issues"].append(issue)
 
     return create_response(request=request, status_code=status_code, json=response_json)
 
@@ -307,6 +462,16 @@ def mock_field_response(
                 "clauseNames": ["description"],
                 "schema": {"type": "string", "system": "description"},
             },
+            {
+                "id": "labels",
+                "name": "Labels",
+                "custom": False,
+                "orderable": True,
+                "navigable": True,
+                "searchable": True,
+                "clauseNames": ["labels"],
+                "schema": {"type": "array", "items": "string", "system": "labels"},
+            },
         ],
     )
 
@@ -688,6 +853,39 @@ def mock_create_issue_response(
     )
 
 
+def mock_create_issues_response(
+    request: _RequestObjectProxy, status_code: int = 201
+) -> Response:
+    issues = []
+    errors = []
+    for index, issue_update in enumerate(request.json()["issueUpdates"]):
+        # The issue without summary cannot be created.
+        if not issue_update["fields"].get("summary", None):
+            errors.append(
+                {
+                    "status": 400,
+                    "elementErrors": {
+                        "errorMessages": [],
+                        "errors": {"summary": "You must specify a summary."},
+                    },
+                    "failedElementNumber": index,
+                }
+            )
+            continue
+        issues.append(
+            {
+                "id": str(1252056 + index),
+                "key": f"SD-{123 + index}",
+                "self": f"https://your_jira.com/rest/api/2/issue/{1252056 + index}",
+            }
+        )
+    return create_response(
+        request=request,
+        status_code=status_code,
+        json={"issues": issues, "errors": errors},
+    )
+
+
 def mock_jira_requests_with_error_response() -> Adapter:
     adapter = Adapter(False)
     adapter.add_matcher(custom_matcher_with_error_response)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import pathlib
+from json import dump, dumps, load
 from os import environ
 
 import pytest
@@ -11,13 +12,14 @@ from jira_assistant.assistant import (
     run_steps_and_sort_excel_file,
 )
 from jira_assistant.excel_definition import ExcelDefinition
-from jira_assistant.excel_operation import read_excel_file
+from jira_assistant.excel_operation import output_to_excel_file, read_excel_file
 from jira_assistant.jira_client import JiraClient
 from jira_assistant.sprint_schedule import SprintScheduleStore
 from jira_assistant.story import compare_story_based_on_inline_weights
 from tests.mock_server import (
     mock_jira_requests,
     mock_jira_requests_with_failed_status_code,
+    mock_jira_stories,
 )
 from tests.utils import read_stories_from_excel
 
@@ -281,6 +283,46 @@ def test_run_steps_and_sort_excel_file_with_raise_ranking_file(tmpdir):
                 raise AssertionError
 
 
+@pytest.mark.parametrize(
+    "excel_definition_file",
+    [
+        SRC_ASSETS / "excel_definition.json",
+        ASSETS_FILES / "excel_definition_with_raise_ranking.json",
+    ],
+)
+def test_run_steps_and_sort_excel_file_streaming(tmpdir, excel_definition_file):
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        for streaming in (False, True):
+            run_steps_and_sort_excel_file(
+                ASSETS_FILES / "excel.xlsx",
+                tmpdir / f"excel_sorted_{streaming}.xlsx",
+                excel_definition_file=str(excel_definition_file),
+                sprint_schedule_file=str(SRC_ASSETS / "sprint_schedule.json"),
+                env_file=ASSETS_ENV_FILES / "default.env",
+                streaming=streaming,
+            )
+
+    default_columns, default_stories = read_stories_from_excel(
+        tmpdir / "excel_sorted_False.xlsx",
+        excel_definition_file,
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    streaming_columns, streaming_stories = read_stories_from_excel(
+        tmpdir / "excel_sorted_True.xlsx",
+        excel_definition_file,
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+
+    # The streamed file is the same as the default one.
+    assert streaming_columns == default_columns
+    assert len(streaming_stories) == len(default_stories) > 0
+    for streaming_story, default_story in zip(streaming_stories, default_stories):
+        for column in default_columns:
+            assert streaming_story.format_value(column) == default_story.format_value(
+                column
+            )
+
+
 def test_run_steps_and_sort_excel_file_missing_jira_url(capsys, tmpdir):
     with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
         run_steps_and_sort_excel_file(
@@ -350,6 +392,33 @@ def test_generate_jira_field_mapping_file(tmpdir):
         assert output_file.exists() is True
 
 
+def test_generate_jira_field_mapping_file_content(tmpdir):
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        output_file = pathlib.Path(tmpdir) / "jira_field_mapping.json"
+        compact_output_file = pathlib.Path(tmpdir) / "jira_field_mapping_compact.json"
+
+        assert generate_jira_field_mapping_file(
+            file=output_file, env_file=ASSETS_ENV_FILES / "default.env"
+        )
+        assert generate_jira_field_mapping_file(
+            file=compact_output_file,
+            env_file=ASSETS_ENV_FILES / "default.env",
+            compact=True,
+        )
+
+        all_fields = JiraClient(
+            environ["JIRA_URL"], environ["JIRA_ACCESS_TOKEN"]
+        ).get_all_fields()
+        assert "Status" in all_fields
+        # The streamed file is the same as dumping all fields at once.
+        assert output_file.read_text(encoding="utf-8") == dumps(
+            all_fields, indent=4, sort_keys=True
+        )
+        assert compact_output_file.read_text(encoding="utf-8") == dumps(
+            all_fields, separators=(",", ":"), sort_keys=True
+        )
+
+
 def test_generate_jira_field_mapping_file_over_write_is_true(tmpdir):
     with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
         output_file: pathlib.Path = pathlib.Path(tmpdir) / "jira_field_mapping.json"
@@ -470,6 +539,238 @@ def test_create_jira_stories_and_sort_excel_file(tmpdir):
         assert stories[0]["storyid"] is not None
 
 
+def test_create_jira_stories_with_same_project_and_issue_type(tmpdir):
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel_create_story.xlsx",
+        ASSETS_FILES / "excel_definition_create_story.json",
+        ASSETS_FILES / "sprint_schedule.json",
+    )
+    output_to_excel_file(tmpdir / "excel_create_stories.xlsx", stories * 20, columns)
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        run_steps_and_sort_excel_file(
+            tmpdir / "excel_create_stories.xlsx",
+            tmpdir / "excel_create_stories_sorted.xlsx",
+            excel_definition_file=str(
+                ASSETS_FILES / "excel_definition_create_story.json"
+            ),
+            sprint_schedule_file=str(ASSETS_FILES / "sprint_schedule.json"),
+            env_file=ASSETS_ENV_FILES / "default.env",
+        )
+
+        assert [request.path for request in mocker.request_history].count(
+            "/rest/api/2/issue/bulk"
+        ) == 1
+
+    _, sorted_stories = read_stories_from_excel(
+        tmpdir / "excel_create_stories_sorted.xlsx",
+        ASSETS_FILES / "excel_definition_create_story.json",
+        ASSETS_FILES / "sprint_schedule.json",
+    )
+    assert len(sorted_stories) == 20
+    assert all(story["storyid"] for story in sorted_stories)
+
+
+def test_update_jira_information(capsys, tmpdir):
+    with open(SRC_ASSETS / "excel_definition.json", encoding="utf-8") as file:
+        definition = load(file)
+    definition[1]["PreProcessSteps"].append(
+        {"Priority": 5, "Name": "UpdateJiraInformation", "Enabled": True, "Config": {}}
+    )
+    for column in definition[2]["Columns"]:
+        if column["Name"] == "domain":
+            column["QueryJiraInfo"] = False
+            column["UpdateJiraInfo"] = True
+    with open(tmpdir / "excel_definition.json", mode="w", encoding="utf-8") as file:
+        dump(definition, file)
+
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel.xlsx",
+        tmpdir / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    # The domain of A-2 is A and the domain of B-1 is B in Jira.
+    domains = {"A-1": "X", "A-2": "A", "B-1": "Y", "C-1": None}
+    for story in stories:
+        story["domain"] = domains.get(story["storyid"], None)
+    output_to_excel_file(tmpdir / "excel_update.xlsx", stories, columns)
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        run_steps_and_sort_excel_file(
+            tmpdir / "excel_update.xlsx",
+            tmpdir / "excel_update_sorted.xlsx",
+            excel_definition_file=str(tmpdir / "excel_definition.json"),
+            sprint_schedule_file=str(SRC_ASSETS / "sprint_schedule.json"),
+            env_file=ASSETS_ENV_FILES / "default.env",
+        )
+
+        updates = {
+            request.path: request.json()["fields"]
+            for request in mocker.request_history
+            if request.method == "PUT"
+        }
+
+    # A-1 has been moved to D-1. A-2 is not changed and C-1 is empty.
+    assert updates == {
+        "/rest/api/2/issue/d-1": {"customfield_15601": {"value": "X"}},
+        "/rest/api/2/issue/b-1": {"customfield_15601": {"value": "Y"}},
+    }
+    output = capsys.readouterr().out
+    assert "Updated story: D-1." in output
+    assert "Updated story: B-1." in output
+
+    _, sorted_stories = read_stories_from_excel(
+        tmpdir / "excel_update_sorted.xlsx",
+        tmpdir / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    # The values in the Excel are kept.
+    assert {
+        story["storyid"]: story["domain"]
+        for story in sorted_stories
+        if story["domain"] is not None
+    } == {"D-1": "X", "A-2": "A", "B-1": "Y"}
+
+
+def test_update_jira_info_column_without_update_step(tmpdir):
+    with open(SRC_ASSETS / "excel_definition.json", encoding="utf-8") as file:
+        definition = load(file)
+    for column in definition[2]["Columns"]:
+        if column["Name"] == "domain":
+            column["QueryJiraInfo"] = False
+            column["UpdateJiraInfo"] = True
+    with open(tmpdir / "excel_definition.json", mode="w", encoding="utf-8") as file:
+        dump(definition, file)
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        run_steps_and_sort_excel_file(
+            ASSETS_FILES / "excel.xlsx",
+            tmpdir / "excel_sorted.xlsx",
+            excel_definition_file=str(tmpdir / "excel_definition.json"),
+            sprint_schedule_file=str(SRC_ASSETS / "sprint_schedule.json"),
+            env_file=ASSETS_ENV_FILES / "default.env",
+        )
+
+        search_requests = [
+            request
+            for request in mocker.request_history
+            if request.path == "/rest/api/2/search"
+        ]
+
+    # The UpdateJiraInformation step is not enabled.
+    assert search_requests
+    assert all(
+        "customfield_15601" not in request.qs.get("fields", [])
+        for request in search_requests
+    )
+
+
+def test_update_jira_information_number_column(tmpdir):
+    with open(SRC_ASSETS / "excel_definition.json", encoding="utf-8") as file:
+        definition = load(file)
+    definition[1]["PreProcessSteps"].append(
+        {"Priority": 5, "Name": "UpdateJiraInformation", "Enabled": True, "Config": {}}
+    )
+    for column in definition[2]["Columns"]:
+        if column["Name"] == "developmentImpact":
+            column["Type"] = "Number"
+            column["UpdateJiraInfo"] = True
+    with open(tmpdir / "excel_definition.json", mode="w", encoding="utf-8") as file:
+        dump(definition, file)
+
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel.xlsx",
+        tmpdir / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    # The cells are read as int, but Jira returns float.
+    development_impacts = {"A-2": 1, "B-1": 2}
+    for story in stories:
+        story["developmentImpact"] = development_impacts.get(story["storyid"], None)
+    output_to_excel_file(tmpdir / "excel_update.xlsx", stories, columns)
+
+    mock_jira_stories["a-2"]["developmentImpact"] = 1.0
+    mock_jira_stories["b-1"]["developmentImpact"] = 1.0
+    try:
+        with Mocker(
+            real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+        ) as mocker:
+            run_steps_and_sort_excel_file(
+                tmpdir / "excel_update.xlsx",
+                tmpdir / "excel_update_sorted.xlsx",
+                excel_definition_file=str(tmpdir / "excel_definition.json"),
+                sprint_schedule_file=str(SRC_ASSETS / "sprint_schedule.json"),
+                env_file=ASSETS_ENV_FILES / "default.env",
+            )
+
+            updates = {
+                request.path: request.json()["fields"]
+                for request in mocker.request_history
+                if request.method == "PUT"
+            }
+    finally:
+        del mock_jira_stories["a-2"]["developmentImpact"]
+        del mock_jira_stories["b-1"]["developmentImpact"]
+
+    # A-2 is not changed, 1 is the same as 1.0.
+    assert list(updates.keys()) == ["/rest/api/2/issue/b-1"]
+
+
+def test_update_jira_information_array_field(tmpdir):
+    with open(SRC_ASSETS / "excel_definition.json", encoding="utf-8") as file:
+        definition = load(file)
+    definition[1]["PreProcessSteps"].append(
+        {"Priority": 5, "Name": "UpdateJiraInformation", "Enabled": True, "Config": {}}
+    )
+    for column in definition[2]["Columns"]:
+        if column["Name"] == "Request":
+            column["JiraFieldMapping"] = {"name": "Labels", "path": "labels"}
+            column["UpdateJiraInfo"] = True
+    with open(tmpdir / "excel_definition.json", mode="w", encoding="utf-8") as file:
+        dump(definition, file)
+
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel.xlsx",
+        tmpdir / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    # The labels are separated by the default delimiter in one cell.
+    requests = {"A-2": "A|B", "B-1": "X|Y"}
+    for story in stories:
+        story["request"] = requests.get(story["storyid"], None)
+    output_to_excel_file(tmpdir / "excel_update.xlsx", stories, columns)
+
+    mock_jira_stories["a-2"]["labels"] = ["A", "B"]
+    try:
+        with Mocker(
+            real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+        ) as mocker:
+            run_steps_and_sort_excel_file(
+                tmpdir / "excel_update.xlsx",
+                tmpdir / "excel_update_sorted.xlsx",
+                excel_definition_file=str(tmpdir / "excel_definition.json"),
+                sprint_schedule_file=str(SRC_ASSETS / "sprint_schedule.json"),
+                env_file=ASSETS_ENV_FILES / "default.env",
+            )
+
+            updates = {
+                request.path: request.json()["fields"]
+                for request in mocker.request_history
+                if request.method == "PUT"
+            }
+    finally:
+        del mock_jira_stories["a-2"]["labels"]
+
+    # A-2 is not changed, the labels are the same as the ones in Jira.
+    assert updates == {"/rest/api/2/issue/b-1": {"labels": ["X", "Y"]}}
+
+
 def test_create_jira_stories_invalid_value(capsys, tmpdir):
     with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
         run_steps_and_sort_excel_file(
@@ -26,6 +26,53 @@ def test_process_excel_file(tmpdir):
     assert (tmpdir / "excel_sorted.xlsx").exists()
 
 
+def test_process_excel_file_with_profile(tmpdir):
+    result = run(
+        [
+            "process-excel-file",
+            ASSETS_FILES / "excel.xlsx",
+            "--output-folder",
+            tmpdir,
+            "--excel-definition-file",
+            ASSETS_FILES / "excel_definition_avoid_jira_operations.json",
+            "--sprint-schedule-file",
+            ASSETS_FILES / "sprint_schedule.json",
+            "--profile",
+            "--profile-trace",
+            tmpdir / "trace.json",
+        ],
+        capture_output=True,
+        check=True,
+    )
+
+    output = result.stdout.decode("utf-8")
+    assert "Time (ms)" in output
+    assert "FilterOutStoryWithoutId" in output
+    assert "trace.json has been saved" in output
+    assert (tmpdir / "trace.json").exists()
+
+
+def test_process_excel_file_with_streaming(tmpdir):
+    result = run(
+        [
+            "process-excel-file",
+            ASSETS_FILES / "excel.xlsx",
+            "--output-folder",
+            tmpdir,
+            "--excel-definition-file",
+            ASSETS_FILES / "excel_definition_avoid_jira_operations.json",
+            "--sprint-schedule-file",
+            ASSETS_FILES / "sprint_schedule.json",
+            "--streaming",
+        ],
+        capture_output=True,
+        check=True,
+    )
+
+    assert "xlsx has been saved" in result.stdout.decode("utf-8")
+    assert (tmpdir / "excel_sorted.xlsx").exists()
+
+
 def test_process_excel_file_output_version():
     result = run(
         ["process-excel-file", "--version"],
@@ -250,6 +297,25 @@ def test_generate_template_jira_field_mapping_failed(tmpdir):
     assert "Generate failed! Template type: jira-field-mapping." in str(e.value.stdout)
 
 
+def test_generate_template_jira_field_mapping_compact_failed(tmpdir):
+    with pytest.raises(CalledProcessError) as e:
+        run(
+            [
+                "generate-template",
+                "jira-field-mapping",
+                "--compact",
+                "--output-folder",
+                tmpdir,
+                "--env_file",
+                ASSETS_ENV_FILES / "default.env",
+            ],
+            capture_output=True,
+            check=True,
+        )
+
+    assert "Generate failed! Template type: jira-field-mapping." in str(e.value.stdout)
+
+
 def test_generate_template_failed():
     with pytest.raises(CalledProcessError) as e:
         run(["generate-template", "abc"], capture_output=True, check=True)
@@ -279,6 +345,24 @@ def test_update_jira_info():
     assert "Add/Update jira user email success" in result.stdout.decode("utf-8")
 
 
+def test_update_jira_info_clear_cache_with_custom_cache_folder(tmpdir):
+    cache_folder = tmpdir / "cache"
+    cache_folder.mkdir()
+    cache_file = cache_folder / "abc.metadata.json"
+    cache_file.write_text("{}", encoding="utf-8")
+    env_file = tmpdir / "custom.env"
+    env_file.write_text(f"JIRA_CACHE_FOLDER={cache_folder}", encoding="utf-8")
+
+    result = run(
+        ["update-jira-info", "--clear-cache", "--env-file", env_file],
+        capture_output=True,
+        check=True,
+    )
+
+    assert "Clear jira metadata cache success" in result.stdout.decode("utf-8")
+    assert not cache_file.exists()
+
+
 def test_update_jira_info_output_version():
     result = run(
         ["update-jira-info", "--v"],
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=line-too-long
+from json import dumps
+
 from pytest import raises
 
 from jira_assistant.excel_definition import (
+    CompiledExcelDefinition,
     ExcelDefinition,
     PreProcessStep,
     parse_json_item_to_pre_process_step,
@@ -117,6 +120,51 @@ def test_validate():
     assert len(validation_result) == 0
 
 
+def test_validate_compiled():
+    excel_definition_filename = ASSETS_FILES / "excel_definition.json"
+    store = ExcelDefinition()
+    store.load_file(excel_definition_filename)
+    assert store.compiled is None
+
+    store.validate()
+    compiled = store.compiled
+
+    assert isinstance(compiled, CompiledExcelDefinition)
+    assert list(compiled.columns) == store.get_columns()
+    assert list(compiled.get_columns_name()) == store.get_columns_name()
+    assert list(compiled.get_columns_name(False)) == store.get_columns_name(False)
+    assert compiled.get_column_by_name("Story Id") == store.get_columns()[22]
+    assert compiled.get_column_by_index(3) == store.get_columns()[2]
+    assert compiled.get_column_by_index(100) is None
+    assert list(compiled.get_column_by_jira_field_mapping_name("Status")) == (
+        store.get_column_by_jira_field_mapping_name("status")
+    )
+    assert compiled.get_column_by_jira_field_mapping_name("unknown") == ()
+    for enabled in (True, False):
+        assert [step.name for step in compiled.get_pre_process_steps(enabled)] == [
+            step.name for step in store.get_pre_process_steps(enabled)
+        ]
+        assert [
+            strategy.name for strategy in compiled.get_sort_strategies(enabled)
+        ] == [strategy.name for strategy in store.get_sort_strategies(enabled)]
+    step = compiled.get_pre_process_step_by_name("retrieveJiraInformation")
+    assert step is not None
+    assert step.priority == store.get_pre_process_step_by_name(step.name).priority
+    assert compiled.get_pre_process_step_by_name("CreateJiraStory") is None
+    assert compiled.get_pre_process_step_by_name("CreateJiraStory", False) is not None
+    # The compiled definition is not the same object as the definition.
+    assert compiled.columns[0] is not store.get_columns()[0]
+
+
+def test_validate_compiled_invalid_definition():
+    excel_definition_filename = ASSETS_FILES / "excel_definition_duplicate_index.json"
+    store = ExcelDefinition()
+    store.load_file(excel_definition_filename)
+
+    assert len(store.validate()) > 0
+    assert store.compiled is None
+
+
 def test_validate_missing_story_id():
     excel_definition_filename = ASSETS_FILES / "excel_definition_missing_story_id.json"
     store = ExcelDefinition()
@@ -413,3 +461,87 @@ def test_validate_filter_out_story_based_on_jira_status_missing_pre_step():
         "The step named RetrieveJiraInformation must be processed before FilterOutStoryBasedOnJiraStatus."
         in validation_result[0]
     )
+
+
+def test_validate_update_jira_information():
+    store = ExcelDefinition()
+    store.load(
+        dumps(
+            [
+                {
+                    "PreProcessSteps": [
+                        {
+                            "Priority": 1,
+                            "Name": "UpdateJiraInformation",
+                            "Enabled": True,
+                            "Config": {},
+                        },
+                    ],
+                    "SortStrategies": [],
+                },
+                {
+                    "Columns": [
+                        {"Index": 1, "Name": "StoryId", "Type": "str"},
+                        {
+                            "Index": 2,
+                            "Name": "Summary",
+                            "Type": "str",
+                            "UpdateJiraInfo": True,
+                        },
+                        {
+                            "Index": 3,
+                            "Name": "Due",
+                            "Type": "datetime",
+                            "JiraFieldMapping": {"name": "duedate", "path": "duedate"},
+                            "QueryJiraInfo": True,
+                            "UpdateJiraInfo": True,
+                        },
+                    ]
+                },
+            ]
+        )
+    )
+
+    validation_result = store.validate()
+
+    assert validation_result == [
+        "The step named RetrieveJiraInformation must be processed before UpdateJiraInformation.",
+        "Update Jira Info requires the Jira Field Mapping. Column: Summary",
+        "Query Jira Info and Update Jira Info cannot be both enabled. Column: Due",
+        "Column do not support Update Jira Info. Currently only str and number type support. Column: Due",
+    ]
+
+
+def test_validate_incremental_config():
+    store = ExcelDefinition()
+    store.load(
+        dumps(
+            [
+                {
+                    "PreProcessSteps": [
+                        {
+                            "Priority": 1,
+                            "Name": "RetrieveJiraInformation",
+                            "Enabled": True,
+                            "Config": {"Incremental": "yes"},
+                        },
+                        {
+                            "Priority": 2,
+                            "Name": "FilterOutStoryWithoutId",
+                            "Enabled": True,
+                            "Config": {"Incremental": True},
+                        },
+                    ],
+                    "SortStrategies": [],
+                },
+                {"Columns": [{"Index": 1, "Name": "StoryId", "Type": "str"}]},
+            ]
+        )
+    )
+
+    validation_result = store.validate()
+
+    assert validation_result == [
+        "The format of the Incremental is invalid. PreProcessStep: RetrieveJiraInformation. Supported format like: true/false.",
+        "Only RetrieveJiraInformation step support Incremental config. PreProcessStep: FilterOutStoryWithoutId.",
+    ]
@@ -54,6 +54,20 @@ def test_read_excel_file_empty_row():
 
     assert len(columns) == 29
     assert len(stories) == 2
+    assert [story.excel_row_index for story in stories] == [2, 4]
+
+
+def test_read_excel_file_decode_values():
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel_with_empty_row.xlsx",
+        SRC_ASSETS / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+
+    assert len(columns) == 29
+    assert stories[0]["storyId"] == "A-1"
+    assert stories[0]["sprint"].priority == 2
+    assert stories[1]["sprint"].priority == 9
 
 
 def test_read_excel_file_missing_columns():
@@ -127,3 +141,35 @@ def test_output_to_excel_file_path_already_exist_over_write_is_false(tmpdir):
         )
 
     assert "already exist." in str(e.value)
+
+
+def test_output_to_excel_file_streaming(tmpdir):
+    columns, stories = read_stories_from_excel(
+        ASSETS_FILES / "excel.xlsx",
+        SRC_ASSETS / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+
+    output_to_excel_file(tmpdir / "excel_default.xlsx", stories, columns)
+    output_to_excel_file(
+        tmpdir / "excel_streaming.xlsx", stories, columns, streaming=True
+    )
+
+    default_columns, default_stories = read_stories_from_excel(
+        tmpdir / "excel_default.xlsx",
+        SRC_ASSETS / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+    streaming_columns, streaming_stories = read_stories_from_excel(
+        tmpdir / "excel_streaming.xlsx",
+        SRC_ASSETS / "excel_definition.json",
+        SRC_ASSETS / "sprint_schedule.json",
+    )
+
+    assert streaming_columns == default_columns == columns
+    assert len(streaming_stories) == len(default_stories) == len(stories)
+    for streaming_story, default_story in zip(streaming_stories, default_stories):
+        for column in columns:
+            assert streaming_story.format_value(column) == default_story.format_value(
+                column
+            )
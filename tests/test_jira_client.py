@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import pathlib
+import re
+from json import dumps, loads
+from typing import List
+
 from requests_mock import Mocker
 
+from jira_assistant import jira_metadata_cache, jira_transport
 from jira_assistant.jira_client import (
     JiraClient,
+    JiraField,
     JiraIssueType,
     JiraProject,
     connect_jira_field_path,
@@ -12,12 +19,20 @@ from jira_assistant.jira_client import (
     get_field_paths_of_jira_field,
     get_jira_field,
     is_jira_cloud_url,
+    reload_jira_field_types,
 )
+from jira_assistant.jira_metadata_cache import JiraMetadataCache, JiraStoryCache
+from jira_assistant.profiler import Profiler
 from tests.mock_server import (
     mock_jira_requests,
     mock_jira_requests_with_error_response,
+    mock_jira_requests_with_bulk_create_error,
     mock_jira_requests_with_failed_status_code,
+    mock_jira_requests_with_search_errors,
+    mock_jira_requests_with_search_page_size_limit,
+    mock_jira_requests_without_bulk_create,
     mock_jira_stories,
+    mock_recently_updated_story_ids,
 )
 
 from . import ASSETS_FILES
@@ -52,6 +67,23 @@ def test_jira_issue_type():
     assert issue_type.project_id == 3
 
 
+def test_jira_field_is_value_allowed():
+    field = JiraField(
+        True,
+        True,
+        "Component/s",
+        "components",
+        {"component.name": ["Backend", "Frontend"]},
+    )
+
+    assert field.is_value_allowed("Backend", "component.name")
+    assert not field.is_value_allowed("backend", "component.name")
+    assert field.is_value_allowed("backend", "component.name", ignore_case=True)
+    assert not field.is_value_allowed("Mobile", "component.name", ignore_case=True)
+    assert not field.is_value_allowed(None, "component.name", ignore_case=True)
+    assert field.is_value_allowed("Mobile", "component.id")
+
+
 def test_connect_jira_field_path():
     assert connect_jira_field_path("a", "b") == "a.b"
     assert connect_jira_field_path("a", None) == "a"
@@ -110,6 +142,376 @@ def test_get_stories_detail_with_large_amount_of_stories():
         assert len(stories) == 247
 
 
+def test_get_stories_detail_concurrently():
+    jira_fields = [
+        {
+            "name": "domain",
+            "jira_name": "customfield_15601",
+            "jira_path": "customfield_15601.value",
+        },
+        {
+            "name": "status",
+            "jira_name": "status",
+            "jira_path": "status.name",
+        },
+    ]
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        sequential_client = JiraClient(
+            DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN, max_workers=1
+        )
+        concurrent_client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            max_workers=8,
+            requests_per_second=100,
+        )
+
+        expected = sequential_client.get_stories_detail(
+            list(mock_jira_stories.keys()), jira_fields
+        )
+        actual = concurrent_client.get_stories_detail(
+            list(mock_jira_stories.keys()), jira_fields
+        )
+
+        assert len(actual) == 247
+        assert list(actual.items()) == list(expected.items())
+
+
+def test_get_stories_detail_with_search_page_size_limit():
+    jira_fields = [
+        {
+            "name": "status",
+            "jira_name": "status",
+            "jira_path": "status.name",
+        },
+    ]
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        expected = JiraClient(
+            DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN
+        ).get_stories_detail(list(mock_jira_stories.keys()), jira_fields)
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_search_page_size_limit(50),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        stories = client.get_stories_detail(list(mock_jira_stories.keys()), jira_fields)
+
+        # The batch of 200 stories is retrieved in 4 pages.
+        assert sorted(
+            int(request.qs["startat"][0])
+            for request in mocker.request_history
+            if request.path == "/rest/api/2/search"
+        ) == [0, 0, 50, 100, 150]
+        assert stories == expected
+
+        start = len(mocker.request_history)
+        stories = client.get_stories_detail(list(mock_jira_stories.keys()), jira_fields)
+
+        # The batches fit in one page after the page size has been observed.
+        assert [
+            int(request.qs["startat"][0])
+            for request in mocker.request_history[start:]
+        ] == [0] * 5
+        assert stories == expected
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.delays: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.delays.append(seconds)
+        self.now += seconds
+
+
+def test_retry_on_too_many_requests_and_service_unavailable(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(jira_transport, "monotonic", clock.monotonic)
+    monkeypatch.setattr(jira_transport, "sleep", clock.sleep)
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_search_errors(
+            [(429, {"Retry-After": "2"}), (503, {})]
+        ),
+    ) as mocker:
+        # The rate limit is shared by the clients of the same host.
+        client = JiraClient(
+            "http://retry.localhost",
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            transport_config={"max_retries": 3, "backoff_factor": 0.5},
+        )
+
+        stories = client.get_stories_detail(
+            ["A-2", "B-1"],
+            [{"name": "status", "jira_name": "status", "jira_path": "status.name"}],
+        )
+
+        assert len(stories) == 2
+        assert [
+            request.path for request in mocker.request_history
+        ].count("/rest/api/2/search") == 3
+        # The Retry-After header is respected, otherwise the backoff is doubled
+        # after each retry with the jitter.
+        assert clock.delays[0] == 2
+        assert 0.5 <= clock.delays[1] <= 1
+        assert client.request_counters == {
+            "requests": 3,
+            "throttled": 1,
+            "retried": 2,
+        }
+
+
+def test_get_stories_detail_with_profiler(monkeypatch):
+    monkeypatch.setattr(jira_transport, "sleep", _FakeClock().sleep)
+    profiler = Profiler()
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_search_errors([(503, {})]),
+    ):
+        client = JiraClient(
+            "http://profile.localhost", DEFAULT_JIRA_ACCESS_TOKEN, profiler=profiler
+        )
+
+        client.get_stories_detail(
+            ["A-2", "B-1"],
+            [{"name": "status", "jira_name": "status", "jira_path": "status.name"}],
+        )
+
+    search_requests = [
+        request
+        for request in profiler.requests
+        if request["endpoint"] == "/rest/api/2/search"
+    ]
+    # The retry is recorded separately.
+    assert [request["outcome"] for request in search_requests] == ["503", "200"]
+    assert all(request["method"] == "GET" for request in search_requests)
+    assert search_requests[1]["response_size"] > 0
+    assert search_requests[1]["latency"] >= 0
+
+
+def test_retry_exceeds_max_retries(monkeypatch, capsys):
+    clock = _FakeClock()
+    monkeypatch.setattr(jira_transport, "monotonic", clock.monotonic)
+    monkeypatch.setattr(jira_transport, "sleep", clock.sleep)
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_search_errors(
+            [
+                (
+                    429,
+                    {
+                        "Retry-After": "120",
+                        "X-RateLimit-FillRate": "10",
+                        "X-RateLimit-Interval-Seconds": "5",
+                    },
+                )
+            ]
+            * 3
+        ),
+    ) as mocker:
+        client = JiraClient(
+            "http://give-up.localhost",
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            transport_config={"max_retries": 2, "max_retry_delay": 5},
+        )
+
+        stories = client.get_stories_detail(
+            ["A-2"],
+            [{"name": "status", "jira_name": "status", "jira_path": "status.name"}],
+        )
+
+        assert not stories
+        assert [
+            request.path for request in mocker.request_history
+        ].count("/rest/api/2/search") == 3
+        assert clock.delays == [5, 5]
+        assert client.request_counters == {
+            "requests": 3,
+            "throttled": 3,
+            "retried": 2,
+        }
+        assert "Calling search API failed" in capsys.readouterr().out
+
+
+def test_get_stories_detail_with_formatted_search_result():
+    search_result = {
+        "expand": "names,schema",
+        "names": {"status": "Status", "customfield_15601": "Domain"},
+        "issues": [
+            {
+                "key": "A-1",
+                "fields": {
+                    "status": {"name": "OPEN, \"Review\" ]"},
+                    "customfield_15601": None,
+                },
+            },
+            {"key": "A-2"},
+        ],
+        "startAt": 0,
+        "total": 2,
+    }
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+        mocker.get(
+            re.compile("/rest/api/2/search"), text=dumps(search_result, indent=4)
+        )
+
+        stories = client.get_stories_detail(
+            ["A-1", "A-2"],
+            [
+                {
+                    "name": "domain",
+                    "jira_name": "customfield_15601",
+                    "jira_path": "customfield_15601.value",
+                },
+                {
+                    "name": "status",
+                    "jira_name": "status",
+                    "jira_path": "status.name",
+                },
+                {
+                    "name": "status_id",
+                    "jira_name": "status",
+                    "jira_path": "status.id",
+                },
+            ],
+        )
+
+        # The top-level fields are only requested once.
+        assert mocker.last_request.qs["fields"] == ["customfield_15601", "status"]
+        assert stories == {
+            "a-1": {
+                "customfield_15601.value": "",
+                "status.name": 'OPEN, "Review" ]',
+                "status.id": None,
+            },
+            "a-2": {},
+        }
+
+
+def test_get_moved_stories_detail():
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        stories = client.get_moved_stories_detail(
+            ["A-1", "A-2"],
+            [
+                {
+                    "name": "status",
+                    "jira_name": "status",
+                    "jira_path": "status.name",
+                },
+            ],
+        )
+
+        # One search for all stories, no search for each story.
+        assert [
+            request.path for request in mocker.request_history
+        ].count("/rest/api/2/search") == 1
+        assert stories["a-1"] == ("d-1", {"status.name": "CLOSED"})
+        assert stories["a-2"] == ("a-2", {"status.name": "PENDING"})
+
+
+def test_get_stories_detail_incrementally(tmpdir):
+    jira_fields = [
+        {
+            "name": "status",
+            "jira_name": "status",
+            "jira_path": "status.name",
+        },
+    ]
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        expected = client.get_stories_detail(["A-2", "B-1"], jira_fields)
+        assert (
+            client.get_stories_detail(
+                ["A-2", "B-1"],
+                jira_fields,
+                story_cache=JiraStoryCache(DEFAULT_JIRA_URL, folder=tmpdir),
+            )
+            == expected
+        )
+
+        story_cache = JiraStoryCache(DEFAULT_JIRA_URL, folder=tmpdir)
+        # The key of A-1 will be changed to D-1.
+        story_cache.save_stories(
+            ["status.name"], {"a-1": {"status.name": "OPEN"}}, synced_at=0
+        )
+        mock_recently_updated_story_ids.update(["a-1", "a-2"])
+        try:
+            start = len(mocker.request_history)
+            stories = client.get_stories_detail(
+                ["A-1", "A-2", "B-1"], jira_fields, story_cache=story_cache
+            )
+        finally:
+            mock_recently_updated_story_ids.clear()
+
+        # Only the updated stories are retrieved.
+        queries = [
+            request.qs["jql"][0] for request in mocker.request_history[start:]
+        ]
+        assert len(queries) == 1
+        assert "updated >=" in queries[0]
+        assert stories == expected
+        assert set(story_cache.get_stories(["status.name"]).keys()) == {"a-2", "b-1"}
+
+        # The cache is not used when the other fields are queried.
+        assert not story_cache.get_stories(["status.name", "reporter.name"])
+
+
+def test_get_stories_detail_incrementally_drop_deleted_story(tmpdir, monkeypatch):
+    jira_fields = [
+        {
+            "name": "status",
+            "jira_name": "status",
+            "jira_path": "status.name",
+        },
+    ]
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+        story_cache = JiraStoryCache(DEFAULT_JIRA_URL, folder=tmpdir, ttl=60)
+        # X-1 has been deleted from Jira after it was cached.
+        story_cache.save_stories(
+            ["status.name"], {"x-1": {"status.name": "OPEN"}}, synced_at=0
+        )
+
+        # The searching of the updated stories cannot find the deleted story.
+        stories = client.get_stories_detail(
+            ["A-2", "X-1"], jira_fields, story_cache=story_cache
+        )
+        assert stories["x-1"] == {"status.name": "OPEN"}
+
+        # After the TTL, the story is searched again and dropped.
+        now = jira_metadata_cache.time() + 120
+        monkeypatch.setattr(jira_metadata_cache, "time", lambda: now)
+        stories = client.get_stories_detail(
+            ["A-2", "X-1"], jira_fields, story_cache=story_cache
+        )
+        assert "x-1" not in stories
+        assert "a-2" in stories
+        assert "x-1" not in story_cache.get_stories(["status.name"])
+        assert "x-1" not in JiraStoryCache(
+            DEFAULT_JIRA_URL, folder=tmpdir, ttl=60
+        ).get_stories(["status.name"])
+
+
 def test_health_check_for_self_host_jira():
     with Mocker(real_http=False, adapter=mock_jira_requests()):
         client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
@@ -197,7 +599,24 @@ def test_get_all_fields():
 
         result = client.get_all_fields()
 
-        assert len(result) == 5
+        assert len(result) == 6
+
+
+def test_is_array_field():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        assert client.is_array_field("labels") is True
+        assert client.is_array_field("customfield_15601") is False
+        assert client.is_array_field("unknown") is False
+        # The fields are only retrieved once.
+        assert [request.path for request in mocker.request_history].count(
+            "/rest/api/2/field"
+        ) == 1
 
 
 def test_get_projects():
@@ -217,6 +636,33 @@ def test_get_projects():
         assert "APPSEC" in [r.name for r in result]
 
 
+def test_prefetch_issue_types():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        def count_issue_type_requests() -> int:
+            return len(
+                [
+                    request
+                    for request in mocker.request_history
+                    if request.path.endswith("/issuetypes")
+                ]
+            )
+
+        assert len(client.get_projects()) == 3
+        assert count_issue_type_requests() == 0
+
+        client.prefetch_issue_types(["POC", "poc", "Unknown"])
+        assert count_issue_type_requests() == 1
+
+        assert len(client.get_issue_types("POC")) == 7
+        assert count_issue_type_requests() == 1
+
+
 def test_get_issue_types():
     with Mocker(
         real_http=False,
@@ -256,6 +702,28 @@ def test_get_fields_by_project_name_and_issue_name():
         assert len(not_required_fields) == 3
 
 
+def test_get_fields_by_project_id_and_issue_id_load_issue_types_once():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+        project = client.get_project_by_project_name("POC")
+        assert project is not None
+
+        # The issue type doesn't exist, so the fields are not found.
+        for _ in range(2):
+            assert client.get_fields_by_project_id_and_issue_id(
+                project.id_, 99999
+            ) == ([], [])
+        assert len(client.get_issue_types("POC")) == 7
+
+        assert [
+            request.path.endswith("/issuetypes") for request in mocker.request_history
+        ].count(True) == 1
+
+
 def test_get_fields_by_unknown_project_name_and_issue_name():
     with Mocker(
         real_http=False,
@@ -312,6 +780,171 @@ def test_get_fields_by_project_id_and_issue_name():
         assert len(not_required_fields) == 3
 
 
+def test_get_fields_from_metadata_cache(tmpdir):
+    def get_story_fields(client: JiraClient):
+        project = client.get_project_by_project_name("POC")
+        assert project is not None
+        issue_type = client.get_issue_type_by_project_name_and_issue_name(
+            project.name, "Story"
+        )
+        assert issue_type is not None
+        return client.get_fields_by_project_id_and_issue_id(
+            project.id_, issue_type.id_
+        )
+
+    def count_metadata_requests(mocker: Mocker, start: int = 0) -> int:
+        return len(
+            [
+                request
+                for request in mocker.request_history[start:]
+                if request.path.startswith("/rest/api/2/project")
+                or request.path.startswith("/rest/api/2/issue/createmeta")
+            ]
+        )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+        )
+        expected_required_fields, expected_not_required_fields = get_story_fields(
+            client
+        )
+        assert count_metadata_requests(mocker) > 0
+
+        start = len(mocker.request_history)
+        cached_client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL + "/", folder=tmpdir),
+        )
+        required_fields, not_required_fields = get_story_fields(cached_client)
+
+        assert count_metadata_requests(mocker, start) == 0
+        assert [(f.id_, f.allowed_values) for f in required_fields] == [
+            (f.id_, f.allowed_values) for f in expected_required_fields
+        ]
+        assert [(f.id_, f.allowed_values) for f in not_required_fields] == [
+            (f.id_, f.allowed_values) for f in expected_not_required_fields
+        ]
+
+        cached_client.clear_metadata_cache()
+        start = len(mocker.request_history)
+        get_story_fields(
+            JiraClient(
+                DEFAULT_JIRA_URL,
+                DEFAULT_JIRA_ACCESS_TOKEN,
+                metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+            )
+        )
+        assert count_metadata_requests(mocker, start) > 0
+
+
+def test_get_fields_save_metadata_cache_once(tmpdir, monkeypatch):
+    saved_files: List[str] = []
+    replace = jira_metadata_cache.replace
+
+    def replace_cache_file(src, dst):
+        saved_files.append(str(dst))
+        replace(src, dst)
+
+    # The cache file is replaced by the temporary file when it is saved.
+    monkeypatch.setattr(jira_metadata_cache, "replace", replace_cache_file)
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+        )
+        project = client.get_project_by_project_name("POC")
+        assert project is not None
+        issue_type = client.get_issue_type_by_project_name_and_issue_name(
+            project.name, "Story"
+        )
+        assert issue_type is not None
+        saved_files.clear()
+
+        client.get_fields_by_project_id_and_issue_id(project.id_, issue_type.id_)
+
+    # The fields of all issue types of the project are saved together.
+    assert len(saved_files) == 1
+    entries = loads(pathlib.Path(saved_files[0]).read_text("utf-8"))["entries"]
+    assert len(client.get_issue_types(project.name)) > 1
+    assert len([key for key in entries if key.startswith("fields/")]) == len(
+        client.get_issue_types(project.name)
+    )
+
+
+def test_get_project_not_in_metadata_cache(tmpdir):
+    cache = JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir)
+    # POC has been created after the project list was cached.
+    cache.set("projects", [{"id": 1, "name": "OLD"}])
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+        )
+
+        assert client.get_project_by_project_name("POC") is not None
+        assert client.get_project_by_project_name("Unknown") is None
+
+        # The project list is only refreshed once.
+        assert [request.path for request in mocker.request_history].count(
+            "/rest/api/2/project"
+        ) == 1
+
+
+def test_prefetch_issue_types_not_renew_cached_projects(tmpdir):
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+        )
+        client.get_projects()
+        cache_file = JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir).file
+        saved_at = loads(cache_file.read_text("utf-8"))["entries"]["projects"][
+            "saved_at"
+        ]
+
+        client.prefetch_issue_types(["POC"])
+
+        entries = loads(cache_file.read_text("utf-8"))["entries"]
+        assert entries["projects"]["saved_at"] == saved_at
+        cached_client = JiraClient(
+            DEFAULT_JIRA_URL,
+            DEFAULT_JIRA_ACCESS_TOKEN,
+            metadata_cache=JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir),
+        )
+        assert len(cached_client.get_issue_types("POC")) == 7
+
+
+def test_metadata_cache_expired(tmpdir):
+    cache = JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir, ttl=60)
+    cache.set("projects", [{"id": "1", "name": "A", "issue_types": None}])
+    assert JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir).get("projects")
+    assert (
+        JiraMetadataCache(DEFAULT_JIRA_CLOUD_URL, folder=tmpdir).get("projects")
+        is None
+    )
+    assert (
+        JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir, ttl=0).get("projects")
+        is None
+    )
+    assert (
+        JiraMetadataCache(DEFAULT_JIRA_URL, folder=tmpdir, ttl=1e-9).get("projects")
+        is None
+    )
+
+
 def test_convert_fields_to_create_issue_body():
     issue_fields = {
         "customfield_11204.value": ["BAU, Mobile"],
@@ -416,6 +1049,63 @@ def test_get_field_paths_of_jira_field_use_array_type_no_hierarchy():
     assert "abc.comments.created" in [item["path"] for item in actual_field_paths]
 
 
+def test_get_field_paths_of_jira_field_use_resolved_paths():
+    actual_field_paths = get_field_paths_of_jira_field("author", "abc")
+    assert actual_field_paths is not None
+    actual_field_paths[0]["path"] = "changed"
+
+    # The same field type with another property name reuses the resolved
+    # paths, which are not affected by the returned ones.
+    assert get_field_paths_of_jira_field("author", "def") == [
+        {"path": "def.name", "is_array": False},
+        {"path": "def.emailAddress", "is_array": False},
+    ]
+    assert get_field_paths_of_jira_field("author", "abc") == [
+        {"path": "abc.name", "is_array": False},
+        {"path": "abc.emailAddress", "is_array": False},
+    ]
+
+
+def test_get_jira_field_use_multiple_jira_field_type_files(tmpdir):
+    jira_field_type_file = pathlib.Path(tmpdir / "jira_field_type.json")
+    jira_field_type_file.write_text(
+        dumps(
+            [
+                {"type": "string", "isBasic": True},
+                {"type": "person", "properties": [{"name": "id", "type": "string"}]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    # The types of one file don't shadow or leak into the others.
+    assert get_jira_field("person", jira_field_type_file) is not None
+    assert get_jira_field("person") is None
+    assert get_jira_field("status", jira_field_type_file) is None
+    assert get_jira_field("status") is not None
+    assert get_field_paths_of_jira_field("person", "abc", jira_field_type_file) == [
+        {"path": "abc.id", "is_array": False}
+    ]
+
+    jira_field_type_file.write_text(
+        dumps(
+            [
+                {"type": "string", "isBasic": True},
+                {"type": "person", "properties": [{"name": "key", "type": "string"}]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    # The file is parsed once until it is reloaded.
+    assert get_field_paths_of_jira_field("person", "abc", jira_field_type_file) == [
+        {"path": "abc.id", "is_array": False}
+    ]
+    reload_jira_field_types(jira_field_type_file)
+    assert get_field_paths_of_jira_field("person", "abc", jira_field_type_file) == [
+        {"path": "abc.key", "is_array": False}
+    ]
+
+
 def test_create_story_failed(capsys):
     with Mocker(
         real_http=False,
@@ -436,3 +1126,106 @@ def test_create_story_failed(capsys):
         assert result is None
         output = capsys.readouterr()
         assert "issuetype: issue type is required" in output.out
+
+
+def test_create_stories():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        results = client.create_stories(
+            [
+                {
+                    "project.id": 10100,
+                    "summary": f"Item {i}" if i != 60 else "",
+                    "issuetype.name": "Story",
+                }
+                for i in range(70)
+            ]
+        )
+
+        # Two batches: 50 + 20 stories.
+        assert [request.path for request in mocker.request_history].count(
+            "/rest/api/2/issue/bulk"
+        ) == 2
+        assert len(results) == 70
+        assert results[0]["issue"] is not None
+        assert results[0]["issue"].key == "SD-123"
+        assert results[59]["issue"] is not None
+        assert results[60]["issue"] is None
+        assert results[60]["error"] == "summary: You must specify a summary."
+        assert results[61]["issue"] is not None
+        assert results[61]["issue"].key == "SD-134"
+
+
+def test_create_stories_bulk_create_failed_not_resend():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_bulk_create_error(
+            500, {"errorMessages": ["Internal error"], "errors": {}}
+        ),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        results = client.create_stories(
+            [
+                {"project.id": 10100, "summary": f"Item {i}", "issuetype.name": "Story"}
+                for i in range(60)
+            ]
+        )
+
+        paths = [request.path for request in mocker.request_history]
+        # The stories may have been created, so they are not created again.
+        assert paths.count("/rest/api/2/issue/bulk") == 2
+        assert paths.count("/rest/api/2/issue") == 0
+        assert len(results) == 60
+        assert all(result["issue"] is None and result["error"] for result in results)
+
+
+def test_create_stories_bulk_create_response_without_errors():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_bulk_create_error(
+            400, {"errorMessages": ["Bad request"]}
+        ),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        results = client.create_stories(
+            [{"project.id": 10100, "summary": "Item", "issuetype.name": "Story"}]
+        )
+
+        paths = [request.path for request in mocker.request_history]
+        assert paths.count("/rest/api/2/issue") == 0
+        assert len(results) == 1
+        assert results[0]["issue"] is None
+        assert "Unexpected response." in str(results[0]["error"])
+
+
+def test_create_stories_without_bulk_create(capsys):
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_without_bulk_create(),
+    ) as mocker:
+        client = JiraClient(DEFAULT_JIRA_URL, DEFAULT_JIRA_ACCESS_TOKEN)
+
+        results = client.create_stories(
+            [
+                {"project.id": 10100, "summary": f"Item {i}", "issuetype.name": "Story"}
+                for i in range(60)
+            ]
+        )
+
+        paths = [request.path for request in mocker.request_history]
+        # The bulk create API is only tried once.
+        assert paths.count("/rest/api/2/issue/bulk") == 1
+        assert paths.count("/rest/api/2/issue") == 60
+        assert len(results) == 60
+        assert all(result["issue"] is not None for result in results)
+        assert "Calling bulk create API failed" in capsys.readouterr().out
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List, Optional
+
+import pytest
+from jira import JIRAError
+from requests import Response
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from jira_assistant import jira_transport
+from jira_assistant.jira_transport import (
+    AdaptiveRateLimiter,
+    RetryingRequest,
+    TokenBucket,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.delays: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.delays.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch) -> _FakeClock:
+    clock = _FakeClock()
+    monkeypatch.setattr(jira_transport, "monotonic", clock.monotonic)
+    monkeypatch.setattr(jira_transport, "sleep", clock.sleep)
+    return clock
+
+
+def _create_response(
+    status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def test_token_bucket(clock: _FakeClock):
+    bucket = TokenBucket(2)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.delays == [0.5, 0.5]
+
+    bucket.pause(3)
+    bucket.acquire()
+    assert clock.delays[-1] == 3
+
+    with pytest.raises(ValueError):
+        bucket.rate = 0
+
+
+def test_adaptive_rate_limiter_without_limit(clock: _FakeClock):
+    rate_limiter = AdaptiveRateLimiter(None)
+    rate_limiter.acquire()
+    assert rate_limiter.rate is None
+
+    rate_limiter.on_throttled(_create_response(429), 1)
+    assert rate_limiter.rate == 10
+    rate_limiter.acquire()
+    assert clock.delays == [1]
+
+    rate_limiter.on_throttled(_create_response(429), 0)
+    assert rate_limiter.rate == 5
+
+    # The rate increases after about one second of successes.
+    for _ in range(5):
+        rate_limiter.on_succeeded(_create_response())
+    assert rate_limiter.rate == 6
+
+
+def test_adaptive_rate_limiter_follows_rate_limit_headers():
+    rate_limiter = AdaptiveRateLimiter(4)
+
+    rate_limiter.on_succeeded(
+        _create_response(
+            headers={
+                "X-RateLimit-FillRate": "30",
+                "X-RateLimit-Interval-Seconds": "10",
+            }
+        )
+    )
+    assert rate_limiter.rate == 3
+
+    # Never beyond the configured rate.
+    rate_limiter.on_throttled(
+        _create_response(
+            429,
+            headers={
+                "X-RateLimit-FillRate": "100",
+                "X-RateLimit-Interval-Seconds": "1",
+            },
+        ),
+        0,
+    )
+    assert rate_limiter.rate == 4
+
+    rate_limiter.on_throttled(_create_response(429), 0)
+    assert rate_limiter.rate == 2
+
+
+def test_retrying_request_respects_retry_after_date(clock: _FakeClock):
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+    responses = [
+        _create_response(503, {"Retry-After": format_datetime(retry_at, True)}),
+        _create_response(),
+    ]
+
+    def request(_: str, url: str) -> Response:
+        response = responses.pop(0)
+        if not response.ok:
+            raise JIRAError(
+                status_code=response.status_code, url=url, response=response
+            )
+        return response
+
+    retrying_request = RetryingRequest(request, AdaptiveRateLimiter(None), 3, 1, 60)
+
+    assert retrying_request("GET", "http://localhost").ok
+    assert len(clock.delays) == 1
+    assert 8 <= clock.delays[0] <= 10
+    assert retrying_request.counters == {"requests": 2, "throttled": 0, "retried": 1}
+
+
+def test_retrying_request_does_not_resend_non_idempotent_request(clock: _FakeClock):
+    def request(method: str, url: str) -> Response:
+        raise RequestsConnectionError(f"{method} {url}")
+
+    retrying_request = RetryingRequest(request, AdaptiveRateLimiter(None), 3, 1, 60)
+
+    with pytest.raises(RequestsConnectionError):
+        retrying_request("POST", "http://localhost/rest/api/2/issue/bulk")
+    assert retrying_request.counters["requests"] == 1
+
+    with pytest.raises(RequestsConnectionError):
+        retrying_request("GET", "http://localhost/rest/api/2/search")
+    assert retrying_request.counters["requests"] == 5
+    assert len(clock.delays) == 3
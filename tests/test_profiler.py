@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+from json import loads
+
+import pytest
+
+from jira_assistant.profiler import Profiler, get_request_endpoint
+
+
+def test_get_request_endpoint():
+    assert (
+        get_request_endpoint("http://localhost/rest/api/2/issue/A-1?fields=status")
+        == "/rest/api/2/issue/{id}"
+    )
+    assert (
+        get_request_endpoint("http://localhost/rest/api/2/issue/createmeta/10001")
+        == "/rest/api/2/issue/createmeta/{id}"
+    )
+    assert get_request_endpoint("http://localhost/rest/api/2/field") == (
+        "/rest/api/2/field"
+    )
+
+
+def test_profiler_section():
+    profiler = Profiler()
+
+    with profiler.section("step", "RetrieveJiraInformation"):
+        pass
+    with pytest.raises(ValueError):
+        with profiler.section("strategy", "SortOrder"):
+            raise ValueError()
+
+    sections = profiler.sections
+    assert [(section["category"], section["name"]) for section in sections] == [
+        ("step", "RetrieveJiraInformation"),
+        ("strategy", "SortOrder"),
+    ]
+    assert all(section["duration"] >= 0 for section in sections)
+
+
+def test_profiler_format_summary():
+    profiler = Profiler()
+    with profiler.section("step", "CreateJiraStory"):
+        profiler.record_request(
+            "post", "http://localhost/rest/api/2/issue/bulk", 0, 0.2, 100, 20, "201"
+        )
+    profiler.record_request(
+        "get", "http://localhost/rest/api/2/issue/A-1", 0.3, 0.1, 0, 1024, "200"
+    )
+    profiler.record_request(
+        "get", "http://localhost/rest/api/2/issue/A-2", 0.4, 0.3, 0, 0, "404"
+    )
+    profiler.record_request(
+        "get",
+        "http://localhost/rest/api/2/issue/A-3",
+        0.5,
+        0.2,
+        0,
+        0,
+        "ConnectionError",
+    )
+
+    lines = profiler.format_summary().splitlines()
+
+    assert lines[2].split() == ["step", "CreateJiraStory", lines[2].split()[-1]]
+    # The slowest endpoint comes first.
+    assert lines[6].split() == [
+        "GET",
+        "/rest/api/2/issue/{id}",
+        "3",
+        "2",
+        "600.0",
+        "200.0",
+        "300.0",
+        "0.0",
+        "1.0",
+    ]
+    assert lines[7].split()[:4] == ["POST", "/rest/api/2/issue/bulk", "1", "0"]
+
+
+def test_profiler_save_trace(tmpdir):
+    profiler = Profiler()
+    with profiler.section("strategy", "InlineWeights"):
+        profiler.record_request(
+            "GET", "http://localhost/rest/api/2/search", 0.001, 0.5, 0, 10, "200"
+        )
+    trace_file = tmpdir / "trace.json"
+
+    profiler.save_trace(trace_file)
+
+    events = loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+    assert [(event["cat"], event["name"]) for event in events] == [
+        ("strategy", "InlineWeights"),
+        ("request", "GET /rest/api/2/search"),
+    ]
+    assert events[1]["ts"] == 1000
+    assert events[1]["dur"] == 500000
+    assert events[1]["args"] == {
+        "request_size": 0,
+        "response_size": 10,
+        "outcome": "200",
+    }
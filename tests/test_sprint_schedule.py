@@ -55,3 +55,26 @@ def test_load_sprint_schedule_invalid_json():
 Hint: Expecting property name enclosed in double quotes in line 4:9."""
         in err.value.args[0]
     )
+
+
+def test_get_priority_first_match():
+    store = SprintScheduleStore()
+    store.load(
+        """[
+            {"Priority": 5, "Sprints": ["R140A", "Straße"]},
+            {"Priority": 3, "Sprints": ["R140", "m126"]}
+        ]"""
+    )
+
+    # The first sprint which contains the input wins.
+    assert store.get_priority("R140") == 5
+    assert store.get_priority("r140") == 5
+    assert store.get_priority("140") == 5
+    assert store.get_priority("M126") == 3
+    assert store.get_priority("126") == 3
+    assert store.get_priority("STRASSE") == 5
+    assert store.get_priority("A\0R") == 0
+    assert store.get_priority("R141") == 0
+
+    store.load("""[{"Priority": 1, "Sprints": ["R141"]}]""")
+    assert store.get_priority("R141") == 1
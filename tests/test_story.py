@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
+import random
+from copy import deepcopy
 from decimal import Decimal
+from functools import cmp_to_key
+from operator import attrgetter, itemgetter
 
 from pytest import raises
 from jira_assistant.excel_definition import SortStrategy
+from jira_assistant.priority import Priority
 
 from jira_assistant.story import (
     compare_story_based_on_inline_weights,
     convert_to_bool,
     convert_to_datetime,
     convert_to_decimal,
+    sort_stories_by_inline_weights,
     sort_stories_by_property_and_order,
     sort_stories_by_raise_ranking,
 )
@@ -50,12 +56,63 @@ def test_compare_story_property():
     assert s_8["productValue"] < s_9["productValue"]
 
 
+def test_sort_stories_by_inline_weights_same_as_comparator():
+    _, factory = mock_story_data()
+    rand = random.Random(0)
+    priorities = list(Priority)
+    properties = [
+        "regulatory",
+        "partnerPriority",
+        "productValue",
+        "marketingUrgency",
+        "revenue",
+    ]
+
+    for _ in range(200):
+        stories = []
+        for index in range(rand.randint(0, 30)):
+            story = factory.create_story()
+            story["name"] = f"s{index}"
+            for property_name in properties:
+                # Use a small subset to make sure there are many ties.
+                story[property_name] = rand.choice(priorities[:3])
+            stories.append(story)
+
+        expected = sorted(
+            stories,
+            key=cmp_to_key(compare_story_based_on_inline_weights),
+            reverse=True,
+        )
+        actual = sort_stories_by_inline_weights(stories)
+        assert [story["name"] for story in actual] == [
+            story["name"] for story in expected
+        ]
+
+
 def test_str():
     data, _ = mock_story_data()
 
     assert "s1, N/A" in str(data[0])
 
 
+def test_story_slots():
+    data, _ = mock_story_data()
+    story = data[0]
+
+    assert not hasattr(story, "__dict__")
+    assert story["name"] == "s1"
+    assert attrgetter("name")(story) == "s1"
+    assert story.format_value("not exist") == ""
+    assert not hasattr(story, "notexist")
+    with raises(AttributeError):
+        _ = story["not exist"]
+
+    story["New Column"] = "value"
+    assert story["newcolumn"] == "value"
+    assert story.newcolumn == "value"
+    assert not hasattr(data[1], "newcolumn")
+
+
 def test_lt_le_gt_ge_eq():
     data, _ = mock_story_data()
     s_1 = data[0]
@@ -113,6 +170,49 @@ def test_sort_stories_by_property_and_order_consider_parent_index():
     assert stories[1]["name"] == "s2"
 
 
+def test_sort_stories_by_property_and_order_consider_parent_index_groups():
+    _, factory = mock_story_data()
+    columns = deepcopy(factory.columns)
+    # Mixed sort directions: regulatory descending, revenue ascending.
+    for column in columns:
+        column["scope_require_sort"] = column["name"] in ("regulatory", "revenue")
+        column["scope_sort_order"] = column["name"] == "regulatory"
+
+    rand = random.Random(0)
+    stories = []
+    for index in range(40):
+        story = factory.create_story()
+        story["name"] = f"s{index}"
+        story["partnerPriority"] = [Priority.LOW, Priority.HIGH][index // 10 % 2]
+        story["regulatory"] = rand.choice([Priority.LOW, Priority.HIGH])
+        story["revenue"] = rand.choice([Priority.LOW, Priority.HIGH])
+        stories.append(story)
+
+    expected = list(stories)
+    # Sort each group which is followed by a different parent, one rule a time.
+    for begin in range(0, 30, 10):
+        for property_name, sort_order in (("revenue", False), ("regulatory", True)):
+            expected[begin: begin + 10] = sorted(
+                expected[begin: begin + 10],
+                key=itemgetter(property_name),
+                reverse=sort_order,
+            )
+
+    sort_stories_by_property_and_order(
+        stories,
+        columns,
+        SortStrategy("SortOrder", True, 1, {"ParentScopeIndexRange": "2"}),
+    )
+
+    assert [story["name"] for story in stories] == [
+        story["name"] for story in expected
+    ]
+    # The stories after the last change of the parent are kept as they are.
+    assert [story["name"] for story in stories[30:]] == [
+        f"s{index}" for index in range(30, 40)
+    ]
+
+
 def test_sort_stories_by_raise_ranking():
     stories, factory = mock_story_data_for_raise_ranking()
 